@@ -0,0 +1,339 @@
+import argparse
+import contextlib
+import getpass
+import importlib.util
+import io
+import json
+import marshal
+import os
+import socket
+import stat
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from common import uasset_json
+
+SOCKET_NAME = "encounters_overhaul_assets.sock"
+SOCKET_ENV = "ENCOUNTERS_ASSET_DAEMON"
+DISABLE_ENV = "ENCOUNTERS_NO_DAEMON"
+
+# A daemon that is wedged or gone quiet must not hang the tools: after these
+# many seconds they give up and run in-process. Outputs are skip-if-unchanged
+# atomic writes, so re-running a request the daemon was still busy with is safe.
+CONNECT_TIMEOUT = 2.0
+REPLY_TIMEOUT = 300.0
+REPLY_TIMEOUT_ENV = "ENCOUNTERS_DAEMON_TIMEOUT"
+
+# Tool name -> script (relative to src/) whose main(argv) the daemon runs.
+TOOLS = {
+    "scale_enemies": "enemies/scale_enemies.py",
+    "list_alpha_bosses": "enemies/list_alpha_bosses.py",
+    "find_duplicate_enemies": "tower/find_duplicate_enemies.py",
+    "simple_mute": "strings/simple_mute.py",
+}
+
+
+def default_socket_path() -> Path:
+    """In $XDG_RUNTIME_DIR, or else in a private per-user folder under the temp dir."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return Path(tempfile.gettempdir()) / f"encounters_overhaul-{user}" / SOCKET_NAME
+
+
+def socket_path() -> Path:
+    override = os.environ.get(SOCKET_ENV)
+    return Path(override) if override else default_socket_path()
+
+
+def reply_timeout() -> float:
+    try:
+        return float(os.environ.get(REPLY_TIMEOUT_ENV, REPLY_TIMEOUT))
+    except ValueError:
+        return REPLY_TIMEOUT
+
+
+def is_own_socket(path: Path) -> bool:
+    """Only a socket created by this user is trusted to run tools and return their output."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+class DocumentCache:
+    """Parsed JSON documents keyed by path, invalidated by mtime and size.
+
+    Each entry keeps the parsed object for read-only callers and a marshal
+    snapshot from which mutable copies are rebuilt much faster than by
+    re-parsing the JSON text.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int], dict, bytes]] = {}
+
+    def load(self, path: Path, shared: bool = False) -> dict:
+        resolved = path.resolve()
+        stat = resolved.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(resolved)
+        if entry is None or entry[0] != signature:
+            if uasset_json.is_intermediate(resolved):
+                data = dict(uasset_json.read_intermediate(resolved))
+            else:
+                with resolved.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+            entry = (signature, data, marshal.dumps(data))
+            self._entries[resolved] = entry
+
+        if shared:
+            return entry[1]
+        return marshal.loads(entry[2])
+
+    def paths(self) -> list[Path]:
+        return sorted(self._entries)
+
+
+class ToolRegistry:
+    """Imports each tool script once and re-imports it when the file changes."""
+
+    def __init__(self) -> None:
+        self._modules: dict[str, tuple[int, object]] = {}
+
+    def get(self, tool: str):
+        script = SRC_DIR / TOOLS[tool]
+        mtime = script.stat().st_mtime_ns
+
+        cached = self._modules.get(tool)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # Tools import their siblings (e.g. enemy_classification) as top-level modules.
+        if str(script.parent) not in sys.path:
+            sys.path.insert(0, str(script.parent))
+        spec = importlib.util.spec_from_file_location(f"daemon_tool_{tool}", script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self._modules[tool] = (mtime, module)
+        return module
+
+
+def run_tool(registry: ToolRegistry, request: dict) -> dict:
+    tool = request.get("tool")
+    if tool not in TOOLS:
+        return {"exit_code": 2, "stdout": "", "stderr": f"Unknown tool: {tool}\n"}
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    previous_cwd = os.getcwd()
+    exit_code = 0
+    try:
+        os.chdir(request.get("cwd") or previous_cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                result = registry.get(tool).main(list(request.get("argv") or []))
+                exit_code = result if isinstance(result, int) else 0
+            except SystemExit as exc:
+                exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+                if exc.code is not None and not isinstance(exc.code, int):
+                    print(exc.code, file=sys.stderr)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(previous_cwd)
+
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def read_message(conn: socket.socket) -> dict:
+    buffer = bytearray()
+    while not buffer.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+    return json.loads(buffer.decode("utf-8"))
+
+
+def send_message(conn: socket.socket, message: dict) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def serve(path: Path, preload: list[Path]) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix domain sockets are not available on this platform.")
+        return 2
+
+    if path.exists():
+        if request_daemon({"command": "status"}, path) is not None:
+            print(f"A daemon is already listening on {path}")
+            return 1
+        if not is_own_socket(path):
+            print(f"{path} exists and is not a socket owned by this user; refusing to replace it")
+            return 1
+        path.unlink()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if path.parent.stat().st_uid != os.getuid():
+        print(f"{path.parent} is owned by another user; refusing to listen there")
+        return 1
+
+    cache = DocumentCache()
+    registry = ToolRegistry()
+    uasset_json.set_document_cache(cache)
+    # Tools running inside the daemon must never forward to it.
+    os.environ[DISABLE_ENV] = "1"
+
+    for doc_path in preload:
+        start = time.perf_counter()
+        cache.load(doc_path)
+        print(f"Preloaded {doc_path} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    os.chmod(path, 0o600)
+    server.listen()
+    print(f"Asset daemon listening on {path}")
+    print("Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # A client that connects and never sends must not block the others.
+                conn.settimeout(CONNECT_TIMEOUT)
+                try:
+                    request = read_message(conn)
+                except (OSError, ValueError):
+                    continue
+                conn.settimeout(None)
+
+                command = request.get("command", "run")
+                if command == "status":
+                    send_message(conn, {"pid": os.getpid(), "documents": [str(p) for p in cache.paths()]})
+                    continue
+                if command == "shutdown":
+                    send_message(conn, {"stopped": True})
+                    break
+
+                start = time.perf_counter()
+                response = run_tool(registry, request)
+                try:
+                    send_message(conn, response)
+                except OSError:
+                    # The client gave up waiting and ran the tool itself.
+                    pass
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"{request.get('tool')} {request.get('argv')} -> {response['exit_code']} ({elapsed_ms:.0f} ms)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if path.exists():
+            path.unlink()
+        print("Asset daemon stopped.")
+    return 0
+
+
+def request_daemon(message: dict, path: Path | None = None) -> dict | None:
+    """Send one request to the daemon. Returns None when no daemon is reachable."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = path or socket_path()
+    if not is_own_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(CONNECT_TIMEOUT)
+            conn.connect(str(path))
+            send_message(conn, message)
+            conn.settimeout(reply_timeout())
+            return read_message(conn)
+    except (OSError, ValueError):
+        # Includes socket timeouts: a daemon that does not answer counts as no daemon.
+        return None
+
+
+def run_in_daemon(tool: str, argv: list[str] | None) -> int | None:
+    """Forward a tool invocation to a running daemon.
+
+    Returns the tool's exit code, or None when the caller should run the tool
+    in-process (no daemon, ENCOUNTERS_NO_DAEMON set, or already inside it).
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+
+    response = request_daemon(
+        {
+            "command": "run",
+            "tool": tool,
+            "argv": sys.argv[1:] if argv is None else list(argv),
+            "cwd": os.getcwd(),
+        }
+    )
+    if response is None or "exit_code" not in response:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response["exit_code"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Keep parsed asset tables in memory and run the enemy/tower/strings tools "
+            "over a Unix domain socket. The tools fall back to running in-process "
+            "when no daemon is listening."
+        )
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help=f"Socket path (default: ${SOCKET_ENV} or {default_socket_path()})",
+    )
+    parser.add_argument(
+        "--preload",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="JSON documents to parse at startup (e.g. DT_jRPG_Enemies, DT_jRPG_Levels, string tables).",
+    )
+    parser.add_argument("--status", action="store_true", help="Show the running daemon and its cached documents.")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    path = args.socket or socket_path()
+
+    if args.status or args.stop:
+        response = request_daemon({"command": "shutdown" if args.stop else "status"}, path)
+        if response is None:
+            print(f"No daemon listening on {path}")
+            return 1
+        if args.stop:
+            print("Daemon stopped.")
+            return 0
+        print(f"Daemon pid {response['pid']} on {path}")
+        for doc in response["documents"]:
+            print(f"  {doc}")
+        return 0
+
+    return serve(path, args.preload)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
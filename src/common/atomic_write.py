@@ -0,0 +1,76 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from common.uasset_json import dump_document, encode_intermediate, json_default
+
+
+def encode_text(text: str, encoding: str = "utf-8", newline: str | None = None) -> bytes:
+    """The bytes open(path, "w", encoding=encoding, newline=newline) would write for text."""
+    if newline is None:
+        newline = os.linesep
+    if newline not in ("", "\n"):
+        text = text.replace("\n", newline)
+    return text.encode(encoding)
+
+
+def file_digest(path: Path | str) -> bytes:
+    """blake2b digest of a file's content."""
+    with Path(path).open("rb") as f:
+        return hashlib.file_digest(f, "blake2b").digest()
+
+
+def write_bytes(path: Path | str, content: bytes) -> bool:
+    """Replace path with content unless it already holds exactly that content.
+
+    The existing file is compared by size, then by blake2b digest, so an
+    unchanged output keeps its mtime and downstream steps see no change. A
+    changed output is written to a temporary file next to it and renamed over
+    it, so readers never see a half-written file. Returns True when written.
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(content) and file_digest(path) == hashlib.blake2b(content).digest():
+            return False
+        existing = True
+    except FileNotFoundError:
+        existing = False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(content)
+        if existing:
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_text(path: Path | str, text: str, encoding: str = "utf-8", newline: str | None = None) -> bool:
+    return write_bytes(path, encode_text(text, encoding, newline))
+
+
+def write_json(path: Path | str, data, end: str = "", newline: str | None = None, **kwargs) -> bool:
+    """Like json.dump(data, f, **kwargs) into path.open("w", newline=newline), plus end."""
+    return write_text(path, json.dumps(data, default=json_default, **kwargs) + end, newline=newline)
+
+
+def write_document(path: Path | str, data: dict, end: str = "", newline: str | None = None, **kwargs) -> bool:
+    """Like dump_document(data, f, **kwargs) into path.open("w", newline=newline), plus end."""
+    buffer = io.StringIO()
+    dump_document(data, buffer, **kwargs)
+    buffer.write(end)
+    return write_text(path, buffer.getvalue(), newline=newline)
+
+
+def write_intermediate(path: Path | str, data: dict) -> bool:
+    """Write data in the compact intermediate format (see uasset_json.encode_intermediate)."""
+    return write_bytes(path, encode_intermediate(data))
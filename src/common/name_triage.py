@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+from common.uasset_json import is_intermediate
+
+# The NameMap is read in chunks of this size; most fit in the first one.
+CHUNK_SIZE = 1 << 16
+
+# UAssetAPI writes "NameMap" as the third top-level member, a few hundred
+# bytes in. Past this point the file is not laid out that way.
+NAME_MAP_SEARCH_LIMIT = 1 << 16
+
+NAME_MAP_KEY = '"NameMap"'
+
+# UAssetAPI export types are not names themselves; a package with such an
+# export lists the class name it imports instead.
+EXPORT_TYPE_NAMES = {
+    "StringTableExport": "StringTable",
+    "DataTableExport": "DataTable",
+}
+
+_decoder = json.JSONDecoder()
+
+
+def read_name_map(path: Path | str) -> list[str] | None:
+    """The document's NameMap, read up to its closing bracket and no further.
+
+    Returns None when the file has no NameMap near its start (intermediate
+    files, other JSON layouts, unreadable files); callers must then assume
+    any name may be present.
+    """
+    path = Path(path)
+    try:
+        if is_intermediate(path):
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            buffer = ""
+            key = -1
+            while key == -1:
+                if len(buffer) >= NAME_MAP_SEARCH_LIMIT or not (chunk := f.read(CHUNK_SIZE)):
+                    return None
+                start = max(len(buffer) - len(NAME_MAP_KEY), 0)
+                buffer += chunk
+                key = buffer.find(NAME_MAP_KEY, start)
+
+            pos = key + len(NAME_MAP_KEY)
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n:":
+                    pos += 1
+                if pos < len(buffer):
+                    break
+                if not (chunk := f.read(CHUNK_SIZE)):
+                    return None
+                buffer += chunk
+            if buffer[pos] != "[":
+                return None
+
+            while True:
+                try:
+                    name_map, _ = _decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        return None
+                    # Nothing new to decode until the chunk can close the array.
+                    while "]" not in chunk:
+                        buffer += chunk
+                        chunk = f.read(CHUNK_SIZE)
+                        if not chunk:
+                            return None
+                    buffer += chunk
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(name_map, list) or not all(isinstance(name, str) for name in name_map):
+        return None
+    return name_map
+
+
+def may_contain(path: Path | str, *names: str) -> bool:
+    """False only when the NameMap proves the file uses none of the names.
+
+    Works for names a package has to list: struct types (S_jRPG_Enemy),
+    classes and export types (StringTable, StringTableExport), import paths
+    and object names. Cooked assets save unversioned properties, whose names
+    (RespawnsOnRest, HP_2_...) are not in the NameMap, so property names can
+    never be ruled out this way.
+    """
+    name_map = read_name_map(path)
+    if name_map is None:
+        return True
+    listed = set(name_map)
+    return any(EXPORT_TYPE_NAMES.get(name, name) in listed for name in names)
+
+
+def may_contain_prefix(path: Path | str, prefix: str) -> bool:
+    """Like may_contain, for any name starting with prefix (e.g. Default__)."""
+    name_map = read_name_map(path)
+    if name_map is None:
+        return True
+    return any(name.startswith(prefix) for name in name_map)
@@ -0,0 +1,285 @@
+import difflib
+import re
+
+from common.uasset_json import CompactRecord
+
+INT_TYPE = "UAssetAPI.PropertyTypes.Objects.IntPropertyData, UAssetAPI"
+DOUBLE_TYPE = "UAssetAPI.PropertyTypes.Objects.DoublePropertyData, UAssetAPI"
+BOOL_TYPE = "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI"
+NAME_TYPE = "UAssetAPI.PropertyTypes.Objects.NamePropertyData, UAssetAPI"
+OBJECT_TYPE = "UAssetAPI.PropertyTypes.Objects.ObjectPropertyData, UAssetAPI"
+SOFTOBJ_TYPE = "UAssetAPI.PropertyTypes.Objects.SoftObjectPropertyData, UAssetAPI"
+STRUCT_TYPE = "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI"
+
+# Blueprint struct members are saved as <Member>_<index>_<32-hex GUID>.
+MEMBER_NAME_RE = re.compile(r"^(.+?)_\d+_[0-9A-F]{32}$")
+
+PROPERTY_CLASSES = (dict, CompactRecord)
+
+# How close (difflib ratio) an unknown member name must be to a missing
+# member to be reported as a likely rename.
+NEAR_MISS_CUTOFF = 0.6
+
+_UNRESOLVED = object()
+
+_member_keys: dict[str, str] = {}
+
+
+def member_key(property_name: str) -> str:
+    """The member name without its index and GUID suffix (HP_2_9B8F... -> HP)."""
+    key = _member_keys.get(property_name)
+    if key is None:
+        match = MEMBER_NAME_RE.match(property_name)
+        key = match.group(1) if match else property_name.partition("_")[0]
+        _member_keys[property_name] = key
+    return key
+
+
+class NameResolver:
+    """Property name -> model member table for one document.
+
+    Each distinct property name is resolved once (suffix stripped, matched
+    against the model's members) and cached per model, so decoding a row
+    costs one dict lookup per property. Cooked tables use unversioned
+    properties, whose names are not in the NameMap, so names are resolved as
+    rows are decoded rather than up front.
+
+    problems() lists declared members that no row had, with the unknown
+    member names closest to each one, and members found with another
+    property type: the usual signs of a game patch renaming a property.
+    """
+
+    def __init__(self) -> None:
+        self._tables: dict[type, dict[str, tuple[int, str] | None]] = {}
+        self._mistyped: dict[type, dict[str, str]] = {}
+
+    def table(self, model: type) -> dict[str, tuple[int, str] | None]:
+        table = self._tables.get(model)
+        if table is None:
+            table = self._tables[model] = {}
+        return table
+
+    def resolve(self, model: type, property_name: str) -> tuple[int, str] | None:
+        member = model._members.get(member_key(property_name))
+        self._tables[model][property_name] = member
+        return member
+
+    def mistyped(self, model: type, property_name: str, prop_type) -> None:
+        self._mistyped.setdefault(model, {})[member_key(property_name)] = str(prop_type)
+
+    def problems(self) -> list[str]:
+        problems = []
+        for model, table in self._tables.items():
+            found = {member_key(name) for name, member in table.items() if member is not None}
+            unknown = sorted({member_key(name) for name, member in table.items() if member is None})
+            mistyped = self._mistyped.get(model, {})
+            for key, (_, prop_type) in model._members.items():
+                if key in mistyped:
+                    problems.append(
+                        f"{model.struct_type}.{key} is {short_type(mistyped[key])}, expected {short_type(prop_type)}"
+                    )
+                elif key not in found:
+                    close = difflib.get_close_matches(key, unknown, n=3, cutoff=NEAR_MISS_CUTOFF)
+                    hint = f" (near miss: {', '.join(close)})" if close else ""
+                    problems.append(f"{model.struct_type} rows have no {key} member{hint}")
+        return problems
+
+
+def short_type(prop_type: str) -> str:
+    """UAssetAPI.PropertyTypes.Objects.IntPropertyData, UAssetAPI -> IntProperty"""
+    return prop_type.split(",")[0].rsplit(".", 1)[-1].removesuffix("Data")
+
+
+def report_names(resolver: NameResolver, source) -> None:
+    for problem in resolver.problems():
+        print(f"WARNING: {source}: {problem}")
+
+
+# Used when a caller does not track names per document.
+_shared_resolver = NameResolver()
+
+
+class RowModel:
+    """Base class for the generated struct models below.
+
+    decode() reads a struct's Value list once and stores each declared
+    member's value in a slot; members the struct lacks (or has with another
+    property type) are None, and the first match wins. The property dicts
+    the values came from are kept in `props`, so set() can write a new value
+    back into the document.
+    """
+
+    __slots__ = ("row", "props")
+    struct_type = ""
+    fields: tuple[str, ...] = ()
+    _index: dict[str, int] = {}
+    _members: dict[str, tuple[int, str]] = {}
+    _nested: dict[str, tuple[int, type]] = {}
+
+    @classmethod
+    def decode(cls, row, resolver: NameResolver | None = None):
+        """Decode a StructPropertyData of this model's struct type, or return None."""
+        if not (
+            isinstance(row, PROPERTY_CLASSES)
+            and row.get("$type") == STRUCT_TYPE
+            and row.get("StructType") == cls.struct_type
+        ):
+            return None
+        values = row.get("Value")
+        if not isinstance(values, list):
+            return None
+
+        if resolver is None:
+            resolver = _shared_resolver
+        names = resolver.table(cls)
+        props = [None] * len(cls.fields)
+        decoded = [None] * len(cls.fields)
+        nested = cls._nested
+        for prop in values:
+            if not isinstance(prop, PROPERTY_CLASSES):
+                continue
+            prop_type = prop.get("$type")
+            if prop_type == STRUCT_TYPE and prop.get("StructType") in nested:
+                index, model = nested[prop["StructType"]]
+                if props[index] is None and (value := model.decode(prop, resolver)) is not None:
+                    props[index] = prop
+                    decoded[index] = value
+                continue
+            name = prop.get("Name")
+            if not isinstance(name, str):
+                continue
+            member = names.get(name, _UNRESOLVED)
+            if member is _UNRESOLVED:
+                member = resolver.resolve(cls, name)
+            if member is None or props[member[0]] is not None:
+                continue
+            if member[1] != prop_type:
+                resolver.mistyped(cls, name, prop_type)
+                continue
+            props[member[0]] = prop
+            decoded[member[0]] = prop.get("Value")
+
+        model = cls.__new__(cls)
+        model.row = row
+        model.props = tuple(props)
+        for field, value in zip(cls.fields, decoded):
+            setattr(model, field, value)
+        return model
+
+    def prop(self, field: str) -> dict | None:
+        return self.props[self._index[field]]
+
+    def set(self, field: str, value) -> None:
+        prop = self.prop(field)
+        if prop is None:
+            raise KeyError(f"{self.struct_type} row has no {field} member")
+        prop["Value"] = value
+        setattr(self, field, value)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+def row_model(class_name: str, struct_type: str, **members) -> type:
+    """Generate a __slots__ RowModel subclass for one struct type.
+
+    Each keyword maps a field name to (member name, property $type) for a
+    scalar member, or to another model class for a nested struct member,
+    which is matched by its StructType.
+    """
+    fields = tuple(members)
+    scalar: dict[str, tuple[int, str]] = {}
+    nested: dict[str, tuple[int, type]] = {}
+    for index, (field, spec) in enumerate(members.items()):
+        if isinstance(spec, type) and issubclass(spec, RowModel):
+            nested[spec.struct_type] = (index, spec)
+        else:
+            key, prop_type = spec
+            scalar[key] = (index, prop_type)
+    return type(
+        class_name,
+        (RowModel,),
+        {
+            "__slots__": fields,
+            "struct_type": struct_type,
+            "fields": fields,
+            "_index": {field: index for index, field in enumerate(fields)},
+            "_members": scalar,
+            "_nested": nested,
+        },
+    )
+
+
+def decode_rows(model: type, rows, resolver: NameResolver | None = None) -> list:
+    """Models for the rows of the model's struct type; other entries are skipped."""
+    decoded = []
+    if isinstance(rows, list):
+        for row in rows:
+            value = model.decode(row, resolver)
+            if value is not None:
+                decoded.append(value)
+    return decoded
+
+
+# ---- Models ----
+
+ScalingMultipliers = row_model(
+    "ScalingMultipliers",
+    "S_EnemyScalingMultipliers",
+    hp=("HP", DOUBLE_TYPE),
+    attack=("PhysicalAttack", DOUBLE_TYPE),
+    speed=("Speed", DOUBLE_TYPE),
+    chroma=("Chroma", DOUBLE_TYPE),
+    experience=("Experience", DOUBLE_TYPE),
+)
+
+
+class EnemyRow(
+    row_model(
+        "EnemyRowFields",
+        "S_jRPG_Enemy",
+        hardcoded_name=("EnemyHardcodedName", NAME_TYPE),
+        is_boss=("IsBoss", BOOL_TYPE),
+        archetype=("EnemyArchetype", OBJECT_TYPE),
+        actor_class=("EnemyActorClassSoft", SOFTOBJ_TYPE),
+        scaling=ScalingMultipliers,
+    )
+):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        """EnemyHardcodedName, falling back to the row's own Name (usually the same)."""
+        if isinstance(self.hardcoded_name, str) and self.hardcoded_name:
+            return self.hardcoded_name
+        name = self.row.get("Name")
+        return name if isinstance(name, str) and name else "<unknown_enemy>"
+
+
+LevelRow = row_model(
+    "LevelRow",
+    "S_jRPG_Level",
+    experience_needed=("ExperienceNeededToReachThisLevel", INT_TYPE),
+)
+
+# One row per level in the DT_EnemyArchetype_* difficulty tables.
+ArchetypeLevelRow = row_model(
+    "ArchetypeLevelRow",
+    "S_EnemyScalingDataLevel",
+    level=("Level", INT_TYPE),
+    hp=("HP", INT_TYPE),
+    attack=("PhysicalAttack", INT_TYPE),
+    speed=("Speed", INT_TYPE),
+    chroma=("Chroma", INT_TYPE),
+    experience=("Experience", INT_TYPE),
+)
+
+# Stat labels the difficulty scripts use -> ArchetypeLevelRow fields.
+ARCHETYPE_STAT_FIELDS = {
+    "HP": "hp",
+    "ATK": "attack",
+    "Speed": "speed",
+    "Chroma": "chroma",
+    "EXP": "experience",
+}
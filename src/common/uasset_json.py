@@ -0,0 +1,372 @@
+import json
+import marshal
+import re
+import struct
+import sys
+from collections.abc import MutableMapping
+from pathlib import Path
+
+PROPERTY_TYPE_SUFFIX = "PropertyData, UAssetAPI"
+
+# Longer strings (base64 blobs, long text) are rarely repeated; interning them
+# would only grow the intern table.
+INTERN_MAX_LENGTH = 128
+
+# Intermediate files (stage-to-stage hand-offs that never reach UAssetGUI)
+# start with this magic and a little-endian u16 schema version, then the u16
+# marshal.version and the u8 major/minor Python version that wrote them,
+# followed by a marshal payload. marshal's format is only stable within one
+# interpreter version, so a file is read back only by a matching one. Bump the
+# schema version whenever the header or payload layout changes.
+INTERMEDIATE_MAGIC = b"EOIM"
+INTERMEDIATE_VERSION = 2
+_INTERMEDIATE_PREFIX = struct.Struct("<4sH")
+_INTERMEDIATE_HEADER = struct.Struct("<4sHHBB")
+
+# Installed by common.asset_daemon while it is serving requests; None means
+# every load reads and parses the file from disk.
+_document_cache = None
+
+
+def set_document_cache(cache) -> None:
+    global _document_cache
+    _document_cache = cache
+
+
+class CompactRecord(MutableMapping):
+    """Fixed-shape, __slots__-backed stand-in for a UAssetAPI property dict.
+
+    One subclass is generated per distinct key order, so a record costs a
+    handful of pointers instead of a dict hash table. Existing keys can be
+    read and reassigned; adding or removing keys is not supported. Records
+    serialize back to the same JSON via dump_json / json_default.
+    """
+
+    __slots__ = ()
+    _keys: tuple[str, ...] = ()
+    _slot_by_key: dict[str, str] = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._slot_by_key[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value) -> None:
+        slot = self._slot_by_key.get(key)
+        if slot is None:
+            raise TypeError(f"Compact records have a fixed set of keys; cannot add {key!r}")
+        setattr(self, slot, value)
+
+    def __delitem__(self, key) -> None:
+        raise TypeError(f"Compact records have a fixed set of keys; cannot delete {key!r}")
+
+    def __contains__(self, key) -> bool:
+        return key in self._slot_by_key
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"CompactRecord({dict(self)!r})"
+
+
+_record_classes: dict[tuple[str, ...], type] = {}
+
+
+def _record_class(keys: tuple[str, ...]) -> type:
+    cls = _record_classes.get(keys)
+    if cls is None:
+        slots = tuple(f"_{idx}" for idx in range(len(keys)))
+        cls = type(
+            "CompactRecord",
+            (CompactRecord,),
+            {"__slots__": slots, "_keys": keys, "_slot_by_key": dict(zip(keys, slots))},
+        )
+        _record_classes[keys] = cls
+    return cls
+
+
+def _intern_value(value):
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _interning_hook(pairs: list[tuple[str, object]]) -> dict:
+    return {sys.intern(key): _intern_value(value) for key, value in pairs}
+
+
+def _compact_hook(pairs: list[tuple[str, object]]):
+    keys = tuple(sys.intern(key) for key, _ in pairs)
+    values = [_intern_value(value) for _, value in pairs]
+
+    type_name = values[0] if keys and keys[0] == "$type" else None
+    if not (isinstance(type_name, str) and type_name.endswith(PROPERTY_TYPE_SUFFIX)):
+        return dict(zip(keys, values))
+
+    cls = _record_class(keys)
+    record = cls.__new__(cls)
+    for slot, value in zip(cls.__slots__, values):
+        setattr(record, slot, value)
+    return record
+
+
+def json_default(obj):
+    """json.dump default= hook that writes CompactRecord objects as objects."""
+    if isinstance(obj, CompactRecord):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_json(path: Path, shared: bool = False, intern: bool = False, compact: bool = False) -> dict:
+    """Load a UAssetAPI JSON document.
+
+    Inside the asset daemon the parsed document comes from memory. By default
+    the caller gets its own copy and may modify it; shared=True returns the
+    cached object itself, which read-only tools must not modify.
+
+    intern=True interns keys and short string values ($type names, tag flags,
+    GUID-suffixed property names) so repeated strings share one object across
+    every document loaded in the process. compact=True additionally turns
+    property dicts into CompactRecord objects; use it for tools that read
+    documents, and dump_json to write them back.
+    """
+    if _document_cache is not None:
+        return _document_cache.load(Path(path), shared=shared)
+
+    hook = _compact_hook if compact else _interning_hook if intern else None
+    if is_intermediate(path):
+        document = read_intermediate(path)
+        return document if hook is None else _apply_hook(dict(document), hook)
+
+    with Path(path).open("r", encoding="utf-8") as f:
+        return json.load(f, object_pairs_hook=hook)
+
+
+def _apply_hook(value, hook):
+    """Rebuild a decoded value the way json.load(object_pairs_hook=hook) would have built it."""
+    if isinstance(value, dict):
+        return hook([(key, _apply_hook(item, hook)) for key, item in value.items()])
+    if isinstance(value, list):
+        return [_apply_hook(item, hook) for item in value]
+    return value
+
+
+def dump_json(data, fp, **kwargs) -> None:
+    """json.dump that also understands documents loaded with compact=True."""
+    json.dump(data, fp, default=json_default, **kwargs)
+
+
+class RawJSON:
+    """An undecoded JSON value, kept as the exact text slice it was read from."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def decode(self, intern: bool = False):
+        return json.loads(self.text, object_pairs_hook=_interning_hook if intern else None)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({len(self.text)} chars)"
+
+
+class LazyDocument(dict):
+    """Top-level UAssetAPI document whose untouched sections stay raw.
+
+    Sections not requested from load_document are RawJSON values. Reading one
+    through [] or get() decodes it on first access; dump_document writes the
+    still-raw ones back verbatim.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, RawJSON):
+            value = value.decode()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_COLON_RE = re.compile(r"[ \t\n\r]*:[ \t\n\r]*")
+_CLOSING = {"[": "]", "{": "}", '"': '"'}
+_decoder = json.JSONDecoder()
+
+
+def _looks_complete(value_text: str) -> bool:
+    if not value_text:
+        return False
+    closing = _CLOSING.get(value_text[0])
+    return closing is None or value_text[-1] == closing
+
+
+def split_top_level(text: str) -> list[tuple[str, int, int]]:
+    """Return (key, start, end) text offsets for every top-level member.
+
+    Pretty-printed documents (UAssetGUI output, or json.dump with indent) are
+    split with plain substring searches: raw newlines only occur between
+    tokens, so a newline followed by exactly the first key's indentation and
+    a quote can only start another top-level key. Anything else falls back
+    to the C decoder to find where each value ends.
+    """
+    start = _WHITESPACE_RE.match(text).end()
+    if text[start] != "{":
+        raise ValueError("Document root must be a JSON object")
+
+    pos = _WHITESPACE_RE.match(text, start + 1).end()
+    if text[pos] == "}":
+        return []
+
+    key_prefix = text[start + 1:pos] + '"'
+    pretty = "\n" in key_prefix
+    root_end = text.rindex("}")
+    members: list[tuple[str, int, int]] = []
+
+    while True:
+        key, pos = json.decoder.scanstring(text, pos + 1)
+        value_start = _COLON_RE.match(text, pos).end()
+
+        value_end = None
+        next_key = -1
+        if pretty:
+            next_key = text.find(key_prefix, value_start, root_end)
+            if next_key == -1:
+                candidate = text[value_start:root_end].rstrip()
+            else:
+                comma = text.rfind(",", value_start, next_key)
+                candidate = text[value_start:comma].rstrip() if comma != -1 else ""
+                if text[comma + 1:next_key].strip():
+                    candidate = ""
+            if _looks_complete(candidate):
+                value_end = value_start + len(candidate)
+
+        if value_end is None:
+            _, value_end = _decoder.raw_decode(text, value_start)
+            after = _WHITESPACE_RE.match(text, value_end).end()
+            next_key = _WHITESPACE_RE.match(text, after + 1).end() if text[after] == "," else -1
+
+        members.append((key, value_start, value_end))
+        if next_key == -1:
+            return members
+        pos = next_key if text[next_key] == '"' else next_key + len(key_prefix) - 1
+
+
+def load_document(path: Path, sections=("Exports",), intern: bool = False) -> LazyDocument:
+    """Load a document, decoding only the listed top-level sections.
+
+    Every other section is kept as a RawJSON text slice, which skips building
+    objects for NameMap, Imports, DependsMap and the rest, and lets
+    dump_document copy them to the output without re-encoding. Intermediate
+    files are detected by their header and loaded the same way.
+    """
+    if is_intermediate(path):
+        return read_intermediate(path, sections, intern)
+
+    with Path(path).open("r", encoding="utf-8") as f:
+        text = f.read()
+
+    wanted = set(sections)
+    document = LazyDocument()
+    for key, value_start, value_end in split_top_level(text):
+        raw = RawJSON(text[value_start:value_end])
+        dict.__setitem__(document, key, raw.decode(intern) if key in wanted else raw)
+    return document
+
+
+def dump_document(data: dict, fp, indent: int = 2, **kwargs) -> None:
+    """Write a document the way json.dump(data, fp, indent=indent) would.
+
+    RawJSON sections are written verbatim; decoded ones are encoded with the
+    given json.dumps options (e.g. ensure_ascii=False).
+    """
+    if not data:
+        fp.write("{}")
+        return
+
+    member_prefix = "\n" + " " * indent
+    fp.write("{")
+    first = True
+    for key, value in dict.items(data):
+        fp.write(member_prefix if first else "," + member_prefix)
+        first = False
+        fp.write(json.dumps(key, **kwargs))
+        fp.write(": ")
+        if isinstance(value, RawJSON):
+            fp.write(value.text)
+        else:
+            encoded = json.dumps(value, indent=indent, default=json_default, **kwargs)
+            fp.write(encoded.replace("\n", member_prefix))
+    fp.write("\n}")
+
+
+def is_intermediate(path: Path) -> bool:
+    with Path(path).open("rb") as f:
+        return f.read(len(INTERMEDIATE_MAGIC)) == INTERMEDIATE_MAGIC
+
+
+def encode_intermediate(data: dict) -> bytes:
+    """Encode a document in the compact intermediate format.
+
+    Sections still held as RawJSON are stored as their text and stay raw when
+    read back, so a document passes through a stage without being decoded.
+    """
+    raw = {}
+    decoded = {}
+    for key, value in dict.items(data):
+        if isinstance(value, RawJSON):
+            raw[key] = value.text
+        else:
+            try:
+                marshal.dumps(value)
+            except ValueError:
+                # CompactRecord objects (compact=True loads) are not marshallable.
+                value = json.loads(json.dumps(value, default=json_default))
+            decoded[key] = value
+    payload = {"order": list(dict.keys(data)), "raw": raw, "decoded": decoded}
+    header = _INTERMEDIATE_HEADER.pack(INTERMEDIATE_MAGIC, INTERMEDIATE_VERSION, marshal.version, *sys.version_info[:2])
+    return header + marshal.dumps(payload)
+
+
+def read_intermediate(path: Path, sections=None, intern: bool = False) -> LazyDocument:
+    """Load an intermediate file written by encode_intermediate.
+
+    With sections=None every section is decoded; otherwise raw sections that
+    are not listed stay RawJSON, as with load_document.
+    """
+    content = Path(path).read_bytes()
+    magic, version = _INTERMEDIATE_PREFIX.unpack_from(content)
+    if magic != INTERMEDIATE_MAGIC:
+        raise ValueError(f"Not an intermediate file: {path}")
+    if version != INTERMEDIATE_VERSION:
+        raise ValueError(
+            f"{path} uses intermediate format version {version}, expected {INTERMEDIATE_VERSION}; "
+            "regenerate it with the tool that wrote it"
+        )
+    _, _, marshal_version, major, minor = _INTERMEDIATE_HEADER.unpack_from(content)
+    if (marshal_version, major, minor) != (marshal.version, *sys.version_info[:2]):
+        raise ValueError(
+            f"{path} was written by Python {major}.{minor} (marshal version {marshal_version}), "
+            f"this is Python {sys.version_info[0]}.{sys.version_info[1]} (marshal version {marshal.version}); "
+            "regenerate it with the tool that wrote it"
+        )
+    payload = marshal.loads(memoryview(content)[_INTERMEDIATE_HEADER.size:])
+
+    wanted = None if sections is None else set(sections)
+    document = LazyDocument()
+    for key in payload["order"]:
+        if key in payload["decoded"]:
+            value = payload["decoded"][key]
+        else:
+            value = RawJSON(payload["raw"][key])
+            if wanted is None or key in wanted:
+                value = value.decode(intern)
+        dict.__setitem__(document, key, value)
+    return document
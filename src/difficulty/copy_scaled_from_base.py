@@ -1,9 +1,14 @@
 import argparse
 import copy
-import json
 import math
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.row_models import ARCHETYPE_STAT_FIELDS, ArchetypeLevelRow, NameResolver, decode_rows, report_names
+from hard_targets import load_json, save_json
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 EASY_DIR = SCRIPT_DIR / "input" / "Easy_Difficulty"
 NORMAL_DIR = SCRIPT_DIR / "input" / "Normal_Difficulty"
@@ -19,18 +24,6 @@ MULTIPLIERS = {
 REQUIRED_MULTIPLIER_KEYS = {"HP", "ATK", "Speed", "Chroma", "EXP"}
 
 
-def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as file:
-        return json.load(file)
-
-
-def save_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        json.dump(data, file, ensure_ascii=False, indent=2)
-        file.write("\n")
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Scale each difficulty file from its own base values and write to scaled_from_base output."
@@ -51,26 +44,14 @@ def validate_multipliers() -> None:
             raise ValueError(f"MULTIPLIERS['{mode}'] is missing keys: {sorted(missing)}")
 
 
-def identify_stat(property_name: str) -> str | None:
-    if property_name.startswith("HP_"):
-        return "HP"
-    if property_name.startswith("PhysicalAttack_"):
-        return "ATK"
-    if property_name.startswith("Speed_"):
-        return "Speed"
-    if property_name.startswith("Chroma_"):
-        return "Chroma"
-    if property_name.startswith("Experience_"):
-        return "EXP"
-    return None
-
-
 def scaled_number(value: int | float, multiplier: float) -> int:
     new_value = value * multiplier
     return int(math.ceil(new_value))
 
 
-def scale_exports(exports: list[dict], multipliers: dict[str, float]) -> tuple[list[dict], dict[str, int]]:
+def scale_exports(
+    exports: list[dict], multipliers: dict[str, float], resolver: NameResolver | None = None
+) -> tuple[list[dict], dict[str, int]]:
     scaled_exports = copy.deepcopy(exports)
     scaled_counts = {key: 0 for key in REQUIRED_MULTIPLIER_KEYS}
 
@@ -83,28 +64,13 @@ def scale_exports(exports: list[dict], multipliers: dict[str, float]) -> tuple[l
         if not isinstance(rows, list):
             continue
 
-        for row in rows:
-            values = row.get("Value") if isinstance(row, dict) else None
-            if not isinstance(values, list):
-                continue
-
-            for prop in values:
-                if not isinstance(prop, dict):
-                    continue
-
-                prop_name = prop.get("Name")
-                if not isinstance(prop_name, str):
-                    continue
-
-                stat = identify_stat(prop_name)
-                if stat is None:
-                    continue
-
-                value = prop.get("Value")
+        for row in decode_rows(ArchetypeLevelRow, rows, resolver):
+            for stat, field in ARCHETYPE_STAT_FIELDS.items():
+                value = getattr(row, field)
                 if not isinstance(value, (int, float)):
                     continue
 
-                prop["Value"] = scaled_number(value, multipliers[stat])
+                row.set(field, scaled_number(value, multipliers[stat]))
                 scaled_counts[stat] += 1
 
     return scaled_exports, scaled_counts
@@ -141,8 +107,10 @@ def process_target(target: str) -> tuple[int, int]:
             skipped += 1
             continue
 
-        scaled_exports, counts = scale_exports(source_exports, multipliers)
-        output_data = copy.deepcopy(source_data)
+        resolver = NameResolver()
+        scaled_exports, counts = scale_exports(source_exports, multipliers, resolver)
+        report_names(resolver, source_path.name)
+        output_data = copy.copy(source_data)
         output_data["Exports"] = scaled_exports
 
         output_path = output_dir / source_path.name
@@ -1,13 +1,15 @@
 import argparse
 import copy
-import json
 import math
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.row_models import ARCHETYPE_STAT_FIELDS, ArchetypeLevelRow, NameResolver, decode_rows
+from hard_targets import HARD_DIR, process_targets
+
 SCRIPT_DIR = Path(__file__).resolve().parent
-HARD_DIR = SCRIPT_DIR / "input" / "Hard_Difficulty"
-EASY_DIR = SCRIPT_DIR / "input" / "Easy_Difficulty"
-NORMAL_DIR = SCRIPT_DIR / "input" / "Normal_Difficulty"
 OUTPUT_ROOT_DIR = SCRIPT_DIR.parent.parent / "output" / "difficulty" / "scaled_from_hard"
 
 # Easy-to-edit scaling multipliers applied to Hard values before copying Exports.
@@ -20,30 +22,6 @@ MULTIPLIERS = {
 REQUIRED_MULTIPLIER_KEYS = {"HP", "ATK", "Speed", "Chroma", "EXP"}
 
 
-def hard_to_easy_name(hard_name: str) -> str:
-    if hard_name.endswith("_Hard.json"):
-        return hard_name.replace("_Hard.json", "_Easy.json")
-    return hard_name.replace("Hard", "Easy")
-
-
-def hard_to_normal_name(hard_name: str) -> str:
-    if hard_name.endswith("_Hard.json"):
-        return hard_name.replace("_Hard.json", ".json")
-    return hard_name.replace("_Hard", "")
-
-
-def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as file:
-        return json.load(file)
-
-
-def save_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        json.dump(data, file, ensure_ascii=False, indent=2)
-        file.write("\n")
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Scale Hard Exports values, then copy into Easy/Normal base files while preserving target metadata."
@@ -64,26 +42,14 @@ def validate_multipliers() -> None:
             raise ValueError(f"MULTIPLIERS['{mode}'] is missing keys: {sorted(missing)}")
 
 
-def identify_stat(property_name: str) -> str | None:
-    if property_name.startswith("HP_"):
-        return "HP"
-    if property_name.startswith("PhysicalAttack_"):
-        return "ATK"
-    if property_name.startswith("Speed_"):
-        return "Speed"
-    if property_name.startswith("Chroma_"):
-        return "Chroma"
-    if property_name.startswith("Experience_"):
-        return "EXP"
-    return None
-
-
 def scaled_number(value: int | float, multiplier: float) -> int:
     new_value = value * multiplier
     return int(math.ceil(new_value))
 
 
-def scale_exports(exports: list[dict], multipliers: dict[str, float]) -> tuple[list[dict], dict[str, int]]:
+def scale_exports(
+    exports: list[dict], multipliers: dict[str, float], resolver: NameResolver | None = None
+) -> tuple[list[dict], dict[str, int]]:
     scaled_exports = copy.deepcopy(exports)
     scaled_counts = {key: 0 for key in REQUIRED_MULTIPLIER_KEYS}
 
@@ -96,87 +62,30 @@ def scale_exports(exports: list[dict], multipliers: dict[str, float]) -> tuple[l
         if not isinstance(rows, list):
             continue
 
-        for row in rows:
-            values = row.get("Value") if isinstance(row, dict) else None
-            if not isinstance(values, list):
-                continue
-
-            for prop in values:
-                if not isinstance(prop, dict):
-                    continue
-
-                prop_name = prop.get("Name")
-                if not isinstance(prop_name, str):
-                    continue
-
-                stat = identify_stat(prop_name)
-                if stat is None:
-                    continue
-
-                value = prop.get("Value")
+        for row in decode_rows(ArchetypeLevelRow, rows, resolver):
+            for stat, field in ARCHETYPE_STAT_FIELDS.items():
+                value = getattr(row, field)
                 if not isinstance(value, (int, float)):
                     continue
 
-                prop["Value"] = scaled_number(value, multipliers[stat])
+                row.set(field, scaled_number(value, multipliers[stat]))
                 scaled_counts[stat] += 1
 
     return scaled_exports, scaled_counts
 
 
-def process_target(target: str, hard_files: list[Path]) -> tuple[int, int]:
-    if target == "easy":
-        source_dir = EASY_DIR
-        output_dir = OUTPUT_ROOT_DIR / "Easy_Difficulty"
-        name_mapper = hard_to_easy_name
-    elif target == "normal":
-        source_dir = NORMAL_DIR
-        output_dir = OUTPUT_ROOT_DIR / "Normal_Difficulty"
-        name_mapper = hard_to_normal_name
-    else:
-        raise ValueError(f"Unsupported target: {target}")
-
-    multipliers = MULTIPLIERS[target]
-
-    processed = 0
-    skipped = 0
-
-    print(f"\n=== Processing target: {target} ===")
-    print(f"Multipliers: {multipliers}")
-
-    for hard_path in hard_files:
-        target_name = name_mapper(hard_path.name)
-        target_base_path = source_dir / target_name
-
-        if not target_base_path.exists():
-            print(f"SKIP: {target} counterpart not found for {hard_path.name} -> {target_name}")
-            skipped += 1
-            continue
-
-        hard_data = load_json(hard_path)
-        target_data = load_json(target_base_path)
-
-        hard_exports = hard_data.get("Exports")
-        if not isinstance(hard_exports, list):
-            print(f"SKIP: Missing or invalid 'Exports' in hard file: {hard_path.name}")
-            skipped += 1
-            continue
-
-        scaled_exports, counts = scale_exports(hard_exports, multipliers)
-        target_data["Exports"] = scaled_exports
-
-        output_path = output_dir / target_name
-        save_json(output_path, target_data)
+def scale_target(target: str, hard_exports: list[dict], resolver: NameResolver) -> tuple[list[dict], str]:
+    scaled_exports, scaled_counts = scale_exports(hard_exports, MULTIPLIERS[target], resolver)
+    note = (
+        f" | scaled HP={scaled_counts['HP']} ATK={scaled_counts['ATK']} Speed={scaled_counts['Speed']} "
+        f"Chroma={scaled_counts['Chroma']} EXP={scaled_counts['EXP']}"
+    )
+    return scaled_exports, note
 
-        print(
-            f"OK: {hard_path.name} -> {output_path.name} | "
-            f"scaled HP={counts['HP']} ATK={counts['ATK']} Speed={counts['Speed']} "
-            f"Chroma={counts['Chroma']} EXP={counts['EXP']}"
-        )
-        processed += 1
 
-    print(f"Target '{target}' summary: processed={processed}, skipped={skipped}")
-    print(f"Output: {output_dir}")
-    return processed, skipped
+def multipliers_key(target: str) -> tuple:
+    # Targets with the same multipliers share the scaled Exports.
+    return tuple(sorted(MULTIPLIERS[target].items()))
 
 
 def main() -> None:
@@ -189,13 +98,13 @@ def main() -> None:
 
     targets = ["easy", "normal"] if args.target == "both" else [args.target]
 
-    processed = 0
-    skipped = 0
-
-    for target in targets:
-        p, s = process_target(target, hard_files)
-        processed += p
-        skipped += s
+    if len(targets) == 1:
+        notes = [f"Multipliers: {MULTIPLIERS[targets[0]]}"]
+    else:
+        notes = [f"Multipliers ({target}): {MULTIPLIERS[target]}" for target in targets]
+    counts = process_targets(targets, hard_files, OUTPUT_ROOT_DIR, scale_target, multipliers_key, notes)
+    processed = sum(p for p, _ in counts.values())
+    skipped = sum(s for _, s in counts.values())
 
     print("\nDone")
     print(f"Processed:   {processed}")
@@ -0,0 +1,369 @@
+import argparse
+import copy
+import json
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.row_models import ARCHETYPE_STAT_FIELDS, ArchetypeLevelRow, NameResolver, decode_rows, report_names
+from hard_targets import index_json_names, load_json, save_json
+from scale_hard_from_level import band_slices, build_curves, validate_type_stat_curves
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+INPUT_DIRS = {
+    "easy": SCRIPT_DIR / "input" / "Easy_Difficulty",
+    "normal": SCRIPT_DIR / "input" / "Normal_Difficulty",
+    "hard": SCRIPT_DIR / "input" / "Hard_Difficulty",
+}
+OUTPUT_DIR_NAMES = {"easy": "Easy_Difficulty", "normal": "Normal_Difficulty", "hard": "Hard_Difficulty"}
+# DT_EnemyArchetype_Weak_Easy.json / DT_EnemyArchetype_Weak.json / DT_EnemyArchetype_Weak_Hard.json
+FILE_SUFFIXES = {"easy": "_Easy", "normal": "", "hard": "_Hard"}
+FILE_PREFIX = "DT_EnemyArchetype_"
+OUTPUT_ROOT_DIR = SCRIPT_DIR.parent.parent / "output" / "difficulty" / "build"
+SNAPSHOT_DIR_NAME = "snapshots"
+
+# Easy-to-edit build: an ordered rule list per target difficulty.
+#   {"rule": "clone", "from": "hard"}                   start from another difficulty's Exports
+#   {"rule": "scale", "stats": {"HP": 2}}               multiply stats on every row
+#   {"rule": "scale_by_type", "min_level": 55,
+#    "types": {"Weak": {"HP": 2.5}},                    multiply by enemy type, rows at/above min_level;
+#    "curves": {"Weak": {"ATK": [[40, 1.5]]}}}          optional level bands as in scale_hard_from_level's
+#                                                       TYPE_STAT_CURVES (a stat listed there ignores "types")
+#   {"rule": "round", "mode": "ceil", "each_step": True} rounding policy for every value a rule touched
+# Values are rounded after each scale rule when each_step is set (what chaining
+# the single-purpose scripts does), otherwise once after the last rule.
+# Without a clone rule, a file whose enemy type no rule scales is skipped and
+# gets no output, as in scale_hard_from_level.
+BUILD = {
+    "hard": [
+        {
+            "rule": "scale_by_type",
+            "min_level": 55,
+            "types": {"Weak": {"HP": 2.5}, "Regular": {"HP": 2.5}, "Strong": {"HP": 2.0}, "Elite": {"HP": 1.2}},
+        },
+        {"rule": "round", "mode": "ceil", "each_step": True},
+    ],
+    "normal": [
+        {"rule": "clone", "from": "hard"},
+        {"rule": "scale", "stats": {"HP": 1, "ATK": 1, "Speed": 1, "Chroma": 1, "EXP": 1}},
+        {"rule": "round", "mode": "ceil", "each_step": True},
+    ],
+    "easy": [
+        {"rule": "clone", "from": "hard"},
+        {"rule": "scale", "stats": {"HP": 1, "ATK": 1, "Speed": 1, "Chroma": 1, "EXP": 1}},
+        {"rule": "round", "mode": "ceil", "each_step": True},
+    ],
+}
+
+SUPPORTED_STATS = set(ARCHETYPE_STAT_FIELDS)
+ROUNDING = {
+    "ceil": lambda value: int(math.ceil(value)),
+    "floor": lambda value: int(math.floor(value)),
+    "nearest": lambda value: int(math.floor(value + 0.5)),
+    "none": lambda value: value,
+}
+RULE_KEYS = {
+    "clone": {"from"},
+    "scale": {"stats"},
+    "scale_by_type": {"min_level", "types", "curves"},
+    "round": {"mode", "each_step"},
+}
+
+
+def counterpart_name(file_name: str, source: str, target: str) -> str:
+    stem = file_name[: -len(".json")] if file_name.endswith(".json") else file_name
+    suffix = FILE_SUFFIXES[source]
+    if suffix and stem.endswith(suffix):
+        stem = stem[: -len(suffix)]
+    return f"{stem}{FILE_SUFFIXES[target]}.json"
+
+
+def extract_enemy_type(file_name: str, difficulty: str) -> str | None:
+    stem = counterpart_name(file_name, difficulty, "normal")[: -len(".json")]
+    if not stem.startswith(FILE_PREFIX):
+        return None
+    return stem[len(FILE_PREFIX):]
+
+
+def validate_stats(stats: dict, where: str) -> None:
+    unknown = set(stats) - SUPPORTED_STATS
+    if unknown:
+        raise ValueError(f"Unsupported stats in {where}: {sorted(unknown)}")
+
+
+def validate_build(build: dict[str, list[dict]]) -> None:
+    for target, rules in build.items():
+        if target not in INPUT_DIRS:
+            raise ValueError(f"Unknown target difficulty: {target}")
+        if not isinstance(rules, list):
+            raise ValueError(f"BUILD['{target}'] must be a list of rules")
+
+        for position, rule in enumerate(rules):
+            where = f"BUILD['{target}'][{position}]"
+            kind = rule.get("rule") if isinstance(rule, dict) else None
+            if kind not in RULE_KEYS:
+                raise ValueError(f"{where}: unknown rule {kind!r}")
+            unknown = set(rule) - RULE_KEYS[kind] - {"rule"}
+            if unknown:
+                raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+
+            if kind == "clone":
+                if position != 0:
+                    raise ValueError(f"{where}: clone must be the first rule")
+                if rule.get("from") not in INPUT_DIRS or rule["from"] == target:
+                    raise ValueError(f"{where}: clone needs another difficulty in 'from'")
+            elif kind == "scale":
+                validate_stats(rule.get("stats", {}), where)
+            elif kind == "scale_by_type":
+                if not isinstance(rule.get("min_level", 0), int):
+                    raise ValueError(f"{where}: min_level must be an integer")
+                for enemy_type, stats in rule.get("types", {}).items():
+                    validate_stats(stats, f"{where} types['{enemy_type}']")
+                validate_type_stat_curves(rule.get("curves", {}), f"{where} curves")
+            elif kind == "round" and rule.get("mode", "ceil") not in ROUNDING:
+                raise ValueError(f"{where}: mode must be one of {sorted(ROUNDING)}")
+
+        if sum(1 for rule in rules if rule["rule"] == "round") > 1:
+            raise ValueError(f"BUILD['{target}'] has more than one round rule")
+
+
+def band_multipliers(rows: list, stat_curves: dict[str, list[tuple[int, float | None]]]) -> list[dict[str, float]]:
+    """The multiplier each stat of each row gets from banded curves; rows without a level get none."""
+    order = sorted(
+        (int(row.level), row_number) for row_number, row in enumerate(rows) if isinstance(row.level, (int, float))
+    )
+    levels = [level for level, _ in order]
+    by_row = [{} for _ in rows]
+    for stat, curve in stat_curves.items():
+        for start, stop, multiplier in band_slices(levels, curve):
+            for _, row_number in order[start:stop]:
+                by_row[row_number][stat] = multiplier
+    return by_row
+
+
+def iter_stat_props(exports: list[dict], steps=(), resolver: NameResolver | None = None):
+    """Yield (prop, stat, multipliers) for every numeric stat value, row by row.
+
+    multipliers holds, for each compile_steps() step, the multiplier it applies
+    to this value, or None.
+    """
+    for export in exports:
+        table = export.get("Table")
+        if not isinstance(table, dict):
+            continue
+
+        rows = decode_rows(ArchetypeLevelRow, table.get("Data"), resolver)
+        banded = [band_multipliers(rows, curves) if curves is not None else None for _, _, curves in steps]
+        for row_number, row in enumerate(rows):
+            for stat, field in ARCHETYPE_STAT_FIELDS.items():
+                if isinstance(getattr(row, field), (int, float)):
+                    multipliers = [
+                        stats.get(stat) if by_row is None else by_row[row_number].get(stat)
+                        for (_, stats, _), by_row in zip(steps, banded)
+                    ]
+                    yield row.prop(field), stat, multipliers
+
+
+def compile_steps(rules: list[dict], enemy_type: str | None) -> list[tuple[int, dict | None, dict | None]]:
+    """(rule position, stat multipliers, stat curves) for each scale rule that applies to this file.
+
+    scale rules give flat multipliers for every row; scale_by_type rules give
+    banded curves, built as scale_hard_from_level builds them.
+    """
+    steps = []
+    for position, rule in enumerate(rules):
+        if rule["rule"] == "scale":
+            steps.append((position, rule.get("stats", {}), None))
+        elif rule["rule"] == "scale_by_type":
+            curves = build_curves(rule.get("min_level", 0), rule.get("types", {}), rule.get("curves", {}))
+            steps.append((position, None, curves.get(enemy_type) or {}))
+    return steps
+
+
+def apply_rules(
+    exports: list[dict],
+    rules: list[dict],
+    enemy_type: str | None,
+    snapshots: dict[int, list[dict]] | None = None,
+    resolver: NameResolver | None = None,
+) -> dict[str, int]:
+    """Apply every rule to exports in place, in a single walk.
+
+    snapshots maps a rule position to a deep copy of the starting exports;
+    each copy is updated to hold the values as they were right after that
+    rule. Returns how many values each stat had changed by a rule.
+    """
+    round_rule = next((rule for rule in rules if rule["rule"] == "round"), {})
+    round_value = ROUNDING[round_rule.get("mode", "ceil")]
+    each_step = round_rule.get("each_step", True)
+    cloned = bool(rules) and rules[0]["rule"] == "clone"
+    steps = compile_steps(rules, enemy_type)
+
+    # Snapshot copies have the same shape, so their stat props line up one to one.
+    snapshot_props = {
+        position: [prop for prop, _, _ in iter_stat_props(copied)] for position, copied in (snapshots or {}).items()
+    }
+    clone_snapshot = snapshot_props.get(0) if cloned else None
+
+    counts = {stat: 0 for stat in ARCHETYPE_STAT_FIELDS}
+    for index, (prop, stat, multipliers) in enumerate(iter_stat_props(exports, steps, resolver)):
+        value = prop["Value"]
+        touched = cloned
+        if clone_snapshot is not None:
+            clone_snapshot[index]["Value"] = value
+
+        for (position, _, _), multiplier in zip(steps, multipliers):
+            if multiplier is not None:
+                value = value * multiplier
+                if each_step:
+                    value = round_value(value)
+                touched = True
+            if position in snapshot_props:
+                snapshot_props[position][index]["Value"] = value
+
+        if touched:
+            value = round_value(value)
+            counts[stat] += 1
+            prop["Value"] = value
+
+    return counts
+
+
+def build_target(target: str, rules: list[dict], snapshot_root: Path | None) -> tuple[int, int]:
+    output_dir = OUTPUT_ROOT_DIR / OUTPUT_DIR_NAMES[target]
+    clone_from = rules[0]["from"] if rules and rules[0]["rule"] == "clone" else None
+    source_difficulty = clone_from or target
+
+    source_files = sorted(INPUT_DIRS[source_difficulty].glob("*.json"))
+    if not source_files:
+        raise FileNotFoundError(f"No JSON files found in: {INPUT_DIRS[source_difficulty]}")
+    target_names = index_json_names(INPUT_DIRS[target])
+
+    processed = 0
+    skipped = 0
+
+    print(f"\n=== Building target: {target} ===")
+    print("Rules: " + " -> ".join(rule["rule"] for rule in rules))
+
+    for source_path in source_files:
+        target_name = counterpart_name(source_path.name, source_difficulty, target)
+        target_file = target_names.get(target_name.casefold())
+        if target_file is None:
+            print(f"SKIP: {target} counterpart not found for {source_path.name} -> {target_name}")
+            skipped += 1
+            continue
+
+        output_path = output_dir / target_name
+        enemy_type = extract_enemy_type(target_name, target)
+        if not clone_from and not any(stats or curves for _, stats, curves in compile_steps(rules, enemy_type)):
+            # As in scale_hard_from_level: a file no rule scales gets no output, and loses a stale one.
+            output_path.unlink(missing_ok=True)
+            print(f"SKIP: No multipliers configured for enemy type '{enemy_type}' in {source_path.name}")
+            skipped += 1
+            continue
+
+        source_data = load_json(source_path)
+        exports = source_data.get("Exports")
+        if not isinstance(exports, list):
+            print(f"SKIP: Missing or invalid 'Exports' in: {source_path.name}")
+            skipped += 1
+            continue
+
+        # Cloning keeps the target's own metadata and only takes the Exports.
+        output_data = load_json(INPUT_DIRS[target] / target_file, sections=()) if clone_from else source_data
+
+        snapshots = None
+        if snapshot_root is not None:
+            snapshots = {position: copy.deepcopy(exports) for position, rule in enumerate(rules) if rule["rule"] != "round"}
+
+        resolver = NameResolver()
+        counts = apply_rules(exports, rules, enemy_type, snapshots, resolver)
+        report_names(resolver, source_path.name)
+        output_data["Exports"] = exports
+
+        save_json(output_path, output_data)
+
+        for position, snapshot_exports in (snapshots or {}).items():
+            snapshot_data = copy.copy(output_data)
+            snapshot_data["Exports"] = snapshot_exports
+            stage = f"{position + 1:02d}_{rules[position]['rule']}"
+            save_json(snapshot_root / stage / OUTPUT_DIR_NAMES[target] / target_name, snapshot_data)
+
+        changed = " ".join(f"{stat}={count}" for stat, count in counts.items())
+        print(f"OK: {source_path.name} -> {output_path.name} | changed {changed}")
+        processed += 1
+
+    print(f"Target '{target}' summary: processed={processed}, skipped={skipped}")
+    print(f"Output: {output_dir}")
+    return processed, skipped
+
+
+def load_config(path: Path) -> dict[str, list[dict]]:
+    """Read BUILD overrides (a rule list per target) from a JSON file."""
+    with path.open("r", encoding="utf-8") as file:
+        overrides = json.load(file)
+
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Config must be a JSON object: {path}")
+
+    build = dict(BUILD)
+    build.update(overrides)
+    return build
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Build difficulty archetype tables by applying an ordered rule list "
+            "(clone, scale, scale_by_type, round) in one walk per file."
+        )
+    )
+    parser.add_argument(
+        "--target",
+        choices=["easy", "normal", "hard", "all"],
+        default="all",
+        help="Which target difficulty to build. Default: all targets in BUILD",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="Optional JSON file replacing the rule list of one or more targets.",
+    )
+    parser.add_argument(
+        "--snapshots",
+        action="store_true",
+        help=f"Also write the values after each rule under {OUTPUT_ROOT_DIR / SNAPSHOT_DIR_NAME}.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    build = load_config(args.config) if args.config is not None else BUILD
+    validate_build(build)
+
+    targets = list(build) if args.target == "all" else [args.target]
+    if any(target not in build for target in targets):
+        raise ValueError(f"No rules configured for target: {args.target}")
+
+    snapshot_root = OUTPUT_ROOT_DIR / SNAPSHOT_DIR_NAME if args.snapshots else None
+
+    processed = 0
+    skipped = 0
+
+    for target in targets:
+        p, s = build_target(target, build[target], snapshot_root)
+        processed += p
+        skipped += s
+
+    print("\nDone")
+    print(f"Processed:   {processed}")
+    print(f"Skipped:     {skipped}")
+    print(f"Output root: {OUTPUT_ROOT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from collections.abc import Callable, Hashable
+from pathlib import Path
+
+from common.atomic_write import write_document
+from common.row_models import NameResolver, report_names
+from common.uasset_json import load_document
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+HARD_DIR = SCRIPT_DIR / "input" / "Hard_Difficulty"
+EASY_DIR = SCRIPT_DIR / "input" / "Easy_Difficulty"
+NORMAL_DIR = SCRIPT_DIR / "input" / "Normal_Difficulty"
+
+
+def hard_to_easy_name(hard_name: str) -> str:
+    if hard_name.endswith("_Hard.json"):
+        return hard_name.replace("_Hard.json", "_Easy.json")
+    return hard_name.replace("Hard", "Easy")
+
+
+def hard_to_normal_name(hard_name: str) -> str:
+    if hard_name.endswith("_Hard.json"):
+        return hard_name.replace("_Hard.json", ".json")
+    return hard_name.replace("_Hard", "")
+
+
+TARGETS = {
+    "easy": (EASY_DIR, "Easy_Difficulty", hard_to_easy_name),
+    "normal": (NORMAL_DIR, "Normal_Difficulty", hard_to_normal_name),
+}
+
+
+def load_json(path: Path, sections=("Exports",)) -> dict:
+    # Only the listed top-level sections are decoded; the rest is written back verbatim.
+    return load_document(path, sections)
+
+
+def save_json(path: Path, data: dict) -> None:
+    write_document(path, data, end="\n", ensure_ascii=False)
+
+
+def index_json_names(directory: Path) -> dict[str, str]:
+    """Casefolded name -> actual name; file names are case-insensitive on Windows."""
+    return {path.name.casefold(): path.name for path in directory.glob("*.json")}
+
+
+def process_targets(
+    targets: list[str],
+    hard_files: list[Path],
+    output_root: Path,
+    convert: Callable[[str, list[dict], NameResolver], tuple[list[dict], str]],
+    variant: Callable[[str], Hashable] = lambda target: None,
+    notes: list[str] | None = None,
+) -> dict[str, tuple[int, int]]:
+    """Generate every target in one pass over the Hard files.
+
+    convert(target, hard_exports, resolver) returns the Exports to write and a
+    note for the OK line. It runs once per Hard file and distinct variant(target),
+    so targets with the same variant share the converted Exports.
+    """
+    for target in targets:
+        if target not in TARGETS:
+            raise ValueError(f"Unsupported target: {target}")
+
+    available = {target: index_json_names(TARGETS[target][0]) for target in targets}
+    counts = {target: [0, 0] for target in targets}
+
+    label = "target" if len(targets) == 1 else "targets"
+    print(f"\n=== Processing {label}: {', '.join(targets)} ===")
+    for note in notes or []:
+        print(note)
+
+    for hard_path in hard_files:
+        pending = []
+        for target in targets:
+            target_name = TARGETS[target][2](hard_path.name)
+            source_name = available[target].get(target_name.casefold())
+            if source_name is None:
+                print(f"SKIP: {target} counterpart not found for {hard_path.name} -> {target_name}")
+                counts[target][1] += 1
+                continue
+            pending.append((target, target_name, source_name))
+        if not pending:
+            continue
+
+        hard_data = load_json(hard_path)
+        hard_exports = hard_data.get("Exports")
+        if not isinstance(hard_exports, list):
+            print(f"SKIP: Missing or invalid 'Exports' in hard file: {hard_path.name}")
+            for target, _, _ in pending:
+                counts[target][1] += 1
+            continue
+
+        resolver = NameResolver()
+        converted = {}
+        for target, target_name, source_name in pending:
+            key = variant(target)
+            if key not in converted:
+                converted[key] = convert(target, hard_exports, resolver)
+            exports, note = converted[key]
+
+            source_dir, output_name, _ = TARGETS[target]
+            target_data = load_json(source_dir / source_name, sections=())
+            target_data["Exports"] = exports
+
+            output_path = output_root / output_name / target_name
+            save_json(output_path, target_data)
+
+            print(f"OK: {hard_path.name} -> {output_path.name}{note}")
+            counts[target][0] += 1
+        report_names(resolver, hard_path.name)
+
+    for target in targets:
+        processed, skipped = counts[target]
+        print(f"Target '{target}' summary: processed={processed}, skipped={skipped}")
+        print(f"Output: {output_root / TARGETS[target][1]}")
+    return {target: tuple(value) for target, value in counts.items()}
@@ -1,14 +1,25 @@
+import argparse
 import copy
 import json
 import math
+import sys
+import time
+from bisect import bisect_left
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.row_models import ARCHETYPE_STAT_FIELDS, ArchetypeLevelRow, NameResolver, report_names
+from common.watch import watch_files
+from hard_targets import load_json, save_json
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 HARD_DIR = SCRIPT_DIR / "input" / "Hard_Difficulty"
 OUTPUT_DIR = SCRIPT_DIR.parent.parent / "output" / "difficulty" / "scaled_hard_from_level" / "Hard_Difficulty"
 
 # Easy-to-edit settings.
-# Only listed stats are scaled, and only for rows whose level is >= MIN_LEVEL.
+# Only listed stats are scaled, and only for rows whose level is >= MIN_LEVEL
+# (or inside a band of TYPE_STAT_CURVES below).
 MIN_LEVEL = 55
 # Configure multipliers by enemy type taken from the filename.
 # Example: DT_EnemyArchetype_Weak_Hard.json -> "Weak"
@@ -23,27 +34,20 @@ TYPE_STAT_MULTIPLIERS = {
     "OPBoss": {},
     "Elusive": {},
 }
+# Optional level bands per type and stat; a stat listed here ignores the flat
+# multiplier above. Each band is [first_level, multiplier] and lasts until the
+# next one starts; a null multiplier stops scaling from that level on.
+# Example: {"Weak": {"HP": [[40, 1.5], [55, 2.5]]}} -> x1.5 for 40-54, x2.5 from 55.
+TYPE_STAT_CURVES = {}
 
-SUPPORTED_STATS = {"HP", "ATK", "Speed", "Chroma", "EXP"}
-
-
-def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as file:
-        return json.load(file)
-
-
-def save_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        json.dump(data, file, ensure_ascii=False, indent=2)
-        file.write("\n")
+SUPPORTED_STATS = set(ARCHETYPE_STAT_FIELDS)
 
 
-def validate_type_stat_multipliers() -> None:
-    if not TYPE_STAT_MULTIPLIERS:
+def validate_type_stat_multipliers(type_stat_multipliers: dict[str, dict[str, float]]) -> None:
+    if not type_stat_multipliers:
         raise ValueError("TYPE_STAT_MULTIPLIERS must contain at least one enemy-type entry")
 
-    for enemy_type, stat_multipliers in TYPE_STAT_MULTIPLIERS.items():
+    for enemy_type, stat_multipliers in type_stat_multipliers.items():
         unknown_stats = set(stat_multipliers) - SUPPORTED_STATS
         if unknown_stats:
             raise ValueError(
@@ -51,6 +55,51 @@ def validate_type_stat_multipliers() -> None:
             )
 
 
+def validate_type_stat_curves(type_stat_curves: dict[str, dict[str, list]], name: str = "TYPE_STAT_CURVES") -> None:
+    for enemy_type, stat_curves in type_stat_curves.items():
+        unknown_stats = set(stat_curves) - SUPPORTED_STATS
+        if unknown_stats:
+            raise ValueError(f"Unsupported stats in {name}['{enemy_type}']: {sorted(unknown_stats)}")
+
+        for stat, bands in stat_curves.items():
+            where = f"{name}['{enemy_type}']['{stat}']"
+            if not isinstance(bands, list) or not bands:
+                raise ValueError(f"{where} must be a non-empty list of [first_level, multiplier] bands")
+            previous_level = None
+            for band in bands:
+                if (
+                    not isinstance(band, (list, tuple))
+                    or len(band) != 2
+                    or not isinstance(band[0], int)
+                    or not (band[1] is None or isinstance(band[1], (int, float)))
+                ):
+                    raise ValueError(f"{where} has an invalid band {band!r}; expected [int, number or null]")
+                if previous_level is not None and band[0] <= previous_level:
+                    raise ValueError(f"{where} bands must start at strictly increasing levels")
+                previous_level = band[0]
+
+
+def build_curves(
+    min_level: int,
+    type_stat_multipliers: dict[str, dict[str, float]],
+    type_stat_curves: dict[str, dict[str, list]],
+) -> dict[str, dict[str, list[tuple[int, float | None]]]]:
+    """Merge both settings into one banded curve per type and stat.
+
+    A flat multiplier becomes a single band starting at min_level.
+    """
+    curves = {}
+    for enemy_type in {**type_stat_multipliers, **type_stat_curves}:
+        stat_curves = {
+            stat: [(min_level, multiplier)]
+            for stat, multiplier in (type_stat_multipliers.get(enemy_type) or {}).items()
+        }
+        for stat, bands in (type_stat_curves.get(enemy_type) or {}).items():
+            stat_curves[stat] = [(first_level, multiplier) for first_level, multiplier in bands]
+        curves[enemy_type] = stat_curves
+    return curves
+
+
 def extract_enemy_type(file_name: str) -> str | None:
     prefix = "DT_EnemyArchetype_"
     suffix = "_Hard.json"
@@ -61,161 +110,302 @@ def extract_enemy_type(file_name: str) -> str | None:
     return file_name[len(prefix):-len(suffix)]
 
 
-def identify_stat(property_name: str) -> str | None:
-    if property_name.startswith("HP_"):
-        return "HP"
-    if property_name.startswith("PhysicalAttack_"):
-        return "ATK"
-    if property_name.startswith("Speed_"):
-        return "Speed"
-    if property_name.startswith("Chroma_"):
-        return "Chroma"
-    if property_name.startswith("Experience_"):
-        return "EXP"
-    return None
-
+def scaled_number(value: int | float, multiplier: float) -> int:
+    return int(math.ceil(value * multiplier))
 
-def extract_row_level(row: dict) -> int | None:
-    values = row.get("Value") if isinstance(row, dict) else None
-    if not isinstance(values, list):
-        return None
 
-    for prop in values:
-        if not isinstance(prop, dict):
-            continue
+def build_level_index(rows: list, resolver: NameResolver | None = None) -> tuple[list[int], list]:
+    """Row levels in ascending order, with the decoded row at each level.
 
-        prop_name = prop.get("Name")
-        if not isinstance(prop_name, str) or not prop_name.startswith("Level_"):
-            continue
+    Rows without a Level_* value are left out, so they are never scaled.
+    """
+    indexed = []
+    for row in rows:
+        level_row = ArchetypeLevelRow.decode(row, resolver)
+        if level_row is not None and isinstance(level_row.level, (int, float)):
+            indexed.append((int(level_row.level), level_row))
+    # Stable, so rows sharing a level keep their table order.
+    indexed.sort(key=lambda item: item[0])
+    return [level for level, _ in indexed], [level_row for _, level_row in indexed]
 
-        value = prop.get("Value")
-        if isinstance(value, (int, float)):
-            return int(value)
 
-    return None
+def index_tables(exports: list[dict], resolver: NameResolver | None = None) -> list[tuple[list[int], list] | None]:
+    """One level index per export, or None for exports without table rows."""
+    index = []
+    for export in exports:
+        table = export.get("Table")
+        rows = table.get("Data") if isinstance(table, dict) else None
+        index.append(build_level_index(rows, resolver) if isinstance(rows, list) else None)
+    return index
 
 
-def scaled_number(value: int | float, multiplier: float) -> int:
-    return int(math.ceil(value * multiplier))
+def band_slices(levels: list[int], curve: list[tuple[int, float | None]]):
+    """Yield (start, stop, multiplier) slices of the sorted levels covered by each band."""
+    for band_index, (first_level, multiplier) in enumerate(curve):
+        if multiplier is None:
+            continue
+        start = bisect_left(levels, first_level)
+        stop = bisect_left(levels, curve[band_index + 1][0]) if band_index + 1 < len(curve) else len(levels)
+        if start < stop:
+            yield start, stop, multiplier
 
 
 def scale_exports(
     exports: list[dict],
-    stat_multipliers: dict[str, float],
-    min_level: int,
+    stat_curves: dict[str, list[tuple[int, float | None]]],
+    level_index: list[tuple[list[int], list] | None] | None = None,
 ) -> tuple[list[dict], dict[str, int], int]:
-    scaled_exports = copy.deepcopy(exports)
-    scaled_counts = {stat: 0 for stat in stat_multipliers}
+    """Scale a copy of exports; level_index must be index_tables() of these exports, not of a copy."""
+    # deepcopy's memo maps every property dict to its copy, so the rows decoded
+    # for the index are written through to the copy without decoding them again.
+    copies = {}
+    scaled_exports = copy.deepcopy(exports, copies)
+    scaled_counts = {stat: 0 for stat in stat_curves}
     eligible_rows = 0
 
-    for export in scaled_exports:
-        table = export.get("Table")
-        if not isinstance(table, dict):
-            continue
+    if level_index is None:
+        level_index = index_tables(exports)
 
-        rows = table.get("Data")
-        if not isinstance(rows, list):
+    for table_index in level_index:
+        if table_index is None:
             continue
 
-        for row in rows:
-            row_level = extract_row_level(row)
-            if row_level is None or row_level < min_level:
-                continue
-
-            values = row.get("Value") if isinstance(row, dict) else None
-            if not isinstance(values, list):
-                continue
+        levels, level_rows = table_index
 
-            eligible_rows += 1
+        # Resolve every band to rows first, so each row is walked once
+        # however many stats and bands apply to it.
+        row_multipliers: dict[int, dict[str, float]] = {}
+        for stat, curve in stat_curves.items():
+            for start, stop, multiplier in band_slices(levels, curve):
+                for row_index in range(start, stop):
+                    row_multipliers.setdefault(row_index, {})[stat] = multiplier
 
-            for prop in values:
-                if not isinstance(prop, dict):
-                    continue
-
-                prop_name = prop.get("Name")
-                if not isinstance(prop_name, str):
-                    continue
+        eligible_rows += len(row_multipliers)
 
-                stat = identify_stat(prop_name)
-                if stat not in stat_multipliers:
-                    continue
-
-                value = prop.get("Value")
+        for row_index, stat_multipliers in row_multipliers.items():
+            level_row = level_rows[row_index]
+            for stat, multiplier in stat_multipliers.items():
+                field = ARCHETYPE_STAT_FIELDS[stat]
+                value = getattr(level_row, field)
                 if not isinstance(value, (int, float)):
                     continue
 
-                prop["Value"] = scaled_number(value, stat_multipliers[stat])
+                copies[id(level_row.prop(field))]["Value"] = scaled_number(value, multiplier)
                 scaled_counts[stat] += 1
 
     return scaled_exports, scaled_counts, eligible_rows
 
 
-def process_files(min_level: int) -> tuple[int, int]:
+def load_config(path: Path) -> tuple[int, dict[str, dict[str, float]], dict[str, dict[str, list]]]:
+    """Read MIN_LEVEL / TYPE_STAT_MULTIPLIERS / TYPE_STAT_CURVES overrides from a JSON file."""
+    with path.open("r", encoding="utf-8") as file:
+        overrides = json.load(file)
+
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Config must be a JSON object: {path}")
+
+    unknown = set(overrides) - {"MIN_LEVEL", "TYPE_STAT_MULTIPLIERS", "TYPE_STAT_CURVES"}
+    if unknown:
+        raise ValueError(f"Unknown config keys in {path}: {sorted(unknown)}")
+
+    min_level = overrides.get("MIN_LEVEL", MIN_LEVEL)
+    if not isinstance(min_level, int):
+        raise ValueError(f"MIN_LEVEL must be an integer in {path}")
+
+    return (
+        min_level,
+        overrides.get("TYPE_STAT_MULTIPLIERS", TYPE_STAT_MULTIPLIERS),
+        overrides.get("TYPE_STAT_CURVES", TYPE_STAT_CURVES),
+    )
+
+
+def process_file(
+    source_path: Path,
+    source_data: dict | None,
+    curves: dict[str, dict[str, list[tuple[int, float | None]]]],
+    level_index: list | None = None,
+) -> bool:
+    """Scale one Hard file and write it. Returns False when the file is skipped.
+
+    source_data may be None, in which case the file is only loaded when its
+    enemy type actually has multipliers configured. level_index is the
+    index_tables() result for source_data, when the caller keeps one.
+    """
+    output_path = OUTPUT_DIR / source_path.name
+
+    enemy_type = extract_enemy_type(source_path.name)
+    if enemy_type is None:
+        if output_path.exists():
+            output_path.unlink()
+        print(f"SKIP: Could not determine enemy type from filename: {source_path.name}")
+        return False
+
+    stat_curves = curves.get(enemy_type)
+    if not stat_curves:
+        if output_path.exists():
+            output_path.unlink()
+        print(f"SKIP: No multipliers configured for enemy type '{enemy_type}' in {source_path.name}")
+        return False
+
+    if source_data is None:
+        source_data = load_json(source_path)
+    source_exports = source_data.get("Exports")
+
+    if not isinstance(source_exports, list):
+        if output_path.exists():
+            output_path.unlink()
+        print(f"SKIP: Missing or invalid 'Exports' in base file: {source_path.name}")
+        return False
+
+    if level_index is None:
+        level_index = index_source(source_path, source_exports)
+    scaled_exports, counts, eligible_rows = scale_exports(source_exports, stat_curves, level_index)
+    output_data = copy.copy(source_data)
+    output_data["Exports"] = scaled_exports
+
+    save_json(output_path, output_data)
+
+    scaled_stats_summary = " ".join(f"{stat}={count}" for stat, count in counts.items())
+    print(
+        f"OK: {source_path.name} -> {output_path.name} | "
+        f"type={enemy_type} eligible rows={eligible_rows} scaled {scaled_stats_summary}"
+    )
+    return True
+
+
+def list_hard_files() -> list[Path]:
     hard_files = sorted(HARD_DIR.glob("*.json"))
     if not hard_files:
         raise FileNotFoundError(f"No JSON files found in: {HARD_DIR}")
+    return hard_files
+
+
+def process_files(
+    min_level: int,
+    type_stat_multipliers: dict[str, dict[str, float]],
+    type_stat_curves: dict[str, dict[str, list]],
+) -> tuple[int, int]:
+    hard_files = list_hard_files()
+    curves = build_curves(min_level, type_stat_multipliers, type_stat_curves)
 
     processed = 0
     skipped = 0
 
     print("=== Processing Hard difficulty files ===")
     print(f"Minimum level: {min_level}")
-    print(f"Type multipliers: {TYPE_STAT_MULTIPLIERS}")
+    print(f"Type multipliers: {type_stat_multipliers}")
+    if type_stat_curves:
+        print(f"Type curves: {type_stat_curves}")
 
     for source_path in hard_files:
-        output_path = OUTPUT_DIR / source_path.name
-
-        enemy_type = extract_enemy_type(source_path.name)
-        if enemy_type is None:
-            if output_path.exists():
-                output_path.unlink()
-            print(f"SKIP: Could not determine enemy type from filename: {source_path.name}")
+        if process_file(source_path, None, curves):
+            processed += 1
+        else:
             skipped += 1
-            continue
-
-        stat_multipliers = TYPE_STAT_MULTIPLIERS.get(enemy_type)
-        if not stat_multipliers:
-            if output_path.exists():
-                output_path.unlink()
-            print(f"SKIP: No multipliers configured for enemy type '{enemy_type}' in {source_path.name}")
-            skipped += 1
-            continue
 
-        source_data = load_json(source_path)
-        source_exports = source_data.get("Exports")
-
-        if not isinstance(source_exports, list):
-            if output_path.exists():
-                output_path.unlink()
-            print(f"SKIP: Missing or invalid 'Exports' in base file: {source_path.name}")
-            skipped += 1
-            continue
+    return processed, skipped
 
-        scaled_exports, counts, eligible_rows = scale_exports(source_exports, stat_multipliers, min_level)
-        output_data = copy.deepcopy(source_data)
-        output_data["Exports"] = scaled_exports
 
-        save_json(output_path, output_data)
+def index_source(path: Path, exports: list[dict]) -> list[tuple[list[int], list] | None]:
+    resolver = NameResolver()
+    level_index = index_tables(exports, resolver)
+    report_names(resolver, path.name)
+    return level_index
+
+
+def load_source(path: Path) -> tuple[dict, list | None]:
+    data = load_json(path)
+    exports = data.get("Exports")
+    return data, index_source(path, exports) if isinstance(exports, list) else None
+
+
+def watch(config_path: Path | None, curves: dict, interval: float) -> None:
+    """Keep the Hard files parsed and level-indexed, and re-scale only what a change affects.
+
+    A config change re-runs the files whose enemy type ends up with different
+    curves; an input change re-reads and re-runs that file only.
+    """
+    hard_files = list_hard_files()
+    sources = {path: load_source(path) for path in hard_files}
+
+    def on_change(changed: set[Path]) -> None:
+        nonlocal curves
+        start = time.perf_counter()
+        dirty = {path for path in changed if path in sources}
+
+        for path in dirty:
+            sources[path] = load_source(path)
+
+        if config_path is not None and config_path in changed:
+            if config_path.exists():
+                new_min_level, new_multipliers, new_type_curves = load_config(config_path)
+            else:
+                new_min_level, new_multipliers, new_type_curves = MIN_LEVEL, TYPE_STAT_MULTIPLIERS, TYPE_STAT_CURVES
+            validate_type_stat_multipliers(new_multipliers)
+            validate_type_stat_curves(new_type_curves)
+            new_curves = build_curves(new_min_level, new_multipliers, new_type_curves)
+
+            for path in hard_files:
+                enemy_type = extract_enemy_type(path.name)
+                if (new_curves.get(enemy_type) or {}) != (curves.get(enemy_type) or {}):
+                    dirty.add(path)
+            curves = new_curves
+            print(f"Reloaded config: {config_path}")
+
+        for path in sorted(dirty):
+            source_data, level_index = sources[path]
+            process_file(path, source_data, curves, level_index)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Re-processed {len(dirty)} file(s) in {elapsed_ms:.0f} ms")
+
+    watched = hard_files + ([config_path] if config_path is not None else [])
+    watch_files(watched, on_change, interval)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Scale Hard difficulty archetype rows by enemy type, from a minimum level or over level bands."
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="Optional JSON file overriding MIN_LEVEL, TYPE_STAT_MULTIPLIERS and/or TYPE_STAT_CURVES.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the Hard files parsed in memory and re-scale whenever they or --config change.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="Polling interval in seconds for --watch (default: 0.05)",
+    )
+    return parser.parse_args()
 
-        scaled_stats_summary = " ".join(f"{stat}={count}" for stat, count in counts.items())
-        print(
-            f"OK: {source_path.name} -> {output_path.name} | "
-            f"type={enemy_type} eligible rows={eligible_rows} scaled {scaled_stats_summary}"
-        )
-        processed += 1
 
-    return processed, skipped
+def main() -> None:
+    args = parse_args()
 
+    min_level, type_stat_multipliers, type_stat_curves = MIN_LEVEL, TYPE_STAT_MULTIPLIERS, TYPE_STAT_CURVES
+    if args.config is not None:
+        min_level, type_stat_multipliers, type_stat_curves = load_config(args.config)
 
-def main() -> None:
-    validate_type_stat_multipliers()
-    processed, skipped = process_files(MIN_LEVEL)
+    validate_type_stat_multipliers(type_stat_multipliers)
+    validate_type_stat_curves(type_stat_curves)
+    processed, skipped = process_files(min_level, type_stat_multipliers, type_stat_curves)
 
     print("\nDone")
     print(f"Processed:   {processed}")
     print(f"Skipped:     {skipped}")
     print(f"Output dir:  {OUTPUT_DIR}")
 
+    if args.watch:
+        watch(args.config, build_curves(min_level, type_stat_multipliers, type_stat_curves), args.interval)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,88 @@
+from functools import lru_cache
+
+
+class EnemyClassifier:
+    """Classify EnemyHardcodedName values into multiplier categories.
+
+    All name patterns (boss, alpha and custom kinds) are compiled into a single
+    uppercase matcher, and both the pattern hits and the final category decision
+    are memoized per unique input, so tables with many rows sharing a name (or
+    tools classifying the same table repeatedly) only pay for the scan once.
+    """
+
+    def __init__(
+        self,
+        categories,
+        boss_patterns=(),
+        alpha_patterns=(),
+        custom_patterns: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.categories = frozenset(categories)
+
+        # pattern (uppercased) -> tags; a tag is "boss", "alpha" or ("custom", kind)
+        compiled: dict[str, list] = {}
+        for pattern in boss_patterns:
+            if pattern:
+                compiled.setdefault(pattern.upper(), []).append("boss")
+        for pattern in alpha_patterns:
+            if pattern:
+                compiled.setdefault(pattern.upper(), []).append("alpha")
+
+        # Custom kinds keep their declaration order: the first kind whose
+        # patterns match wins, exactly like the original per-kind loop.
+        self._custom_order = {kind: idx for idx, kind in enumerate(custom_patterns or {})}
+        for kind, patterns in (custom_patterns or {}).items():
+            for pattern in patterns:
+                if pattern:
+                    compiled.setdefault(pattern.upper(), []).append(("custom", kind))
+
+        self._patterns = tuple((pattern, tuple(tags)) for pattern, tags in compiled.items())
+        self.match = lru_cache(maxsize=None)(self._match)
+        self.classify = lru_cache(maxsize=None)(self._classify)
+
+    def _match(self, enemy_name: str) -> tuple[bool, bool, str | None]:
+        """Return (matches_boss_pattern, matches_alpha_pattern, custom_kind)."""
+        if not enemy_name:
+            return False, False, None
+
+        name_upper = enemy_name.upper()
+        is_boss = False
+        is_alpha = False
+        custom_kind = None
+        for pattern, tags in self._patterns:
+            if pattern not in name_upper:
+                continue
+            for tag in tags:
+                if tag == "boss":
+                    is_boss = True
+                elif tag == "alpha":
+                    is_alpha = True
+                elif custom_kind is None or self._custom_order[tag[1]] < self._custom_order[custom_kind]:
+                    custom_kind = tag[1]
+        return is_boss, is_alpha, custom_kind
+
+    def _classify(self, enemy_name: str, is_boss: bool, archetype_kind: str | None) -> tuple[str, str]:
+        """Return (category, reason) for an enemy row.
+
+        Priority:
+        1) explicit archetype in data if configured as a category
+        2) alpha pattern
+        3) custom name pattern if configured as a category
+        4) boss flag/pattern
+        5) default fallback
+        """
+        matches_boss_pat, matches_alpha_pat, custom_kind = self.match(enemy_name)
+
+        if archetype_kind in self.categories:
+            return archetype_kind, f"archetype:{archetype_kind}"
+        if matches_alpha_pat and "alpha" in self.categories:
+            return "alpha", "alpha"
+        if custom_kind in self.categories:
+            return custom_kind, f"pattern->{custom_kind}"
+        if is_boss or matches_boss_pat:
+            return "boss", "boss" if is_boss else "pattern->boss"
+        return "default", "default"
+
+    def is_alpha_boss_conflict(self, enemy_name: str, is_boss: bool) -> bool:
+        matches_boss_pat, matches_alpha_pat, _ = self.match(enemy_name)
+        return matches_alpha_pat and (is_boss or matches_boss_pat)
@@ -1,12 +1,16 @@
 import argparse
-import json
+import sys
 from pathlib import Path
 
-INFILE = Path("input/DT_jRPG_Enemies.uasset.json")
+from enemy_classification import EnemyClassifier
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-BOOL_TYPE = "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI"
-STRUCT_TYPE = "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI"
-ENEMY_STRUCT = "S_jRPG_Enemy"
+from common.asset_daemon import run_in_daemon
+from common.row_models import EnemyRow, NameResolver, decode_rows, report_names
+from common.uasset_json import load_json
+
+INFILE = Path("input/DT_jRPG_Enemies.uasset.json")
 
 BOSS_NAME_PATTERNS = [
     "MIME",
@@ -17,39 +21,12 @@ ALPHA_NAME_PATTERNS = [
     "_Alpha",
 ]
 
-
-def extract_enemy_hardcoded_name(enemy_struct: dict) -> str:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type")
-            == "UAssetAPI.PropertyTypes.Objects.NamePropertyData, UAssetAPI"
-            and item.get("Name") == "EnemyHardcodedName_4_0FAACC934CB2957BA37E888624E5835F"
-        ):
-            v = item.get("Value")
-            if isinstance(v, str) and v:
-                return v
-    v = enemy_struct.get("Name")
-    return v if isinstance(v, str) and v else "<unknown_enemy>"
-
-
-def extract_is_boss(enemy_struct: dict) -> bool:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == BOOL_TYPE
-            and item.get("Name", "").startswith("IsBoss_")
-        ):
-            v = item.get("Value", False)
-            return bool(v) if isinstance(v, bool) else False
-    return False
-
-
-def matches_pattern(name: str, patterns: list[str]) -> bool:
-    if not name:
-        return False
-    name_upper = name.upper()
-    return any(pattern.upper() in name_upper for pattern in patterns if pattern)
+# Only boss/alpha hits are needed here, so no categories or custom kinds.
+CLASSIFIER = EnemyClassifier(
+    (),
+    boss_patterns=BOSS_NAME_PATTERNS,
+    alpha_patterns=ALPHA_NAME_PATTERNS,
+)
 
 
 def extract_enemy_entries(data: dict) -> list[dict]:
@@ -65,7 +42,7 @@ def extract_enemy_entries(data: dict) -> list[dict]:
     return fallback if isinstance(fallback, list) else []
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="List alpha enemies and classify which are bosses vs non-bosses."
     )
@@ -74,37 +51,37 @@ def main() -> int:
         default=str(INFILE),
         help="Path to DT_jRPG_Enemies.uasset.json",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    remote_exit = run_in_daemon("list_alpha_bosses", argv)
+    if remote_exit is not None:
+        return remote_exit
 
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Input file not found: {input_path}")
         return 1
 
-    with input_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(input_path, shared=True)
 
     alpha_bosses: list[str] = []
     alpha_non_bosses: list[str] = []
 
-    for entry in extract_enemy_entries(data):
-        if not (
-            isinstance(entry, dict)
-            and entry.get("$type") == STRUCT_TYPE
-            and entry.get("StructType") == ENEMY_STRUCT
-        ):
-            continue
-
-        enemy_name = extract_enemy_hardcoded_name(entry)
-        if not matches_pattern(enemy_name, ALPHA_NAME_PATTERNS):
+    resolver = NameResolver()
+    for enemy in decode_rows(EnemyRow, extract_enemy_entries(data), resolver):
+        enemy_name = enemy.name
+        matches_boss_pat, matches_alpha_pat, _ = CLASSIFIER.match(enemy_name)
+        if not matches_alpha_pat:
             continue
 
-        is_boss = extract_is_boss(entry) or matches_pattern(enemy_name, BOSS_NAME_PATTERNS)
+        is_boss = enemy.is_boss is True or matches_boss_pat
         if is_boss:
             alpha_bosses.append(enemy_name)
         else:
             alpha_non_bosses.append(enemy_name)
 
+    report_names(resolver, input_path)
+
     alpha_bosses = sorted(set(alpha_bosses))
     alpha_non_bosses = sorted(set(alpha_non_bosses))
 
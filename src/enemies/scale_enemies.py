@@ -1,8 +1,32 @@
+import argparse
+import copy
+import csv
+import itertools
 import json
+import math
+import os
+import re
+import statistics
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
 
+from enemy_classification import EnemyClassifier
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.asset_daemon import run_in_daemon
+from common.atomic_write import write_intermediate, write_json, write_text
+from common.row_models import EnemyRow, NameResolver, decode_rows, report_names
+from common.uasset_json import load_json
+from common.watch import watch_files
+
 INFILE = Path("input/DT_jRPG_Enemies.uasset.json")
 OUTFILE = Path("../../output/enemies/Modded-DT_jRPG_Enemies.uasset.json")
+INTERMEDIATE_OUTFILE = Path("../../output/enemies/Modded-DT_jRPG_Enemies.eoim")
 
 # ---- Config ----
 
@@ -24,12 +48,13 @@ LOW_VALUE_BASE_BY_STAT = {
     "XP": 0.75,
 }
 
-NAMES = {
-    "HP": "HP_2_9B8F0EF14EBC6DBDE30E86A7FFE48646",
-    "ATK": "PhysicalAttack_4_82A69E334B7A1E723084829AFCCEAA25",
-    "Speed": "Speed_16_FC80E04941CF184AEFA369950419F557",
-    "Chroma": "Chroma_21_6C260F8F48BCE6E6C43C568C38941012",
-    "XP": "Experience_23_BEE8A0DD4ED59C6C6782B88443AB9AE8",
+# Stat label -> S_EnemyScalingMultipliers field (see common.row_models)
+STAT_FIELDS = {
+    "HP": "hp",
+    "ATK": "attack",
+    "Speed": "speed",
+    "Chroma": "chroma",
+    "XP": "experience",
 }
 
 # Multipliers by enemy type
@@ -88,66 +113,12 @@ CUSTOM_NAME_PATTERNS = {
     # ]
 }
 
-# ---- Constants ----
-
-DOUBLE_TYPE = "UAssetAPI.PropertyTypes.Objects.DoublePropertyData, UAssetAPI"
-SOFTOBJ_TYPE = "UAssetAPI.PropertyTypes.Objects.SoftObjectPropertyData, UAssetAPI"
-BOOL_TYPE = "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI"
-STRUCT_TYPE = "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI"
-OBJECT_TYPE = "UAssetAPI.PropertyTypes.Objects.ObjectPropertyData, UAssetAPI"
-
-ENEMY_STRUCT = "S_jRPG_Enemy"
-SCALING_STRUCT = "S_EnemyScalingMultipliers"
-
 # ---- Helpers ----
 
-def extract_enemy_asset_name(enemy_struct: dict) -> str:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == SOFTOBJ_TYPE
-            and item.get("Name", "").startswith("EnemyActorClassSoft_")
-        ):
-            asset = item.get("Value", {}).get("AssetPath", {}).get("AssetName")
-            if isinstance(asset, str) and asset:
-                return asset
-    return "<unknown_asset>"
-
-def extract_enemy_hardcoded_name(enemy_struct: dict) -> str:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == "UAssetAPI.PropertyTypes.Objects.NamePropertyData, UAssetAPI"
-            and item.get("Name") == "EnemyHardcodedName_4_0FAACC934CB2957BA37E888624E5835F"
-        ):
-            v = item.get("Value")
-            if isinstance(v, str) and v:
-                return v
-    # fallback: the enemy struct's own "Name" field is usually the same
-    v = enemy_struct.get("Name")
-    return v if isinstance(v, str) and v else "<unknown_enemy>"
-
-def extract_is_boss(enemy_struct: dict) -> bool:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == BOOL_TYPE
-            and item.get("Name", "").startswith("IsBoss_")
-        ):
-            v = item.get("Value", False)
-            return bool(v) if isinstance(v, bool) else False
-    return False
-
-def find_scaling_struct(enemy_struct: dict):
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == STRUCT_TYPE
-            and item.get("StructType") == SCALING_STRUCT
-            and isinstance(item.get("Value"), list)
-        ):
-            return item
-    return None
+def extract_enemy_asset_name(enemy: EnemyRow) -> str:
+    value = enemy.actor_class
+    asset = value.get("AssetPath", {}).get("AssetName") if isinstance(value, dict) else None
+    return asset if isinstance(asset, str) and asset else "<unknown_asset>"
 
 def build_enemy_archetype_value_map(data: dict) -> dict[int, str]:
     value_to_kind: dict[int, str] = {}
@@ -171,19 +142,6 @@ def build_enemy_archetype_value_map(data: dict) -> dict[int, str]:
 
     return value_to_kind
 
-def extract_enemy_archetype_kind(enemy_struct: dict, value_to_kind: dict[int, str]) -> str | None:
-    for item in enemy_struct.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == OBJECT_TYPE
-            and item.get("Name", "").startswith("EnemyArchetype_")
-        ):
-            val = item.get("Value")
-            if isinstance(val, int):
-                return value_to_kind.get(val)
-            return None
-    return None
-
 def apply_rounding(x: float) -> float:
     return round(x, ROUND_DECIMALS)
 
@@ -201,172 +159,623 @@ def get_value_to_scale(label: str, value: float) -> tuple[float, bool]:
 
     return float(replacement), True
 
-def matches_boss_pattern(enemy_name: str) -> bool:
-    if not enemy_name:
-        return False
-    name_upper = enemy_name.upper()
-    return any(pattern.upper() in name_upper for pattern in BOSS_NAME_PATTERNS if pattern)
-
-def matches_alpha_pattern(enemy_name: str) -> bool:
-    if not enemy_name:
-        return False
-    name_upper = enemy_name.upper()
-    return any(pattern.upper() in name_upper for pattern in ALPHA_NAME_PATTERNS if pattern)
-
-def detect_custom_kind(enemy_name: str) -> str | None:
-    if not enemy_name:
-        return None
-
-    name_upper = enemy_name.upper()
-    for kind, patterns in CUSTOM_NAME_PATTERNS.items():
-        if any(pattern.upper() in name_upper for pattern in patterns if pattern):
-            return kind
-    return None
-
-# Build a reverse map: property Name -> label ("HP"/"Speed"/"XP")
-NAME_TO_LABEL = {v: k for k, v in NAMES.items()}
-
-# ---- Main ----
-
-with INFILE.open("r", encoding="utf-8") as f:
-    data = json.load(f)
-
-enemy_archetype_value_map = build_enemy_archetype_value_map(data)
-
-stats = {
-    "changed": {kind: {"HP": 0, "ATK": 0, "Speed": 0, "Chroma": 0, "XP": 0} for kind in MULTIPLIERS},
-    "skipped_non_numeric": {kind: {"HP": 0, "ATK": 0, "Speed": 0, "Chroma": 0, "XP": 0} for kind in MULTIPLIERS},
-    "low_value_base_applied": {kind: {"HP": 0, "ATK": 0, "Speed": 0, "Chroma": 0, "XP": 0} for kind in MULTIPLIERS},
-    "missing_scaling": 0,
-    "overrides_applied": 0,
-    "alpha_boss_conflicts": [],
-}
-
-# Handle full uasset.json structure
-enemy_data = []
-exports = data.get("Exports", [])
-for export in exports:
-    table = export.get("Table")
-    if isinstance(table, dict):
-        enemy_data = table.get("Data", [])
-        break
-
-# Fallback to root-level Data for simpler extracts
-if not enemy_data:
-    enemy_data = data.get("Data", [])
-
-for entry in enemy_data:
-    if not (
-        isinstance(entry, dict)
-        and entry.get("$type") == STRUCT_TYPE
-        and entry.get("StructType") == ENEMY_STRUCT
-    ):
-        continue
-
-    # asset_name = extract_enemy_asset_name(entry)
-    enemy_name = extract_enemy_hardcoded_name(entry)
-    is_boss = extract_is_boss(entry)
-    archetype_kind = extract_enemy_archetype_kind(entry, enemy_archetype_value_map)
-    custom_kind = detect_custom_kind(enemy_name)
-
-    matches_boss_pat = matches_boss_pattern(enemy_name)
-    matches_alpha_pat = matches_alpha_pattern(enemy_name)
-
-    if matches_alpha_pat and (is_boss or matches_boss_pat):
-        stats["alpha_boss_conflicts"].append(enemy_name)
-
-    # Determine category:
-    # 1) explicit archetype in data if configured in MULTIPLIERS
-    # 2) alpha pattern
-    # 3) custom name pattern if configured in MULTIPLIERS
-    # 4) boss flag/pattern
-    # 5) default fallback
-    if archetype_kind in MULTIPLIERS:
-        kind = archetype_kind
-        reason = f"archetype:{archetype_kind}"
-    elif matches_alpha_pat and "alpha" in MULTIPLIERS:
-        kind = "alpha"
-        reason = "alpha"
-    elif custom_kind in MULTIPLIERS:
-        kind = custom_kind
-        reason = f"pattern->{custom_kind}"
-    elif is_boss or matches_boss_pat:
-        kind = "boss"
-        reason = "boss" if is_boss else "pattern->boss"
-    else:
-        kind = "default"
-        reason = "default"
-
-    scaling = find_scaling_struct(entry)
-    if scaling is None:
-        stats["missing_scaling"] += 1
-        continue
-
-    mults = MULTIPLIERS[kind]
-    overrides = ENEMY_OVERRIDES.get(enemy_name, {})
-
-    for prop in scaling["Value"]:
-        if not (isinstance(prop, dict) and prop.get("$type") == DOUBLE_TYPE):
+STAT_LABELS = ("HP", "ATK", "Speed", "Chroma", "XP")
+
+# Settings that an external --config JSON file may override.
+CONFIG_KEYS = (
+    "ROUND_DECIMALS",
+    "USE_LOW_VALUE_BASE",
+    "LOW_VALUE_THRESHOLD",
+    "LOW_VALUE_BASE_ENABLED_STATS",
+    "LOW_VALUE_BASE_BY_STAT",
+    "MULTIPLIERS",
+    "ENEMY_OVERRIDES",
+    "BOSS_NAME_PATTERNS",
+    "ALPHA_NAME_PATTERNS",
+    "CUSTOM_NAME_PATTERNS",
+)
+DEFAULT_CONFIG = copy.deepcopy({key: globals()[key] for key in CONFIG_KEYS})
+
+# Placeholder used to cut the serialized output into a reusable template.
+SLOT_MARKER = "@@SCALED_VALUE_{}@@"
+SLOT_RE = re.compile(r'"@@SCALED_VALUE_(\d+)@@"')
+
+
+def build_classifier() -> EnemyClassifier:
+    return EnemyClassifier(
+        MULTIPLIERS,
+        boss_patterns=BOSS_NAME_PATTERNS,
+        alpha_patterns=ALPHA_NAME_PATTERNS,
+        custom_patterns=CUSTOM_NAME_PATTERNS,
+    )
+
+
+CLASSIFIER = build_classifier()
+
+
+def load_config(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as f:
+        overrides = json.load(f)
+
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Config must be a JSON object: {path}")
+
+    unknown = set(overrides) - set(CONFIG_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown config keys in {path}: {sorted(unknown)}")
+
+    if "LOW_VALUE_BASE_ENABLED_STATS" in overrides:
+        overrides["LOW_VALUE_BASE_ENABLED_STATS"] = set(overrides["LOW_VALUE_BASE_ENABLED_STATS"])
+
+    for kind, mults in overrides.get("MULTIPLIERS", DEFAULT_CONFIG["MULTIPLIERS"]).items():
+        missing = set(STAT_LABELS) - set(mults)
+        if missing:
+            raise ValueError(f"MULTIPLIERS['{kind}'] is missing keys: {sorted(missing)}")
+
+    return overrides
+
+
+def apply_config(overrides: dict) -> None:
+    """Reset the tunables to the values in this file, then apply overrides.
+
+    The tunables are the module-level settings at the top of this file, which
+    the helpers read directly like the rest of the scripts do; swapping them
+    here (only the CONFIG_KEYS names) lets --config and --watch reload them
+    without threading a settings object through every helper.
+    """
+    global CLASSIFIER
+    unknown = set(overrides) - set(CONFIG_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {sorted(unknown)}")
+    settings = globals()
+    for key in CONFIG_KEYS:
+        settings[key] = copy.deepcopy(overrides[key] if key in overrides else DEFAULT_CONFIG[key])
+    CLASSIFIER = build_classifier()
+
+
+def find_enemy_data(data: dict) -> list:
+    # Handle full uasset.json structure
+    for export in data.get("Exports", []):
+        table = export.get("Table")
+        if isinstance(table, dict):
+            enemy_data = table.get("Data", [])
+            if enemy_data:
+                return enemy_data
+            break
+
+    # Fallback to root-level Data for simpler extracts
+    return data.get("Data", [])
+
+
+def collect_enemy_rows(data: dict, resolver: NameResolver | None = None) -> list[dict]:
+    """Extract everything the scaling pass needs from the table, once.
+
+    Each scaled property keeps its original value, so the pass can be applied
+    again with different multipliers without re-reading the input file.
+    """
+    enemy_archetype_value_map = build_enemy_archetype_value_map(data)
+    rows = []
+
+    for enemy in decode_rows(EnemyRow, find_enemy_data(data), resolver):
+        scaling = enemy.scaling
+        props = []
+        if scaling is not None:
+            for label, field in STAT_FIELDS.items():
+                prop = scaling.prop(field)
+                if prop is not None:
+                    props.append((prop, label, getattr(scaling, field)))
+
+        archetype = enemy.archetype
+        rows.append(
+            {
+                # "asset_name": extract_enemy_asset_name(enemy.row),
+                "name": enemy.name,
+                "is_boss": enemy.is_boss is True,
+                "archetype_kind": enemy_archetype_value_map.get(archetype) if isinstance(archetype, int) else None,
+                "has_scaling": scaling is not None,
+                "props": props,
+            }
+        )
+
+    return rows
+
+
+def new_stats() -> dict:
+    return {
+        "changed": {kind: {label: 0 for label in STAT_LABELS} for kind in MULTIPLIERS},
+        "skipped_non_numeric": {kind: {label: 0 for label in STAT_LABELS} for kind in MULTIPLIERS},
+        "low_value_base_applied": {kind: {label: 0 for label in STAT_LABELS} for kind in MULTIPLIERS},
+        "missing_scaling": 0,
+        "overrides_applied": 0,
+        "alpha_boss_conflicts": [],
+    }
+
+
+def scale_rows(rows: list[dict], verbose: bool = True) -> dict:
+    stats = new_stats()
+
+    for row in rows:
+        enemy_name = row["name"]
+        is_boss = row["is_boss"]
+
+        if CLASSIFIER.is_alpha_boss_conflict(enemy_name, is_boss):
+            stats["alpha_boss_conflicts"].append(enemy_name)
+
+        # Category resolution (archetype > alpha > custom > boss > default) is
+        # memoized per unique (name, boss flag, archetype) in the classifier.
+        kind, reason = CLASSIFIER.classify(enemy_name, is_boss, row["archetype_kind"])
+
+        if not row["has_scaling"]:
+            stats["missing_scaling"] += 1
             continue
 
-        pname = prop.get("Name")
-        if pname not in NAME_TO_LABEL:
-            continue  # ignore other scaling fields
-
-        label = NAME_TO_LABEL[pname]
-        val = prop.get("Value", None)
-
-        if isinstance(val, (int, float)):
-            old = float(val)
-            value_to_scale, used_low_value_base = get_value_to_scale(label, old)
+        mults = MULTIPLIERS[kind]
+        overrides = ENEMY_OVERRIDES.get(enemy_name, {})
 
-            if used_low_value_base:
-                stats["low_value_base_applied"][kind][label] += 1
+        for prop, label, val in row["props"]:
+            if isinstance(val, (int, float)):
+                old = float(val)
+                value_to_scale, used_low_value_base = get_value_to_scale(label, old)
 
-            if label in overrides:
-                override_mult = float(overrides[label])
-                new = apply_rounding(value_to_scale * override_mult)
-                stats["overrides_applied"] += 1
                 if used_low_value_base:
-                    print(
-                        f"OVERRIDE [{enemy_name}] {label}: {old} -> {value_to_scale} -> {new} "
-                        f"(base<{LOW_VALUE_THRESHOLD}, x{override_mult})"
-                    )
+                    stats["low_value_base_applied"][kind][label] += 1
+
+                if label in overrides:
+                    override_mult = float(overrides[label])
+                    new = apply_rounding(value_to_scale * override_mult)
+                    stats["overrides_applied"] += 1
+                    if verbose:
+                        if used_low_value_base:
+                            print(
+                                f"OVERRIDE [{enemy_name}] {label}: {old} -> {value_to_scale} -> {new} "
+                                f"(base<{LOW_VALUE_THRESHOLD}, x{override_mult})"
+                            )
+                        else:
+                            print(f"OVERRIDE [{enemy_name}] {label}: {old} -> {new} (x{override_mult})")
                 else:
-                    print(f"OVERRIDE [{enemy_name}] {label}: {old} -> {new} (x{override_mult})")
+                    mult = mults[label]
+                    new = apply_rounding(value_to_scale * mult)
+                    if verbose:
+                        if used_low_value_base:
+                            print(
+                                f"CHANGED [{enemy_name}] ({reason}) {label}: {old} -> {value_to_scale} -> {new} "
+                                f"(base<{LOW_VALUE_THRESHOLD}, x{mult})"
+                            )
+                        else:
+                            print(f"CHANGED [{enemy_name}] ({reason}) {label}: {old} -> {new} (x{mult})")
+                prop["Value"] = new
+                if label not in overrides:
+                    stats["changed"][kind][label] += 1
             else:
-                mult = mults[label]
-                new = apply_rounding(value_to_scale * mult)
-                if used_low_value_base:
-                    print(
-                        f"CHANGED [{enemy_name}] ({reason}) {label}: {old} -> {value_to_scale} -> {new} "
-                        f"(base<{LOW_VALUE_THRESHOLD}, x{mult})"
-                    )
-                else:
-                    print(f"CHANGED [{enemy_name}] ({reason}) {label}: {old} -> {new} (x{mult})")
-            prop["Value"] = new
-            if label not in overrides:
-                stats["changed"][kind][label] += 1
+                stats["skipped_non_numeric"][kind][label] += 1
+                if verbose:
+                    # print(f"SKIP   [{asset_name}] ({kind}) {label}: non-numeric Value {val!r}")
+                    print(f"SKIP   [{enemy_name}] ({reason}) {label}: non-numeric Value {val!r}")
+
+    return stats
+
+
+def print_summary(stats: dict) -> None:
+    print("\nSUMMARY")
+    print("-------")
+    print("Missing scaling struct:", stats["missing_scaling"])
+    print("Overrides applied:", stats["overrides_applied"])
+    if stats["alpha_boss_conflicts"]:
+        print("\nALPHA+BOSS CONFLICTS (alpha multipliers applied)")
+        for name in sorted(set(stats["alpha_boss_conflicts"])):
+            print(f"  {name}")
+    for kind in MULTIPLIERS.keys():
+        print(f"\n{kind.upper()}")
+        for label in STAT_LABELS:
+            print(f"  {label} changed: {stats['changed'][kind][label]}")
+            print(f"  {label} low-value base applied: {stats['low_value_base_applied'][kind][label]}")
+            print(f"  {label} skipped (non-numeric): {stats['skipped_non_numeric'][kind][label]}")
+
+
+def build_output_template(data: dict, rows: list[dict]) -> tuple[list[str], list[dict]]:
+    """Serialize the document once with placeholders in every scaled slot.
+
+    Returns the text segments around the placeholders and the property dicts
+    that fill them, so rewriting the output after a config change only has to
+    encode the scaled numbers instead of the whole table.
+    """
+    slots = [prop for row in rows for prop, _, val in row["props"] if isinstance(val, (int, float))]
+    scaled_values = [prop["Value"] for prop in slots]
+
+    for idx, prop in enumerate(slots):
+        prop["Value"] = SLOT_MARKER.format(idx)
+    try:
+        text = json.dumps(data, indent=2)
+    finally:
+        for prop, value in zip(slots, scaled_values):
+            prop["Value"] = value
+
+    parts = SLOT_RE.split(text)
+    segments = parts[0::2]
+    order = [slots[int(idx)] for idx in parts[1::2]]
+    return segments, order
+
+
+def render_output(segments: list[str], order: list[dict]) -> str:
+    pieces = [segments[0]]
+    for prop, segment in zip(order, segments[1:]):
+        pieces.append(json.dumps(prop["Value"]))
+        pieces.append(segment)
+    return "".join(pieces)
+
+
+def write_output(output_path: Path, text: str) -> bool:
+    return write_text(output_path, text)
+
+
+def load_input(input_path: Path) -> tuple[dict, list[dict]]:
+    data = load_json(input_path)
+    resolver = NameResolver()
+    rows = collect_enemy_rows(data, resolver)
+    report_names(resolver, input_path)
+    return data, rows
+
+
+def watch(
+    input_path: Path,
+    output_path: Path,
+    config_path: Path | None,
+    interval: float,
+    data: dict,
+    rows: list[dict],
+    intermediate: bool = False,
+) -> None:
+    segments, order = build_output_template(data, rows)
+
+    def on_change(changed: set[Path]) -> None:
+        nonlocal data, rows, segments, order
+        start = time.perf_counter()
+
+        if config_path is not None and config_path in changed:
+            apply_config(load_config(config_path) if config_path.exists() else {})
+            print(f"Reloaded config: {config_path}")
+
+        if input_path in changed:
+            data, rows = load_input(input_path)
+            segments, order = build_output_template(data, rows)
+            print(f"Reloaded input: {input_path}")
+
+        stats = scale_rows(rows, verbose=False)
+        if intermediate:
+            write_intermediate(output_path, data)
         else:
-            stats["skipped_non_numeric"][kind][label] += 1
-            # print(f"SKIP   [{asset_name}] ({kind}) {label}: non-numeric Value {val!r}")
-            print(f"SKIP   [{enemy_name}] ({reason}) {label}: non-numeric Value {val!r}")
-
-print("\nSUMMARY")
-print("-------")
-print("Missing scaling struct:", stats["missing_scaling"])
-print("Overrides applied:", stats["overrides_applied"])
-if stats["alpha_boss_conflicts"]:
-    print("\nALPHA+BOSS CONFLICTS (alpha multipliers applied)")
-    for name in sorted(set(stats["alpha_boss_conflicts"])):
-        print(f"  {name}")
-for kind in MULTIPLIERS.keys():
-    print(f"\n{kind.upper()}")
-    for label in ("HP", "ATK", "Speed", "Chroma", "XP"):
-        print(f"  {label} changed: {stats['changed'][kind][label]}")
-        print(f"  {label} low-value base applied: {stats['low_value_base_applied'][kind][label]}")
-        print(f"  {label} skipped (non-numeric): {stats['skipped_non_numeric'][kind][label]}")
-
-OUTFILE.parent.mkdir(parents=True, exist_ok=True)
-with OUTFILE.open("w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+            write_output(output_path, render_output(segments, order))
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"Rewrote {output_path} in {elapsed_ms:.0f} ms "
+            f"(overrides={stats['overrides_applied']}, missing scaling={stats['missing_scaling']})"
+        )
+
+    watched = [input_path] + ([config_path] if config_path is not None else [])
+    watch_files(watched, on_change, interval)
+
+
+def load_sweep(path: Path) -> list[dict]:
+    """Read multiplier sets from a sweep file.
+
+    "sets" lists partial MULTIPLIERS overrides ({"default": {"HP": 3.5}});
+    "grid" maps "category.stat" to candidate values and adds one set per
+    combination. Only existing categories can be swept, so the category of
+    every enemy stays the same across sets.
+    """
+    with path.open("r", encoding="utf-8") as f:
+        sweep = json.load(f)
+
+    if not isinstance(sweep, dict) or not set(sweep) <= {"sets", "grid"}:
+        raise ValueError(f"Sweep file must be a JSON object with 'sets' and/or 'grid': {path}")
+
+    sets = [copy.deepcopy(entry) for entry in sweep.get("sets", [])]
+    grid = sweep.get("grid", {})
+    axes = []
+    for key, values in grid.items():
+        kind, _, label = key.partition(".")
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"Sweep grid '{key}' must be a non-empty list of values")
+        axes.append([(kind, label, value) for value in values])
+    for combination in itertools.product(*axes) if axes else ():
+        entry: dict = {}
+        for kind, label, value in combination:
+            entry.setdefault(kind, {})[label] = value
+        sets.append(entry)
+
+    if not sets:
+        raise ValueError(f"Sweep file defines no multiplier sets: {path}")
+    for idx, entry in enumerate(sets):
+        for kind, mults in entry.items():
+            if kind not in MULTIPLIERS:
+                raise ValueError(f"Sweep set {idx} uses unknown category '{kind}'")
+            unknown = set(mults) - set(STAT_LABELS)
+            if unknown:
+                raise ValueError(f"Sweep set {idx} uses unknown stats for '{kind}': {sorted(unknown)}")
+    return sets
+
+
+def merged_multipliers(entry: dict) -> dict:
+    merged = copy.deepcopy(MULTIPLIERS)
+    for kind, mults in entry.items():
+        merged[kind].update(mults)
+    return merged
+
+
+def build_sweep_base(rows: list[dict]) -> tuple[list[str], array, int]:
+    """Pack what every set shares into one flat array of doubles.
+
+    Layout, for E enemy rows: E x len(STAT_LABELS) values to scale (after the
+    low-value base, NaN when missing or non-numeric), the same shape of
+    ENEMY_OVERRIDES multipliers (NaN when none) and E category indexes (-1 for
+    rows without a scaling struct). Also returns the category order and how
+    many values took the low-value base.
+    """
+    categories = list(MULTIPLIERS)
+    values = array("d", [math.nan]) * (len(rows) * len(STAT_LABELS))
+    overrides = array("d", [math.nan]) * (len(rows) * len(STAT_LABELS))
+    kinds = array("d", [-1.0]) * len(rows)
+    low_value_base = 0
+
+    for idx, row in enumerate(rows):
+        if not row["has_scaling"]:
+            continue
+        kind, _ = CLASSIFIER.classify(row["name"], row["is_boss"], row["archetype_kind"])
+        kinds[idx] = categories.index(kind)
+        enemy_overrides = ENEMY_OVERRIDES.get(row["name"], {})
+        for _, label, val in row["props"]:
+            if not isinstance(val, (int, float)):
+                continue
+            slot = idx * len(STAT_LABELS) + STAT_LABELS.index(label)
+            values[slot], used_low_value_base = get_value_to_scale(label, float(val))
+            low_value_base += used_low_value_base
+            if label in enemy_overrides:
+                overrides[slot] = float(enemy_overrides[label])
+
+    return categories, values + overrides + kinds, low_value_base
+
+
+# Set by the sweep worker initializer: a view on the shared base block.
+_SWEEP_BASE = None
+
+
+def init_sweep_worker(block_name: str, row_count: int, decimals: int) -> None:
+    global _SWEEP_BASE
+    block = shared_memory.SharedMemory(name=block_name)
+    view = block.buf.cast("d")
+    stride = row_count * len(STAT_LABELS)
+    _SWEEP_BASE = (block, view[:stride], view[stride : 2 * stride], view[2 * stride :], decimals)
+
+
+def sweep_set(multiplier_table: list[list[float]]) -> dict:
+    """Scale the shared base with one set; multiplier_table[category][stat].
+
+    Returns (count, min, median, max) per category and stat, plus how many
+    values ENEMY_OVERRIDES decided.
+    """
+    _, values, overrides, kinds, decimals = _SWEEP_BASE
+    width = len(STAT_LABELS)
+    scaled = [[[] for _ in range(width)] for _ in multiplier_table]
+    overrides_hit = 0
+
+    for idx, kind in enumerate(kinds):
+        if kind < 0:
+            continue
+        mults = multiplier_table[int(kind)]
+        for col in range(width):
+            value = values[idx * width + col]
+            if value != value:
+                continue
+            override = overrides[idx * width + col]
+            if override == override:
+                overrides_hit += 1
+                scaled[int(kind)][col].append(round(value * override, decimals))
+            else:
+                scaled[int(kind)][col].append(round(value * mults[col], decimals))
+
+    distributions = [
+        [
+            (len(vals), min(vals), round(statistics.median(vals), decimals), max(vals))
+            if vals
+            else (0, None, None, None)
+            for vals in cols
+        ]
+        for cols in scaled
+    ]
+    return {"distributions": distributions, "overrides_hit": overrides_hit}
+
+
+def describe_sweep_set(entry: dict) -> str:
+    parts = [f"{kind}.{label}={value}" for kind, mults in entry.items() for label, value in mults.items()]
+    return " ".join(parts) or "(current MULTIPLIERS)"
+
+
+def sweep_output_path(output_path: Path, idx: int) -> Path:
+    stem, dot, rest = output_path.name.partition(".")
+    return output_path.with_name(f"{stem}.set{idx}{dot}{rest}")
+
+
+def run_sweep(args: argparse.Namespace, config_overrides: dict, data: dict, rows: list[dict]) -> int:
+    sets = load_sweep(args.sweep)
+    categories, base, low_value_base = build_sweep_base(rows)
+    tables = [
+        [[float(merged[kind][label]) for label in STAT_LABELS] for kind in categories]
+        for merged in map(merged_multipliers, sets)
+    ]
+
+    start = time.perf_counter()
+    block = shared_memory.SharedMemory(create=True, size=max(base.itemsize * len(base), 1))
+    try:
+        block.buf[: base.itemsize * len(base)] = base.tobytes()
+        jobs = max(1, min(args.jobs, len(sets)))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_sweep_worker,
+            initargs=(block.name, len(rows), ROUND_DECIMALS),
+        ) as pool:
+            results = list(pool.map(sweep_set, tables, chunksize=max(1, len(sets) // (jobs * 4))))
+    finally:
+        block.close()
+        block.unlink()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Only categories/stats whose multiplier differs between sets are listed.
+    varied = {
+        (k, col)
+        for k in range(len(categories))
+        for col in range(len(STAT_LABELS))
+        if len({table[k][col] for table in tables}) > 1
+    } or {(k, col) for k in range(len(categories)) for col in range(len(STAT_LABELS))}
+
+    print(f"Swept {len(sets)} multiplier sets over {len(rows)} enemies in {elapsed_ms:.0f} ms ({jobs} workers)")
+    print(f"Low-value base applied: {low_value_base}")
+    for idx, (entry, result) in enumerate(zip(sets, results)):
+        print(f"\nSET {idx}: {describe_sweep_set(entry)} (overrides hit: {result['overrides_hit']})")
+        for k, kind in enumerate(categories):
+            cols = [col for col in range(len(STAT_LABELS)) if (k, col) in varied]
+            stats = result["distributions"][k]
+            if not cols or stats[0][0] == 0 and all(stats[col][0] == 0 for col in cols):
+                continue
+            summary = "  ".join(
+                f"{STAT_LABELS[col]} {stats[col][1]}/{stats[col][2]}/{stats[col][3]}"
+                for col in cols
+                if stats[col][0]
+            )
+            print(f"  {kind} (n={max(count for count, *_ in stats)}): {summary}")
+
+    if args.sweep_csv is not None:
+        args.sweep_csv.parent.mkdir(parents=True, exist_ok=True)
+        with args.sweep_csv.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["set", "multipliers", "category", "stat", "count", "min", "median", "max", "overrides_hit"]
+            )
+            for idx, (entry, result) in enumerate(zip(sets, results)):
+                description = describe_sweep_set(entry)
+                for k, kind in enumerate(categories):
+                    for col, (count, low, mid, high) in enumerate(result["distributions"][k]):
+                        if count:
+                            writer.writerow(
+                                [idx, description, kind, STAT_LABELS[col], count, low, mid, high,
+                                 result["overrides_hit"]]
+                            )
+        print(f"\nWrote {args.sweep_csv}")
+
+    if args.write_sets:
+        # Chosen sets go through the regular scaling pass, so each document is
+        # exactly what scale_enemies.py would write with that MULTIPLIERS.
+        segments, order = build_output_template(data, rows)
+        for idx in args.write_sets:
+            if not 0 <= idx < len(sets):
+                print(f"No sweep set {idx}; there are {len(sets)}")
+                continue
+            apply_config({**config_overrides, "MULTIPLIERS": merged_multipliers(sets[idx])})
+            scale_rows(rows, verbose=False)
+            output_path = sweep_output_path(args.output, idx)
+            write_output(output_path, render_output(segments, order))
+            print(f"Wrote set {idx} -> {output_path}")
+            apply_config(config_overrides)
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Scale S_EnemyScalingMultipliers values in DT_jRPG_Enemies by enemy category."
+    )
+    parser.add_argument("--input", type=Path, default=INFILE, help=f"Input JSON file (default: {INFILE})")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Output JSON file (default: {OUTFILE}, or {INTERMEDIATE_OUTFILE} with --intermediate)",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help=(
+            "Optional JSON file overriding the settings at the top of this script "
+            f"({', '.join(CONFIG_KEYS)})."
+        ),
+    )
+    parser.add_argument(
+        "--intermediate",
+        action="store_true",
+        help=(
+            "Write --output in the compact intermediate format instead of JSON. Only for hand-off to "
+            "tower/copy_modded_enemy_values.py; UAssetGUI cannot read it."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the input parsed in memory and rewrite the output whenever the input or --config changes.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="Polling interval in seconds for --watch (default: 0.05)",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=Path,
+        default=None,
+        help="JSON file with multiplier 'sets' and/or a 'grid' to compare without writing the table for each.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --sweep (default: CPU count)",
+    )
+    parser.add_argument(
+        "--sweep-csv",
+        type=Path,
+        default=None,
+        help="With --sweep: write every set's per-category stat distributions to this CSV",
+    )
+    parser.add_argument(
+        "--write-sets",
+        type=lambda text: [int(idx) for idx in text.split(",")],
+        default=[],
+        help="With --sweep: comma-separated set numbers to write full documents for (next to --output)",
+    )
+    args = parser.parse_args(argv)
+    if args.output is None:
+        # --sweep writes JSON documents even with --intermediate.
+        args.output = INTERMEDIATE_OUTFILE if args.intermediate and args.sweep is None else OUTFILE
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if not args.watch and args.sweep is None:
+        remote_exit = run_in_daemon("scale_enemies", argv)
+        if remote_exit is not None:
+            return remote_exit
+
+    # Always reset: inside the asset daemon a previous run may have applied another config.
+    config_overrides = load_config(args.config) if args.config is not None else {}
+    apply_config(config_overrides)
+
+    data, rows = load_input(args.input)
+    if args.sweep is not None:
+        return run_sweep(args, config_overrides, data, rows)
+    stats = scale_rows(rows)
+    print_summary(stats)
+
+    if args.intermediate:
+        write_intermediate(args.output, data)
+    else:
+        write_json(args.output, data, indent=2)
+
+    if args.watch:
+        watch(args.input, args.output, args.config, args.interval, data, rows, args.intermediate)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,309 @@
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("simulate_balance.py needs NumPy (pip install numpy)") from None
+
+import scale_enemies
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# scale_hard_from_level imports its difficulty/ siblings directly.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "difficulty"))
+
+import scale_hard_from_level
+from common.row_models import ArchetypeLevelRow, decode_rows
+from common.uasset_json import load_document
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DIFFICULTY_INPUT_DIR = SCRIPT_DIR.parent / "difficulty" / "input"
+DIFFICULTY_DIRS = {
+    "easy": "Easy_Difficulty",
+    "normal": "Normal_Difficulty",
+    "hard": "Hard_Difficulty",
+}
+ARCHETYPE_PREFIX = "DT_EnemyArchetype_"
+DIFFICULTY_SUFFIXES = ("_Easy", "_Hard")
+
+# Stats taken from the archetype rows, in array order, with the scale_enemies label they combine with.
+SIM_STATS = ("HP", "ATK", "Speed", "XP")
+ARCHETYPE_FIELDS = {
+    "HP": "hp",
+    "ATK": "attack",
+    "Speed": "speed",
+    "XP": "experience",
+}
+
+# ---- Party model ----
+# Whole-party values at a few levels, interpolated geometrically in between
+# (and held flat past the ends). Enemies are assumed to be at the party level.
+# Defaults make a vanilla Hard "Regular" enemy last about 2.5 rounds and hit
+# for about 8% of the party's HP.
+PARTY_MODEL = {
+    "level": [1, 10, 25, 40, 55, 70, 85, 99],
+    # Damage the whole party deals per round (every member acts once).
+    "damage_per_round": [60, 430, 2300, 6200, 17000, 41000, 87000, 150000],
+    # Total party HP.
+    "hp": [560, 2900, 13000, 27000, 50000, 75000, 110000, 170000],
+    # Speed of a party member; enemies act speed / party speed times per round.
+    "speed": [200, 300, 528, 805, 1115, 1452, 1811, 2165],
+}
+SECONDS_PER_ROUND = 20.0
+# Time spent per fight outside the rounds (transitions, rewards).
+FIGHT_OVERHEAD_SECONDS = 15.0
+MAX_LEVEL = 99
+REPORT_LEVELS = (1, 10, 25, 40, 55, 70, 85, 99)
+
+
+def archetype_type(file_name: str) -> str | None:
+    if not file_name.startswith(ARCHETYPE_PREFIX) or not file_name.endswith(".json"):
+        return None
+    name = file_name[len(ARCHETYPE_PREFIX) : -len(".json")]
+    for suffix in DIFFICULTY_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name or None
+
+
+def archetype_stats(exports: list[dict], max_level: int) -> np.ndarray:
+    """Stats per level as a (max_level + 1, len(SIM_STATS)) array; NaN where a level has no row."""
+    stats = np.full((max_level + 1, len(SIM_STATS)), np.nan)
+    for export in exports:
+        table = export.get("Table")
+        rows = table.get("Data") if isinstance(table, dict) else None
+        if not isinstance(rows, list):
+            continue
+        for row in decode_rows(ArchetypeLevelRow, rows):
+            level = int(row.level) if isinstance(row.level, (int, float)) else None
+            if level is None or not 0 <= level <= max_level:
+                continue
+            for column, stat in enumerate(SIM_STATS):
+                value = getattr(row, ARCHETYPE_FIELDS[stat])
+                if isinstance(value, (int, float)):
+                    stats[level, column] = value
+    return stats
+
+
+def load_archetypes(directory: Path, max_level: int, curves: dict | None) -> tuple[list[str], np.ndarray]:
+    """Archetype type names and their stacked (types, levels, stats) array.
+
+    With curves (scale_hard_from_level's merged settings), each table is
+    level-scaled in memory first, the same way that script writes it.
+    """
+    names = []
+    tables = []
+    for path in sorted(directory.glob(f"{ARCHETYPE_PREFIX}*.json")):
+        enemy_type = archetype_type(path.name)
+        if enemy_type is None:
+            continue
+        exports = load_document(path, ("Exports",)).get("Exports")
+        if not isinstance(exports, list):
+            continue
+        if curves and curves.get(enemy_type):
+            exports, _, _ = scale_hard_from_level.scale_exports(exports, curves[enemy_type])
+        names.append(enemy_type)
+        tables.append(archetype_stats(exports, max_level))
+    if not tables:
+        raise FileNotFoundError(f"No {ARCHETYPE_PREFIX}*.json tables in: {directory}")
+    return names, np.stack(tables)
+
+
+def enemy_multipliers(rows: list[dict], scaled: bool) -> np.ndarray:
+    """Per-enemy scaling multipliers as an (enemies, len(SIM_STATS)) array.
+
+    scaled=False reads the values the table shipped with, scaled=True the ones
+    scale_rows() wrote; missing or non-numeric entries count as 1.
+    """
+    multipliers = np.ones((len(rows), len(SIM_STATS)))
+    for index, row in enumerate(rows):
+        for prop, label, original in row["props"]:
+            if label not in SIM_STATS:
+                continue
+            value = prop.get("Value") if scaled else original
+            if isinstance(value, (int, float)):
+                multipliers[index, SIM_STATS.index(label)] = value
+    return multipliers
+
+
+def party_curves(levels: np.ndarray) -> dict[str, np.ndarray]:
+    model_levels = np.array(PARTY_MODEL["level"], dtype=float)
+    return {
+        key: np.exp(np.interp(levels, model_levels, np.log(np.array(values, dtype=float))))
+        for key, values in PARTY_MODEL.items()
+        if key != "level"
+    }
+
+
+def simulate(base: np.ndarray, enemy_types: np.ndarray, multipliers: np.ndarray, party: dict) -> dict[str, np.ndarray]:
+    """Fight metrics for every enemy at every level, each an (enemies, levels) array."""
+    stats = base[enemy_types] * multipliers[:, np.newaxis, :]
+    hp, atk, speed, xp = (stats[..., SIM_STATS.index(stat)] for stat in SIM_STATS)
+    rounds = hp / party["damage_per_round"]
+    enemy_actions = rounds * speed / party["speed"]
+    seconds = rounds * SECONDS_PER_ROUND + FIGHT_OVERHEAD_SECONDS
+    return {
+        "rounds": rounds,
+        "damage_taken": enemy_actions * atk / party["hp"],
+        "xp_per_minute": xp * 60.0 / seconds,
+    }
+
+
+def format_change(before: float, after: float, fmt: str) -> str:
+    if not np.isfinite(before) or not np.isfinite(after):
+        return "n/a"
+    ratio = f" (x{after / before:.2f})" if before else ""
+    return f"{before:{fmt}} -> {after:{fmt}}{ratio}"
+
+
+def print_report(
+    kinds: list[str],
+    enemy_types: np.ndarray,
+    levels: np.ndarray,
+    vanilla: dict,
+    modded: dict,
+) -> None:
+    report_columns = [int(np.searchsorted(levels, level)) for level in REPORT_LEVELS if level in levels]
+    for type_index, kind in enumerate(kinds):
+        members = enemy_types == type_index
+        if not np.any(members):
+            continue
+        print(f"\n{kind.upper()} ({int(members.sum())} enemies, medians)")
+        print(f"  {'Level':>5}  {'Rounds to kill':<26}{'Damage taken (% party HP)':<30}XP per minute")
+        for column in report_columns:
+            with np.errstate(all="ignore"):
+                medians = {
+                    key: (np.nanmedian(vanilla[key][members, column]), np.nanmedian(modded[key][members, column]))
+                    for key in ("rounds", "damage_taken", "xp_per_minute")
+                }
+            rounds = format_change(*medians["rounds"], ".1f")
+            damage = format_change(*(value * 100 for value in medians["damage_taken"]), ".0f")
+            xp_rate = format_change(*medians["xp_per_minute"], ".0f")
+            print(f"  {int(levels[column]):>5}  {rounds:<26}{damage:<30}{xp_rate}")
+
+        wipes = int(np.sum(modded["damage_taken"][members] >= 1.0))
+        if wipes:
+            vanilla_wipes = int(np.sum(vanilla["damage_taken"][members] >= 1.0))
+            print(f"  Enemy/level pairs dealing >= 100% party HP: {wipes} (vanilla {vanilla_wipes})")
+
+
+def write_csv(path: Path, names: list[str], kinds: list[str], enemy_types, levels, vanilla: dict, modded: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        header = ["Enemy", "Archetype", "Level"]
+        for key in ("rounds", "damage_taken", "xp_per_minute"):
+            header += [f"{key}_vanilla", f"{key}_modded"]
+        writer.writerow(header)
+        for enemy_index, name in enumerate(names):
+            for column, level in enumerate(levels):
+                line = [name, kinds[enemy_types[enemy_index]], int(level)]
+                for key in ("rounds", "damage_taken", "xp_per_minute"):
+                    line += [f"{vanilla[key][enemy_index, column]:.4g}", f"{modded[key][enemy_index, column]:.4g}"]
+                writer.writerow(line)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Estimate time-to-kill, damage taken and XP per minute per enemy and level, vanilla vs scaled."
+    )
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=scale_enemies.INFILE,
+        help=f"DT_jRPG_Enemies JSON (default: {scale_enemies.INFILE})",
+    )
+    parser.add_argument("--config", type=Path, default=None, help="scale_enemies.py --config overrides to simulate")
+    parser.add_argument(
+        "--difficulty",
+        choices=sorted(DIFFICULTY_DIRS),
+        default="hard",
+        help="Archetype tables from difficulty/input to combine with (default: hard)",
+    )
+    parser.add_argument(
+        "--archetype-dir",
+        type=Path,
+        default=None,
+        help="Read DT_EnemyArchetype_*.json from this folder instead (e.g. a scaled output folder)",
+    )
+    parser.add_argument(
+        "--level-scaling",
+        action="store_true",
+        help="Apply scale_hard_from_level.py's type multipliers/curves to the archetype tables in memory",
+    )
+    parser.add_argument(
+        "--level-config",
+        type=Path,
+        default=None,
+        help="With --level-scaling: scale_hard_from_level.py --config overrides",
+    )
+    parser.add_argument(
+        "--max-level",
+        type=int,
+        default=MAX_LEVEL,
+        help=f"Highest level simulated (default: {MAX_LEVEL})",
+    )
+    parser.add_argument("--csv", type=Path, default=None, help="Write every enemy/level result to this CSV")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    start = time.perf_counter()
+
+    scale_enemies.apply_config(scale_enemies.load_config(args.config) if args.config is not None else {})
+    _, rows = scale_enemies.load_input(args.input)
+    vanilla_multipliers = enemy_multipliers(rows, scaled=False)
+    scale_enemies.scale_rows(rows, verbose=False)
+    modded_multipliers = enemy_multipliers(rows, scaled=True)
+
+    curves = None
+    if args.level_scaling:
+        level_settings = (
+            scale_hard_from_level.load_config(args.level_config)
+            if args.level_config is not None
+            else (
+                scale_hard_from_level.MIN_LEVEL,
+                scale_hard_from_level.TYPE_STAT_MULTIPLIERS,
+                scale_hard_from_level.TYPE_STAT_CURVES,
+            )
+        )
+        scale_hard_from_level.validate_type_stat_multipliers(level_settings[1])
+        scale_hard_from_level.validate_type_stat_curves(level_settings[2])
+        curves = scale_hard_from_level.build_curves(*level_settings)
+
+    archetype_dir = args.archetype_dir or DIFFICULTY_INPUT_DIR / DIFFICULTY_DIRS[args.difficulty]
+    kinds, tables = load_archetypes(archetype_dir, args.max_level, curves)
+    # Vanilla numbers use the unscaled tables, so --level-scaling shows up in the comparison.
+    vanilla_tables = load_archetypes(archetype_dir, args.max_level, None)[1] if curves else tables
+
+    kind_index = {kind.lower(): index for index, kind in enumerate(kinds)}
+    matched = [index for index, row in enumerate(rows) if row["archetype_kind"] in kind_index]
+    unmatched = len(rows) - len(matched)
+    if not matched:
+        print(f"No enemy archetypes match the tables in {archetype_dir}")
+        return 1
+    enemy_types = np.array([kind_index[rows[index]["archetype_kind"]] for index in matched])
+    names = [rows[index]["name"] for index in matched]
+
+    levels = np.arange(1, args.max_level + 1)
+    party = party_curves(levels)
+    vanilla = simulate(vanilla_tables[:, 1:], enemy_types, vanilla_multipliers[matched], party)
+    modded = simulate(tables[:, 1:], enemy_types, modded_multipliers[matched], party)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Simulated {len(matched)} enemies x {len(levels)} levels against {archetype_dir} in {elapsed_ms:.0f} ms")
+    if unmatched:
+        print(f"Skipped {unmatched} enemies without a matching archetype table")
+    print_report(kinds, enemy_types, levels, vanilla, modded)
+
+    if args.csv is not None:
+        write_csv(args.csv, names, kinds, enemy_types, levels, vanilla, modded)
+        print(f"\nWrote {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
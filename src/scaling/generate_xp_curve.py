@@ -0,0 +1,283 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("generate_xp_curve.py needs NumPy (pip install numpy)") from None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import write_document
+from common.row_models import LevelRow, NameResolver, decode_rows, report_names
+from common.uasset_json import load_document
+from level_ranges import build_ranges, write_ranges
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_INPUT = SCRIPT_DIR / "input" / "DT_jRPG_Levels.uasset.json"
+OUTPUT_DIR = SCRIPT_DIR.parent.parent / "output" / "xp_scaling"
+DEFAULT_TABLE_OUTPUT = OUTPUT_DIR / "Curve-DT_jRPG_Levels.uasset.json"
+DEFAULT_RANGES_OUTPUT = OUTPUT_DIR / "ranges.json"
+
+# Names a formula may use besides `level` and its own parameters.
+FORMULA_NAMES = {
+    "abs": np.abs,
+    "ceil": np.ceil,
+    "exp": np.exp,
+    "floor": np.floor,
+    "log": np.log,
+    "log2": np.log2,
+    "log10": np.log10,
+    "maximum": np.maximum,
+    "minimum": np.minimum,
+    "sqrt": np.sqrt,
+    "where": np.where,
+    "pi": np.pi,
+    "e": np.e,
+}
+INTERPOLATIONS = {"linear", "log"}
+# How many candidates are listed when several are evaluated.
+DEFAULT_TOP = 10
+
+
+def read_xp_column(data: dict, resolver: NameResolver | None = None) -> list[tuple[int, dict]]:
+    """(level, XP property) for every S_jRPG_Level row, sorted by level."""
+    column: list[tuple[int, dict]] = []
+    for export in data.get("Exports", []):
+        table = export.get("Table")
+        if not isinstance(table, dict):
+            continue
+        for row in decode_rows(LevelRow, table.get("Data", []), resolver):
+            try:
+                level = int(row.row.get("Name"))
+            except (TypeError, ValueError):
+                continue
+            if isinstance(row.experience_needed, int):
+                column.append((level, row.prop("experience_needed")))
+    column.sort(key=lambda item: item[0])
+    return column
+
+
+def load_curve_spec(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as handle:
+        spec = json.load(handle)
+    if not isinstance(spec, dict):
+        raise ValueError(f"Curve file must be a JSON object: {path}")
+    return spec
+
+
+def parse_param(text: str) -> tuple[str, list[float]]:
+    """NAME=V or NAME=V1,V2,... or NAME=START:STOP:COUNT (inclusive linspace)."""
+    name, sep, values = text.partition("=")
+    if not sep or not name.isidentifier():
+        raise ValueError(f"Invalid --param {text!r}; expected NAME=VALUES")
+    if values.count(":") == 2:
+        start, stop, count = values.split(":")
+        return name, np.linspace(float(start), float(stop), int(count)).tolist()
+    return name, [float(value) for value in values.split(",")]
+
+
+def candidate_grid(params: dict) -> tuple[list[str], np.ndarray]:
+    """Every combination of the parameter values, one candidate per row."""
+    names = sorted(params)
+    axes = []
+    for name in names:
+        values = params[name]
+        axes.append(values if isinstance(values, list) else [values])
+    if not names:
+        return names, np.empty((1, 0))
+    return names, np.array(list(itertools.product(*axes)), dtype=float)
+
+
+def evaluate_formula(formula: str, names: list[str], grid: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """Evaluate the formula for all candidates and levels at once -> (candidates, levels)."""
+    namespace = dict(FORMULA_NAMES)
+    namespace["level"] = levels[np.newaxis, :]
+    for column, name in enumerate(names):
+        if name in namespace:
+            raise ValueError(f"Parameter name {name!r} shadows a formula name")
+        namespace[name] = grid[:, column, np.newaxis]
+    with np.errstate(all="ignore"):
+        values = eval(formula, {"__builtins__": {}}, namespace)
+    return np.broadcast_to(np.asarray(values, dtype=float), (len(grid), len(levels)))
+
+
+def evaluate_points(points: list, interpolation: str, levels: np.ndarray) -> np.ndarray:
+    """Interpolate control points [[level, xp], ...] over every level -> (1, levels)."""
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation {interpolation!r}; use one of {sorted(INTERPOLATIONS)}")
+    ordered = sorted((float(level), float(xp)) for level, xp in points)
+    xs = np.array([level for level, _ in ordered])
+    ys = np.array([xp for _, xp in ordered])
+    if len(xs) < 2 or np.any(np.diff(xs) <= 0):
+        raise ValueError("Control points need at least two distinct levels")
+    if levels.min() < xs[0] or levels.max() > xs[-1]:
+        raise ValueError(
+            f"Control points cover levels {xs[0]:g}-{xs[-1]:g}, the table has {levels.min()}-{levels.max()}"
+        )
+    if interpolation == "log":
+        if np.any(ys <= 0):
+            raise ValueError("Log interpolation needs positive XP at every control point")
+        return np.exp(np.interp(levels, xs, np.log(ys)))[np.newaxis, :]
+    return np.interp(levels, xs, ys)[np.newaxis, :]
+
+
+def evaluate_spec(spec: dict, levels: np.ndarray) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Return parameter names, the candidate grid and the XP matrix for a curve spec."""
+    if ("formula" in spec) == ("points" in spec):
+        raise ValueError("Curve spec needs exactly one of 'formula' or 'points'")
+    if "points" in spec:
+        return [], np.empty((1, 0)), evaluate_points(spec["points"], spec.get("interpolation", "log"), levels)
+    names, grid = candidate_grid(spec.get("params", {}))
+    return names, grid, evaluate_formula(spec["formula"], names, grid, levels)
+
+
+def load_targets(csv_path: Path | None, pairs: list[str]) -> dict[int, float]:
+    """Target XP per level, from a Level,XP CSV and/or LEVEL=XP arguments."""
+    targets: dict[int, float] = {}
+    if csv_path is not None:
+        with csv_path.open("r", newline="", encoding="utf-8") as handle:
+            for row in csv.DictReader(handle):
+                level_raw = (row.get("Level") or "").strip()
+                xp_raw = (row.get("XP") or "").strip()
+                if level_raw and xp_raw:
+                    targets[int(level_raw)] = float(xp_raw)
+    for pair in pairs:
+        level, sep, xp = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid --target {pair!r}; expected LEVEL=XP")
+        targets[int(level)] = float(xp)
+    return targets
+
+
+def score_candidates(xp: np.ndarray, levels: np.ndarray, targets: dict[int, float]) -> np.ndarray:
+    """RMS of log(curve / target) over the target levels; inf for unusable curves."""
+    valid = np.all(np.isfinite(xp) & (xp > 0), axis=1)
+    if not targets:
+        return np.where(valid, 0.0, np.inf)
+    positions = np.searchsorted(levels, list(targets))
+    known = (positions < len(levels)) & (levels[np.minimum(positions, len(levels) - 1)] == list(targets))
+    if not np.any(known):
+        raise ValueError("None of the target levels are in the table")
+    wanted = np.array(list(targets.values()))[known]
+    with np.errstate(all="ignore"):
+        errors = np.log(xp[:, positions[known]] / wanted)
+    scores = np.sqrt(np.mean(errors**2, axis=1))
+    return np.where(valid, scores, np.inf)
+
+
+def describe(names: list[str], values: np.ndarray) -> str:
+    return ", ".join(f"{name}={value:g}" for name, value in zip(names, values)) or "(no parameters)"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a required-XP curve from a formula or control points and compare it to DT_jRPG_Levels."
+    )
+    parser.add_argument("curve", type=Path, nargs="?", default=None, help="JSON curve spec (formula+params or points)")
+    parser.add_argument("--formula", default=None, help="Formula in `level` and parameters, e.g. 'a * level ** b'")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        help="Formula parameter: NAME=V, NAME=V1,V2,... or NAME=START:STOP:COUNT (repeatable)",
+    )
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT, help="Path to DT_jRPG_Levels.uasset.json")
+    parser.add_argument("--target-csv", type=Path, default=None, help="Level,XP CSV the candidates are scored against")
+    parser.add_argument("--target", action="append", default=[], help="Target XP as LEVEL=XP (repeatable)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"Candidates to list (default: {DEFAULT_TOP})")
+    parser.add_argument("--show-levels", action="store_true", help="Print current and new XP for every level")
+    parser.add_argument(
+        "--write-table",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_TABLE_OUTPUT,
+        default=None,
+        help=f"Write the table with the best curve's XP values (default: {DEFAULT_TABLE_OUTPUT})",
+    )
+    parser.add_argument(
+        "--write-ranges",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_RANGES_OUTPUT,
+        default=None,
+        help=f"Write best curve / current XP as ranges for scale_xp-required.py (default: {DEFAULT_RANGES_OUTPUT})",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        default=2,
+        help="Decimals kept in derived multipliers; fewer decimals give fewer ranges (default: 2)",
+    )
+    args = parser.parse_args()
+
+    if (args.curve is None) == (args.formula is None):
+        print("Give either a curve file or --formula.")
+        return 2
+    spec = load_curve_spec(args.curve) if args.curve is not None else {"formula": args.formula}
+    if args.param:
+        spec["params"] = {**spec.get("params", {}), **dict(parse_param(text) for text in args.param)}
+
+    data = load_document(args.input, sections=("Exports",))
+    resolver = NameResolver()
+    column = read_xp_column(data, resolver)
+    report_names(resolver, args.input)
+    if not column:
+        print(f"No S_jRPG_Level XP values found in {args.input}")
+        return 1
+    levels = np.array([level for level, _ in column])
+    current = np.array([prop["Value"] for _, prop in column], dtype=float)
+
+    names, grid, xp = evaluate_spec(spec, levels)
+    targets = load_targets(args.target_csv, args.target)
+    if len(xp) > 1 and not targets:
+        print(f"{len(xp)} candidates need --target or --target-csv to pick one.")
+        return 2
+
+    scores = score_candidates(xp, levels, targets)
+    order = np.argsort(scores, kind="stable")
+    if not np.isfinite(scores[order[0]]):
+        print("Every candidate produced non-finite or non-positive XP.")
+        return 1
+
+    print(f"Evaluated {len(xp)} candidate(s) over {len(levels)} levels ({levels[0]}-{levels[-1]})")
+    if targets:
+        for rank, index in enumerate(order[: args.top], start=1):
+            print(f"{rank:>3}. score={scores[index]:.4f}  {describe(names, grid[index])}")
+
+    best = np.rint(xp[order[0]]).astype(np.int64)
+    ratio = best / np.where(current > 0, current, np.nan)
+    print(f"Best: {describe(names, grid[order[0]])}")
+    print(f"- Total XP: {int(current.sum())} -> {int(best.sum())} (x{best.sum() / current.sum():.3f})")
+    print(f"- Per-level ratio: min x{np.nanmin(ratio):.3f}, max x{np.nanmax(ratio):.3f}")
+    if np.any(np.diff(best) < 0):
+        print("- Warning: required XP decreases between some consecutive levels")
+    if args.show_levels:
+        for level, old, new, factor in zip(levels, current, best, ratio):
+            print(f"  {level:>4}: {int(old):>10} -> {int(new):>10} (x{factor:.3f})")
+
+    if args.write_table is not None:
+        for (_, prop), value in zip(column, best):
+            prop["Value"] = int(value)
+        write_document(args.write_table, data, end="\n")
+        print(f"Wrote table -> {args.write_table}")
+
+    if args.write_ranges is not None:
+        multipliers = [
+            (int(level), round(float(factor), args.precision))
+            for level, factor in zip(levels, ratio)
+            if np.isfinite(factor)
+        ]
+        ranges = build_ranges(multipliers)
+        write_ranges(ranges, args.write_ranges)
+        print(f"Wrote {len(ranges)} range(s) -> {args.write_ranges}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+import json
+from bisect import bisect_right
+from pathlib import Path
+
+from common.atomic_write import write_text
+
+# Above this level cap the dense per-level table costs more than it saves;
+# lookups fall back to bisect.
+DENSE_LEVEL_LIMIT = 1 << 20
+
+
+class LevelRanges:
+    """Sorted, non-overlapping level ranges with bisect lookup.
+
+    Each range is (start, end, multiplier) with an inclusive end; only the last
+    range may be open-ended (end None). Overlaps raise ValueError; uncovered
+    levels between ranges are kept in `gaps`.
+    """
+
+    def __init__(self, ranges: list[tuple[int, int | None, float]]):
+        ordered = sorted(ranges, key=lambda item: item[0])
+        problems = []
+        for previous, current in zip(ordered, ordered[1:]):
+            if previous[1] is None or previous[1] >= current[0]:
+                previous_label = f"{previous[0]}+" if previous[1] is None else f"{previous[0]}-{previous[1]}"
+                current_label = f"{current[0]}+" if current[1] is None else f"{current[0]}-{current[1]}"
+                problems.append(f"{previous_label} overlaps {current_label}")
+        if problems:
+            raise ValueError(f"Overlapping level ranges: {'; '.join(problems)}")
+
+        self.starts = [start for start, _, _ in ordered]
+        self.ends = [end for _, end, _ in ordered]
+        self.multipliers = [multiplier for _, _, multiplier in ordered]
+        self.gaps = [
+            (end + 1, next_start - 1)
+            for end, next_start in zip(self.ends, self.starts[1:])
+            if end is not None and end + 1 < next_start
+        ]
+
+    def __iter__(self):
+        return iter(zip(self.starts, self.ends, self.multipliers))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def find(self, level: int) -> float | None:
+        index = bisect_right(self.starts, level) - 1
+        if index < 0:
+            return None
+        end = self.ends[index]
+        if end is not None and level > end:
+            return None
+        return self.multipliers[index]
+
+    def dense(self, max_level: int) -> list[float | None]:
+        """Multiplier per level 0..max_level (None where no range applies)."""
+        table: list[float | None] = [None] * (max_level + 1)
+        for start, end, multiplier in self:
+            low = max(start, 0)
+            high = max_level if end is None else min(end, max_level)
+            if low <= high:
+                table[low : high + 1] = [multiplier] * (high - low + 1)
+        return table
+
+    def lookup(self, levels: list[int]):
+        """Return the fastest multiplier lookup for the given levels.
+
+        When the levels are known and bounded, a dense table is built once so
+        each lookup is a list index; otherwise each lookup bisects.
+        """
+        if levels and min(levels) >= 0 and max(levels) <= DENSE_LEVEL_LIMIT:
+            table = self.dense(max(levels))
+            return table.__getitem__
+        return self.find
+
+
+def parse_ranges(payload: list) -> LevelRanges:
+    if not isinstance(payload, list):
+        raise ValueError("Ranges file must be a JSON array of objects")
+
+    explicit_ranges: list[tuple[int, int, float]] = []
+    starts: list[tuple[int, float]] = []
+    for idx, entry in enumerate(payload, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Range entry {idx} must be an object")
+
+        multiplier = entry.get("multiplier")
+        if not isinstance(multiplier, (int, float)):
+            raise ValueError(f"Range entry {idx} must include numeric multiplier")
+
+        if "min" in entry or "max" in entry:
+            start = entry.get("min")
+            end = entry.get("max")
+            if not isinstance(start, int) or not isinstance(end, int):
+                raise ValueError(f"Range entry {idx} must include integer min/max")
+            if start > end:
+                raise ValueError(f"Range entry {idx} has min greater than max")
+            explicit_ranges.append((start, end, float(multiplier)))
+            continue
+
+        start = entry.get("start", entry.get("level"))
+        if not isinstance(start, int):
+            raise ValueError(f"Range entry {idx} must include integer start (or level)")
+        starts.append((start, float(multiplier)))
+
+    if explicit_ranges and starts:
+        raise ValueError("Do not mix min/max ranges with start-only entries")
+
+    if explicit_ranges:
+        return LevelRanges(explicit_ranges)
+
+    if not starts:
+        raise ValueError("Ranges file must include at least one entry")
+
+    starts.sort(key=lambda item: item[0])
+    duplicates = sorted({start for (start, _), (next_start, _) in zip(starts, starts[1:]) if start == next_start})
+    if duplicates:
+        raise ValueError(f"Ranges file starts more than one range at level(s): {duplicates}")
+
+    ranges: list[tuple[int, int | None, float]] = []
+    for idx, (start, multiplier) in enumerate(starts):
+        end = starts[idx + 1][0] - 1 if idx + 1 < len(starts) else None
+        ranges.append((start, end, multiplier))
+
+    return LevelRanges(ranges)
+
+
+def parse_ranges_file(ranges_path: Path) -> LevelRanges:
+    with ranges_path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return parse_ranges(payload)
+
+
+def build_ranges(levels: list[tuple[int, float]]) -> list[dict[str, float]]:
+    """Collapse sorted per-level multipliers into start-only range entries."""
+    duplicates = sorted({level for (level, _), (next_level, _) in zip(levels, levels[1:]) if level == next_level})
+    if duplicates:
+        raise ValueError(f"Level multipliers list level(s) more than once: {duplicates}")
+
+    ranges: list[dict[str, float]] = []
+    last_multiplier: float | None = None
+    for level, multiplier in levels:
+        if last_multiplier is None or multiplier != last_multiplier:
+            ranges.append({"level": level, "multiplier": multiplier})
+            last_multiplier = multiplier
+    return ranges
+
+
+def format_ranges(ranges: list[dict[str, float]]) -> str:
+    """Range entries one per line, the layout ranges.json is kept in."""
+    lines = ["["]
+    for index, item in enumerate(ranges):
+        encoded = json.dumps(item, separators=(", ", ": "))
+        suffix = "," if index < len(ranges) - 1 else ""
+        lines.append(f"  {encoded}{suffix}")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def write_ranges(ranges: list[dict[str, float]], ranges_path: Path) -> bool:
+    return write_text(ranges_path, format_ranges(ranges))
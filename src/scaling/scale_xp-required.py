@@ -1,60 +1,22 @@
 import argparse
 import csv
+import hashlib
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-HARDCODED_OUTPUT_DIR = Path(r"C:\Users\giraldiego\Desktop\code\encounters_overhaul\output\xp_scaling")
-
-
-def parse_ranges_file(ranges_path: Path) -> list[tuple[int, int | None, float]]:
-    with ranges_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-
-    if not isinstance(payload, list):
-        raise ValueError("Ranges file must be a JSON array of objects")
-
-    explicit_ranges: list[tuple[int, int, float]] = []
-    starts: list[tuple[int, float]] = []
-    for idx, entry in enumerate(payload, start=1):
-        if not isinstance(entry, dict):
-            raise ValueError(f"Range entry {idx} must be an object")
-
-        multiplier = entry.get("multiplier")
-        if not isinstance(multiplier, (int, float)):
-            raise ValueError(f"Range entry {idx} must include numeric multiplier")
-
-        if "min" in entry or "max" in entry:
-            start = entry.get("min")
-            end = entry.get("max")
-            if not isinstance(start, int) or not isinstance(end, int):
-                raise ValueError(f"Range entry {idx} must include integer min/max")
-            if start > end:
-                raise ValueError(f"Range entry {idx} has min greater than max")
-            explicit_ranges.append((start, end, float(multiplier)))
-            continue
-
-        start = entry.get("start", entry.get("level"))
-        if not isinstance(start, int):
-            raise ValueError(f"Range entry {idx} must include integer start (or level)")
-        starts.append((start, float(multiplier)))
-
-    if explicit_ranges and starts:
-        raise ValueError("Do not mix min/max ranges with start-only entries")
+from common.atomic_write import file_digest, write_document, write_json, write_text
+from common.row_models import LevelRow, NameResolver, decode_rows, report_names
+from common.uasset_json import load_document
+from level_ranges import LevelRanges, build_ranges, format_ranges, parse_ranges_file
 
-    if explicit_ranges:
-        return explicit_ranges
 
-    if not starts:
-        raise ValueError("Ranges file must include at least one entry")
-
-    starts.sort(key=lambda item: item[0])
-    ranges: list[tuple[int, int | None, float]] = []
-    for idx, (start, multiplier) in enumerate(starts):
-        end = starts[idx + 1][0] - 1 if idx + 1 < len(starts) else None
-        ranges.append((start, end, multiplier))
-
-    return ranges
+HARDCODED_OUTPUT_DIR = Path(r"C:\Users\giraldiego\Desktop\code\encounters_overhaul\output\xp_scaling")
+# Kept next to the levels CSV: the CSV digest, the ranges compiled from it and
+# the digest of the ranges.json last written from them.
+RANGES_CACHE_SUFFIX = ".ranges_cache.json"
 
 
 def load_level_adjustments(csv_path: Path) -> list[tuple[int, float]]:
@@ -71,83 +33,116 @@ def load_level_adjustments(csv_path: Path) -> list[tuple[int, float]]:
     return rows
 
 
-def build_ranges(levels: list[tuple[int, float]]) -> list[dict[str, float]]:
-    ranges: list[dict[str, float]] = []
-    last_multiplier: float | None = None
-    for level, multiplier in levels:
-        if last_multiplier is None or multiplier != last_multiplier:
-            ranges.append({"level": level, "multiplier": multiplier})
-            last_multiplier = multiplier
-    return ranges
+def text_digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8")).hexdigest()
 
 
-def write_ranges_file(levels_csv: Path, ranges_path: Path) -> None:
-    levels = load_level_adjustments(levels_csv)
-    ranges = build_ranges(levels)
+def ranges_cache_path(levels_csv: Path) -> Path:
+    return levels_csv.with_suffix(RANGES_CACHE_SUFFIX)
 
-    lines = ["["]
-    for index, item in enumerate(ranges):
-        encoded = json.dumps(item, separators=(", ", ": "))
-        suffix = "," if index < len(ranges) - 1 else ""
-        lines.append(f"  {encoded}{suffix}")
-    lines.append("]")
-    ranges_path.parent.mkdir(parents=True, exist_ok=True)
-    ranges_path.write_text("\n".join(lines), encoding="utf-8")
 
+def load_ranges_cache(cache_path: Path) -> dict:
+    try:
+        with cache_path.open("r", encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
-def find_multiplier(level: int, ranges: list[tuple[int, int | None, float]]) -> float | None:
-    for start, end, multiplier in ranges:
-        if end is None and level >= start:
-            return multiplier
-        if end is not None and start <= level <= end:
-            return multiplier
-    return None
+
+def sync_ranges_file(levels_csv: Path, ranges_path: Path, assume_yes: bool) -> str:
+    """Bring ranges.json in line with the levels CSV and describe what was done.
+
+    The CSV is only re-read when its digest changed since the last run, and
+    ranges.json is only rewritten when its content would change. The one case
+    that asks first is a ranges.json edited by hand since it was generated
+    (it no longer matches the digest the cache recorded); --yes overwrites it,
+    and without a terminal to ask on it is kept. With no cache yet there is
+    no record to compare against, so ranges.json is regenerated.
+    """
+    cache_path = ranges_cache_path(levels_csv)
+    cache = load_ranges_cache(cache_path)
+    try:
+        csv_digest = file_digest(levels_csv).hex()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Levels CSV not found: {levels_csv}") from None
+
+    if cache.get("csv_digest") == csv_digest and isinstance(cache.get("ranges"), list):
+        ranges = cache["ranges"]
+        status = "cached"
+    else:
+        ranges = build_ranges(load_level_adjustments(levels_csv))
+        status = "generated"
+
+    text = format_ranges(ranges)
+    new_digest = text_digest(text)
+    try:
+        current_digest = file_digest(ranges_path).hex()
+    except FileNotFoundError:
+        current_digest = None
+
+    if current_digest == new_digest:
+        result = "up to date" if status == "cached" else f"unchanged after regenerating from {levels_csv}"
+    elif current_digest is not None and cache.get("ranges_digest") not in (None, current_digest):
+        if not assume_yes and not sys.stdin.isatty():
+            return f"kept existing: edited since last generated from {levels_csv}; pass --yes to overwrite"
+        if not assume_yes:
+            prompt = f"{ranges_path} was edited since it was generated. Overwrite from {levels_csv}? [y/N] "
+            if input(prompt).strip().lower() not in {"y", "yes"}:
+                return "kept existing"
+        write_text(ranges_path, text)
+        result = f"generated from {levels_csv}"
+    else:
+        write_text(ranges_path, text)
+        result = f"generated from {levels_csv}" if status == "generated" else f"restored from {cache_path.name}"
+
+    cache = {"csv_digest": csv_digest, "ranges_digest": new_digest, "ranges": ranges}
+    write_json(cache_path, cache, end="\n", indent=2)
+    return result
 
 
 def scale_xp_values(
     data: dict,
     multiplier: float | None,
-    ranges: list[tuple[int, int | None, float]] | None,
+    ranges: LevelRanges | None,
     default_multiplier: float | None,
+    resolver: NameResolver | None = None,
 ) -> int:
-    count = 0
+    level_rows: list[tuple[int, LevelRow]] = []
     exports = data.get("Exports", [])
     for export in exports:
         table = export.get("Table")
         if not isinstance(table, dict):
             continue
-        for row in table.get("Data", []):
-            if not isinstance(row, dict):
-                continue
-            if row.get("StructType") != "S_jRPG_Level":
-                continue
-
-            level_name = row.get("Name")
+        for row in decode_rows(LevelRow, table.get("Data", []), resolver):
+            level_name = row.row.get("Name")
             try:
                 level = int(level_name)
             except (TypeError, ValueError):
                 continue
+            level_rows.append((level, row))
 
-            if ranges is not None:
-                row_multiplier = find_multiplier(level, ranges)
-                if row_multiplier is None:
-                    if default_multiplier is None:
-                        continue
-                    row_multiplier = default_multiplier
-            else:
-                if multiplier is None:
-                    continue
-                row_multiplier = multiplier
+    # The level cap is known once the rows are collected, so the ranges are
+    # compiled into a per-level table instead of being searched per row.
+    find_multiplier = ranges.lookup([level for level, _ in level_rows]) if ranges is not None else None
 
-            for prop in row.get("Value", []):
-                if not isinstance(prop, dict):
-                    continue
-                if prop.get("Name") != "ExperienceNeededToReachThisLevel_2_34A827D0478AC7DA58357FA2F3884115":
+    count = 0
+    for level, row in level_rows:
+        if ranges is not None:
+            row_multiplier = find_multiplier(level)
+            if row_multiplier is None:
+                if default_multiplier is None:
                     continue
-                value = prop.get("Value")
-                if isinstance(value, int):
-                    prop["Value"] = int(round(value * row_multiplier))
-                    count += 1
+                row_multiplier = default_multiplier
+        else:
+            if multiplier is None:
+                continue
+            row_multiplier = multiplier
+
+        value = row.experience_needed
+        if isinstance(value, int):
+            row.set("experience_needed", int(round(value * row_multiplier)))
+            count += 1
     return count
 
 
@@ -178,6 +173,14 @@ def main() -> None:
         action="store_true",
         help="Skip generating ranges.json and use the existing file instead",
     )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        "--no-prompt",
+        dest="yes",
+        action="store_true",
+        help="Never prompt; overwrite ranges.json from the CSV even if it was edited by hand",
+    )
     parser.add_argument(
         "--default-multiplier",
         type=float,
@@ -195,32 +198,25 @@ def main() -> None:
         default_filename = "Modded-DT_jRPG_Levels.uasset.json"
         output_path = HARDCODED_OUTPUT_DIR / default_filename
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    generated_ranges = False
-    if not args.skip_ranges_generation:
-        response = input("Generate ranges.json from config/level_multipliers.csv? [Y/n] ").strip().lower()
-        if response not in {"n", "no"}:
-            write_ranges_file(args.levels_csv, args.ranges_file)
-            generated_ranges = True
-
-    with input_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    if args.skip_ranges_generation:
+        ranges_status = "generation skipped"
+    else:
+        ranges_status = sync_ranges_file(args.levels_csv, args.ranges_file, args.yes)
 
+    # Validate the ranges before loading the table, so overlaps fail fast and gaps show up front.
     ranges = parse_ranges_file(args.ranges_file)
-    count = scale_xp_values(data, args.multiplier, ranges, args.default_multiplier)
+    fallback = "keep original" if args.default_multiplier is None else f"x{args.default_multiplier}"
+    for start, end in ranges.gaps:
+        print(f"Gap: levels {start}-{end} not covered by any range ({fallback})")
+    data = load_document(input_path, sections=("Exports",))
 
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-        handle.write("\n")
+    resolver = NameResolver()
+    count = scale_xp_values(data, args.multiplier, ranges, args.default_multiplier, resolver)
+    report_names(resolver, input_path)
 
-    ranges_source = str(args.ranges_file)
-    if generated_ranges:
-        ranges_source = f"{ranges_source} (generated from {args.levels_csv})"
-    elif args.skip_ranges_generation:
-        ranges_source = f"{ranges_source} (generation skipped)"
-    else:
-        ranges_source = f"{ranges_source} (kept existing)"
+    write_document(output_path, data, end="\n")
+
+    ranges_source = f"{args.ranges_file} ({ranges_status})"
 
     print("Level multipliers report")
     print(f"- Source: {ranges_source}")
@@ -1,24 +1,35 @@
 import argparse
-import json
 import shutil
+import sys
 from pathlib import Path
 from typing import Iterable, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import write_json
+from common.uasset_json import load_json
+from prefilter import ABSENT, MISSING_DEFAULT, PRESENT, scan_default_property
+from reference_index import DEFAULT_INDEX_PATH, default_property_status, open_index
+from uasset_reader import UNRESOLVED, PackageReadError, audit_default_property, make_resolver
+
 FILE_PATTERN = "*.json"
+UASSET_PATTERN = "*.uasset"
+# Files that travel with a .uasset when it is copied to needfix/.
+COMPANION_SUFFIXES = (".uexp", ".ubulk")
 DEFAULT_PROPERTY = "RespawnsOnRest"
 INPUT_ROOT_NAME = "JSONs"
 OUTPUT_ROOT_NAME = "processed"
 NEEDFIX_ROOT_NAME = "needfix"
 
 
-def iter_json_files(path: Path, recursive: bool) -> Iterable[Path]:
+def iter_json_files(path: Path, recursive: bool, pattern: str = FILE_PATTERN) -> Iterable[Path]:
     if path.is_file():
         yield path
         return
     if recursive:
-        yield from path.rglob(FILE_PATTERN)
+        yield from path.rglob(pattern)
     else:
-        yield from path.glob(FILE_PATTERN)
+        yield from path.glob(pattern)
 
 
 def pick_default_export(exports: List[dict], prefixes: List[str]) -> Optional[dict]:
@@ -84,11 +95,52 @@ def build_output_path(file_path: Path, output_root_name: str) -> Path:
     return file_path.parent / output_root_name / file_path.name
 
 
-def process_json_report(json_path: Path | str, apply_changes: bool = False) -> dict:
+def copy_to_needfix(file_path: Path) -> Path:
+    needfix_path = build_output_path(file_path, NEEDFIX_ROOT_NAME)
+    needfix_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(file_path, needfix_path)
+    if file_path.suffix == ".uasset":
+        for suffix in COMPANION_SUFFIXES:
+            companion = file_path.with_suffix(suffix)
+            if companion.exists():
+                shutil.copy2(companion, needfix_path.with_suffix(suffix))
+    return needfix_path
+
+
+def report_from_status(file_path: Path, status: str, object_name: str | None, apply_changes: bool) -> dict | None:
+    """Build the report from a prefilter/index verdict, or None if the file must be parsed."""
+    if status == MISSING_DEFAULT:
+        return {
+            "path": file_path,
+            "status": "missing-default",
+        }
+    if status == PRESENT or (status == ABSENT and not apply_changes):
+        has_prop = status == PRESENT
+        return {
+            "path": file_path,
+            "needfix_path": None if has_prop else copy_to_needfix(file_path),
+            "output_path": None,
+            "status": "ok",
+            "object_name": object_name,
+            "has_property": has_prop,
+            "added": False,
+        }
+    return None
+
+
+def process_json_report(json_path: Path | str, apply_changes: bool = False, prefilter: bool = True) -> dict:
     file_path = Path(json_path)
+
+    # Only files that will be rewritten need the full parse; the rest are
+    # answered by the byte-level prefilter.
+    if prefilter:
+        scan = scan_default_property(file_path, DEFAULT_PROPERTY)
+        report = report_from_status(file_path, scan["status"], scan["object_name"], apply_changes)
+        if report is not None:
+            return report
+
     try:
-        with file_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = load_json(file_path, intern=True)
     except Exception as exc:
         return {
             "path": file_path,
@@ -110,16 +162,12 @@ def process_json_report(json_path: Path | str, apply_changes: bool = False) -> d
     added = False
 
     if not has_prop:
-        needfix_path = build_output_path(file_path, NEEDFIX_ROOT_NAME)
-        needfix_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(file_path, needfix_path)
+        needfix_path = copy_to_needfix(file_path)
 
         if apply_changes:
             added = add_missing_property(default_export, DEFAULT_PROPERTY)
             output_path = build_output_path(file_path, OUTPUT_ROOT_NAME)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("w", encoding="utf-8", newline="\n") as handle:
-                json.dump(payload, handle, ensure_ascii=True, indent=2)
+            write_json(output_path, payload, newline="\n", ensure_ascii=True, indent=2)
     return {
         "path": file_path,
         "needfix_path": needfix_path,
@@ -131,6 +179,26 @@ def process_json_report(json_path: Path | str, apply_changes: bool = False) -> d
     }
 
 
+def process_uasset_report(uasset_path: Path | str, resolver) -> dict:
+    """Audit-only report for a cooked .uasset, read without a JSON export."""
+    file_path = Path(uasset_path)
+    try:
+        audit = audit_default_property(file_path, DEFAULT_PROPERTY, resolver)
+    except Exception as exc:
+        return {
+            "path": file_path,
+            "status": "error",
+            "error": f"cannot read package ({exc})",
+        }
+    if audit["status"] == UNRESOLVED:
+        return {
+            "path": file_path,
+            "status": "error",
+            "error": audit["error"],
+        }
+    return report_from_status(file_path, audit["status"], audit["object_name"], False)
+
+
 def process_json(json_path: Path | str, apply_changes: bool = False) -> Path | None:
     result = process_json_report(json_path, apply_changes=apply_changes)
     if result["status"] != "ok":
@@ -155,6 +223,36 @@ def main() -> int:
         action="store_true",
         help="Add RespawnsOnRest and write to processed/ when missing.",
     )
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Always parse each file in full instead of using the byte-level prefilter.",
+    )
+    parser.add_argument(
+        "--index",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_INDEX_PATH,
+        default=None,
+        help=f"Take Default__ state from the SQLite reference index, updating changed files first (default: {DEFAULT_INDEX_PATH}).",
+    )
+    parser.add_argument(
+        "--uasset",
+        action="store_true",
+        help="Audit cooked .uasset files (with their .uexp) directly instead of JSON exports.",
+    )
+    parser.add_argument(
+        "--content-root",
+        type=Path,
+        default=None,
+        help="With --uasset: folder that /Game/ maps to, for parent blueprints (default: the Content ancestor).",
+    )
+    parser.add_argument(
+        "--usmap",
+        type=Path,
+        default=None,
+        help="With --uasset: mappings file for properties declared in native classes.",
+    )
 
     args = parser.parse_args()
     root = Path(args.path)
@@ -163,15 +261,40 @@ def main() -> int:
         print(f"Path not found: {root}")
         return 2
 
-    files = list(iter_json_files(root, args.recursive))
+    resolver = None
+    if args.uasset:
+        if args.apply or args.index is not None:
+            print("--uasset only audits; --apply and --index need the JSON exports.")
+            return 2
+        try:
+            resolver = make_resolver(root, args.content_root, args.usmap)
+        except PackageReadError as exc:
+            print(exc)
+            return 2
+
+    files = list(iter_json_files(root, args.recursive, UASSET_PATTERN if args.uasset else FILE_PATTERN))
     if not files:
         print("No files matched.")
         return 0
 
+    indexed = {}
+    if args.index is not None:
+        conn = open_index(args.index, [root], args.recursive)
+        for path, default_export, has_prop, error in default_property_status(conn, root, args.recursive, DEFAULT_PROPERTY):
+            if error is None:
+                status = PRESENT if has_prop else ABSENT if default_export else MISSING_DEFAULT
+                indexed[Path(path)] = (status, default_export)
+        conn.close()
+
     for file_path in sorted(files):
-        result = process_json_report(file_path, apply_changes=args.apply)
+        known = indexed.get(file_path.resolve())
+        result = known and report_from_status(file_path, *known, args.apply)
+        if not result and resolver is not None:
+            result = process_uasset_report(file_path, resolver)
+        elif not result:
+            result = process_json_report(file_path, apply_changes=args.apply, prefilter=not args.no_prefilter)
         if result["status"] == "error":
-            print(f"{file_path}: error reading JSON ({result['error']})")
+            print(f"{file_path}: error reading {'asset' if args.uasset else 'JSON'} ({result['error']})")
             continue
         if result["status"] == "missing-default":
             print(f"{file_path}: Default__ export not found")
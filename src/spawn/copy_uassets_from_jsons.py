@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import file_digest
 
 UASSET_SOURCE_ROOT = Path(
     r"H:\Gaming\Modding\Exp33\Game\Sandfall\Content\Characters"
@@ -12,6 +19,8 @@ DEST_DIR = Path(
     r"H:\Gaming\Modding\Exp33\Retoc\Building\Z_NoRespawn_P\Sandfall\Content\Characters"
 )
 JSON_LOOKUP_ROOT = Path("reference/respawn")
+DIR_INDEX_CACHE = Path(".compact_dir_index.json")
+DIR_INDEX_VERSION = 1
 
 
 def compact_path(value: str) -> str:
@@ -24,10 +33,76 @@ def compact_path(value: str) -> str:
     )
 
 
-def iter_dirs(base: Path) -> Iterable[Path]:
-    for path in base.rglob("*"):
-        if path.is_dir():
-            yield path
+def load_dir_index(cache_path: Path, base: Path) -> dict:
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get("version") != DIR_INDEX_VERSION or cached.get("base") != str(base.resolve()):
+        return {}
+    return cached
+
+
+def scan_dirs(base: Path, cached_dirs: dict) -> tuple[dict, bool]:
+    """Map every directory under base (relative, "/"-joined) to [mtime_ns, child dir names].
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so cached child lists are reused for directories whose
+    mtime is unchanged and only changed directories are listed again.
+    Returns the map and whether the directory tree differs from cached_dirs
+    (an mtime bump alone, e.g. from writing the cache file, does not count).
+    """
+    dirs: dict[str, list] = {}
+    changed = False
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        path = base / rel if rel else base
+        try:
+            mtime = path.stat().st_mtime_ns
+            entry = cached_dirs.get(rel)
+            if entry is None or entry[0] != mtime:
+                with os.scandir(path) as it:
+                    children = sorted(child.name for child in it if child.is_dir(follow_symlinks=False))
+                changed = changed or entry is None or entry[1] != children
+                entry = [mtime, children]
+        except OSError:
+            changed = True
+            continue
+        dirs[rel] = entry
+        stack.extend(f"{rel}/{name}" if rel else name for name in reversed(entry[1]))
+
+    return dirs, changed or dirs.keys() != cached_dirs.keys()
+
+
+def build_compact_index(dirs: dict) -> dict[str, list[str]]:
+    index: dict[str, list[str]] = {}
+    for rel in dirs:
+        if rel:
+            index.setdefault(compact_path(rel), []).append(rel)
+    return index
+
+
+def load_compact_index(base: Path, cache_path: Path = DIR_INDEX_CACHE) -> dict[str, list[str]]:
+    """Compacted relative path -> candidate directories under base, cached on disk."""
+    cached = load_dir_index(cache_path, base)
+    dirs, changed = scan_dirs(base, cached.get("dirs", {}))
+    if not changed and "compact" in cached:
+        return cached["compact"]
+
+    index = build_compact_index(dirs)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"version": DIR_INDEX_VERSION, "base": str(base.resolve()), "dirs": dirs, "compact": index},
+                f,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        print(f"Warning: could not write {cache_path} ({exc})")
+    return index
 
 
 def recover_mangled_dir(raw: str, base: Path) -> Path | None:
@@ -35,11 +110,7 @@ def recover_mangled_dir(raw: str, base: Path) -> Path | None:
     if not compact_raw:
         return None
 
-    matches: list[Path] = []
-    for candidate in iter_dirs(base):
-        rel = candidate.relative_to(base)
-        if compact_path(str(rel)) == compact_raw:
-            matches.append(candidate)
+    matches = [base / rel for rel in load_compact_index(base).get(compact_raw, [])]
 
     if len(matches) == 1:
         return matches[0]
@@ -61,12 +132,72 @@ def build_dest_base_dir(relative_path: Path) -> Path:
     return DEST_DIR / relative_path
 
 
+def is_up_to_date(source_path: Path, dest_path: Path, use_hash: bool) -> bool:
+    """Same size and mtime (copy2 and hard links preserve it), or same content with use_hash."""
+    try:
+        dest_stat = dest_path.stat()
+    except OSError:
+        return False
+    source_stat = source_path.stat()
+    if dest_stat.st_size != source_stat.st_size:
+        return False
+    if use_hash:
+        return file_digest(source_path) == file_digest(dest_path)
+    return dest_stat.st_mtime_ns == source_stat.st_mtime_ns
+
+
+def stage_file(source_path: Path, dest_path: Path, sync: bool, use_hash: bool, link: bool) -> str:
+    """Copy or hard-link one file. Returns "copied", "linked" or "skipped"."""
+    # A hard link from an earlier --link run is the source itself; copy2 onto it would fail.
+    if dest_path.exists() and os.path.samefile(source_path, dest_path):
+        return "skipped"
+    if sync and is_up_to_date(source_path, dest_path, use_hash):
+        return "skipped"
+
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    if link:
+        tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+        try:
+            tmp_path.unlink(missing_ok=True)
+            os.link(source_path, tmp_path)
+            os.replace(tmp_path, dest_path)
+            return "linked"
+        except OSError:
+            # Different volume or no hard-link support: fall back to copying.
+            tmp_path.unlink(missing_ok=True)
+    shutil.copy2(source_path, dest_path)
+    return "copied"
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Copy matching .uasset files based on JSON file names."
     )
     parser.add_argument("relative_path", help="Relative path to JSON files (e.g., Enemies\\Forgotten_BattleField)")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Skip destination files that already match the source (same size and mtime).",
+    )
+    parser.add_argument(
+        "--hash",
+        action="store_true",
+        help="With --sync, compare file contents instead of mtimes when sizes match (requires --sync).",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Hard-link files into the staging tree instead of copying (falls back to copying across volumes).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files to copy in parallel (default: 1).",
+    )
     args = parser.parse_args()
+    if args.hash and not args.sync:
+        parser.error("--hash requires --sync")
 
     # Build full path by prepending JSON_LOOKUP_ROOT
     relative_path = Path(args.relative_path)
@@ -100,9 +231,8 @@ def main() -> int:
 
     dest_base_dir.mkdir(parents=True, exist_ok=True)
 
-    copied = 0
     missing = 0
-
+    pairs: list[tuple[Path, Path]] = []
     for json_path in json_files:
         uasset_name = f"{json_path.stem}.uasset"
         rel_dir = json_path.parent.relative_to(json_dir)
@@ -111,15 +241,33 @@ def main() -> int:
             print(f"Missing uasset: {source_path}")
             missing += 1
             continue
+        pairs.append((source_path, dest_base_dir / rel_dir / uasset_name))
+
+    def stage(pair: tuple[Path, Path]) -> tuple[str, OSError | None]:
+        try:
+            return stage_file(*pair, sync=args.sync, use_hash=args.hash, link=args.link), None
+        except OSError as exc:
+            return "failed", exc
 
-        dest_path = dest_base_dir / rel_dir / uasset_name
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, dest_path)
-        copied += 1
-        print(f"Copied: {source_path} -> {dest_path}")
+    counts = {"copied": 0, "linked": 0, "skipped": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for (source_path, dest_path), (outcome, error) in zip(pairs, pool.map(stage, pairs)):
+            counts[outcome] += 1
+            if outcome == "copied":
+                print(f"Copied: {source_path} -> {dest_path}")
+            elif outcome == "linked":
+                print(f"Linked: {source_path} -> {dest_path}")
+            elif outcome == "failed":
+                print(f"Failed: {source_path} -> {dest_path} ({error})")
 
-    print(f"Done. Copied: {copied}, Missing: {missing}.")
-    return 0
+    summary = f"Done. Copied: {counts['copied']}"
+    if args.link:
+        summary += f", Linked: {counts['linked']}"
+    summary += f", Skipped: {counts['skipped']}, Missing: {missing}"
+    if counts["failed"]:
+        summary += f", Failed: {counts['failed']}"
+    print(summary + ".")
+    return 1 if counts["failed"] else 0
 
 
 if __name__ == "__main__":
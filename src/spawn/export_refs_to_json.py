@@ -1,9 +1,20 @@
 import argparse
+import hashlib
+import json
 import os
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import file_digest
+
 PREFIX = Path("Sandfall/Content/Characters")
+MANIFEST_NAME = ".export_manifest.json"
+# UAssetGUI reads the export data from the .uexp next to each .uasset.
+SOURCE_SUFFIXES = (".uasset", ".uexp")
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,9 +51,78 @@ def parse_args() -> argparse.Namespace:
         default="ClairObscur5",
         help="Mappings name (no extension). Defaults to ClairObscur5.4.",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help=f"Decide freshness by hashing the .uasset/.uexp (recorded in {MANIFEST_NAME}) instead of by mtime.",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-export every listed asset.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of UAssetGUI exports to run at once (default: min(4, CPU count)).",
+    )
     return parser.parse_args()
 
 
+def read_asset_list(list_path: Path) -> list[Path]:
+    """Listed asset paths (relative to the game root), without duplicates."""
+    assets: list[Path] = []
+    seen: set[str] = set()
+    with list_path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+
+            rel = Path(line.replace("\\", "/"))
+            if not rel.as_posix().startswith(PREFIX.as_posix() + "/"):
+                raise ValueError(f"Path does not start with {PREFIX.as_posix()}: {line}")
+
+            # Windows paths are case-insensitive; the list comes from there.
+            key = rel.as_posix().casefold()
+            if key not in seen:
+                seen.add(key)
+                assets.append(rel)
+    return assets
+
+
+def source_files(src_asset: Path) -> list[Path]:
+    return [path for path in (src_asset.with_suffix(suffix) for suffix in SOURCE_SUFFIXES) if path.is_file()]
+
+
+def source_hash(src_asset: Path) -> str:
+    digest = hashlib.blake2b()
+    for path in source_files(src_asset):
+        digest.update(file_digest(path))
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> dict[str, str]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path: Path, manifest: dict[str, str]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_up_to_date(src_asset: Path, out_json: Path) -> bool:
+    try:
+        json_mtime = out_json.stat().st_mtime_ns
+    except OSError:
+        return False
+    sources = source_files(src_asset)
+    return bool(sources) and all(path.stat().st_mtime_ns <= json_mtime for path in sources)
+
+
 def main() -> int:
     args = parse_args()
     list_path = Path(args.list)
@@ -53,30 +133,74 @@ def main() -> int:
     if not uassetgui.exists():
         raise FileNotFoundError(f"UAssetGUI.exe not found: {uassetgui}")
 
-    with list_path.open("r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line:
-                continue
+    assets = read_asset_list(list_path)
+    manifest_path = json_root / MANIFEST_NAME
+    manifest = load_manifest(manifest_path) if args.strict else {}
 
-            rel = Path(line.replace("\\", "/"))
-            if not rel.as_posix().startswith(PREFIX.as_posix() + "/"):
-                raise ValueError(f"Path does not start with {PREFIX.as_posix()}: {line}")
+    jobs: list[tuple[str, Path, Path, str | None]] = []
+    skipped = 0
+    for rel in assets:
+        src_asset = game_root / rel
+        out_json = (json_root / rel.relative_to(PREFIX)).with_suffix(".json")
+        key = rel.relative_to(PREFIX).as_posix()
+
+        digest = None
+        if args.strict:
+            digest = source_hash(src_asset) if src_asset.is_file() else None
+            fresh = digest is not None and manifest.get(key) == digest and out_json.is_file()
+        else:
+            fresh = is_up_to_date(src_asset, out_json)
+        if fresh and not args.force:
+            skipped += 1
+            continue
+        jobs.append((key, src_asset, out_json, digest))
 
-            asset_rel = rel.relative_to(PREFIX)
-            src_asset = game_root / rel
+    print(f"{len(assets)} assets listed, {skipped} up to date, {len(jobs)} to export.")
 
-            out_json = json_root / asset_rel
-            out_json = out_json.with_suffix(".json")
-            out_json.parent.mkdir(parents=True, exist_ok=True)
+    def export(src_asset: Path, out_json: Path) -> subprocess.CompletedProcess:
+        out_json.parent.mkdir(parents=True, exist_ok=True)
+        # A failed export can leave a partial JSON newer than its source, which
+        # later runs would take as up to date; only a clean exit replaces it.
+        tmp_json = out_json.with_name(f".{out_json.stem}.partial.json")
+        cmd = [str(uassetgui), "tojson", str(src_asset), str(tmp_json), args.engine]
+        if args.mappings:
+            cmd.append(args.mappings)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                os.replace(tmp_json, out_json)
+        finally:
+            tmp_json.unlink(missing_ok=True)
+        return result
 
-            cmd = [str(uassetgui), "tojson", str(src_asset), str(out_json), args.engine]
-            if args.mappings:
-                cmd.append(args.mappings)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {pool.submit(export, src_asset, out_json): (key, src_asset, digest) for key, src_asset, out_json, digest in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            key, src_asset, digest = futures[future]
+            try:
+                result = future.result()
+                error = None
+                if result.returncode:
+                    error = (result.stderr or result.stdout).strip() or f"exit code {result.returncode}"
+            except OSError as exc:
+                error = str(exc)
+
+            if error is not None:
+                failed += 1
+                manifest.pop(key, None)
+                print(f"[{done}/{len(jobs)}] FAILED {src_asset}: {error}")
+                continue
+            if digest is not None:
+                manifest[key] = digest
+            print(f"[{done}/{len(jobs)}] {src_asset}")
 
-            subprocess.run(cmd, check=True)
+    if args.strict:
+        json_root.mkdir(parents=True, exist_ok=True)
+        save_manifest(manifest_path, manifest)
 
-    return 0
+    print(f"Done. Exported: {len(jobs) - failed}, Up to date: {skipped}, Failed: {failed}.")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -1,20 +1,28 @@
 import argparse
-import json
+import sys
 from pathlib import Path
 from typing import Iterable
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.uasset_json import load_json
+from prefilter import NEEDS_PARSE, PRESENT, scan_default_property
+from reference_index import DEFAULT_INDEX_PATH, default_property_status, open_index
+from uasset_reader import UNRESOLVED, PackageReadError, audit_default_property, make_resolver
+
 FILE_PATTERN = "*.json"
+UASSET_PATTERN = "*.uasset"
 DEFAULT_PROPERTY = "RespawnsOnRest"
 
 
-def iter_json_files(path: Path, recursive: bool) -> Iterable[Path]:
+def iter_json_files(path: Path, recursive: bool, pattern: str = FILE_PATTERN) -> Iterable[Path]:
     if path.is_file():
         yield path
         return
     if recursive:
-        yield from path.rglob(FILE_PATTERN)
+        yield from path.rglob(pattern)
     else:
-        yield from path.glob(FILE_PATTERN)
+        yield from path.glob(pattern)
 
 
 def pick_default_export(exports: list[dict]) -> dict | None:
@@ -33,9 +41,14 @@ def export_has_property(export: dict, prop_name: str) -> bool:
     return False
 
 
-def file_has_property(file_path: Path, prop_name: str) -> bool:
-    with file_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+def file_has_property(file_path: Path, prop_name: str, prefilter: bool = True) -> bool:
+    if prefilter:
+        scan = scan_default_property(file_path, prop_name)
+        if scan["status"] != NEEDS_PARSE:
+            return scan["status"] == PRESENT
+
+    # Read-only scan: compact records and interned strings keep memory low on big trees.
+    payload = load_json(file_path, compact=True)
 
     exports = payload.get("Exports", [])
     default_export = pick_default_export(exports)
@@ -45,6 +58,50 @@ def file_has_property(file_path: Path, prop_name: str) -> bool:
     return export_has_property(default_export, prop_name)
 
 
+def list_from_index(index_path: Path, root: Path, recursive: bool, prop_name: str) -> int:
+    conn = open_index(index_path, [root], recursive)
+    rows = default_property_status(conn, root, recursive, prop_name)
+    conn.close()
+    if not rows:
+        print("No files matched.")
+        return 0
+
+    # Report paths the way the directory scan does (relative to the given root).
+    base = root.resolve()
+    matches = 0
+    for path, _, has_prop, error in rows:
+        file_path = root / Path(path).relative_to(base) if Path(path) != base else root
+        if error is not None:
+            print(f"{file_path}: error reading JSON ({error})")
+        elif has_prop:
+            print(file_path)
+            matches += 1
+
+    if matches == 0:
+        print("No files already have the property.")
+    return 0
+
+
+def list_from_uassets(files: list[Path], prop_name: str, resolver) -> int:
+    matches = 0
+    for file_path in sorted(files):
+        try:
+            result = audit_default_property(file_path, prop_name, resolver)
+        except Exception as exc:
+            # One corrupt package must not stop the audit of the rest.
+            print(f"{file_path}: cannot read package ({exc})")
+            continue
+        if result["status"] == PRESENT:
+            print(file_path)
+            matches += 1
+        elif result["status"] == UNRESOLVED:
+            print(f"{file_path}: cannot resolve Default__ properties ({result['error']})")
+
+    if matches == 0:
+        print("No files already have the property.")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -62,6 +119,36 @@ def main() -> int:
         default=DEFAULT_PROPERTY,
         help="Property name to check (default: RespawnsOnRest)",
     )
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Always parse each file in full instead of using the byte-level prefilter.",
+    )
+    parser.add_argument(
+        "--index",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_INDEX_PATH,
+        default=None,
+        help=f"Answer from the SQLite reference index, updating changed files first (default: {DEFAULT_INDEX_PATH}).",
+    )
+    parser.add_argument(
+        "--uasset",
+        action="store_true",
+        help="Scan cooked .uasset files (with their .uexp) directly instead of JSON exports.",
+    )
+    parser.add_argument(
+        "--content-root",
+        type=Path,
+        default=None,
+        help="With --uasset: folder that /Game/ maps to, for parent blueprints (default: the Content ancestor).",
+    )
+    parser.add_argument(
+        "--usmap",
+        type=Path,
+        default=None,
+        help="With --uasset: mappings file for properties declared in native classes.",
+    )
 
     args = parser.parse_args()
     root = Path(args.path)
@@ -70,15 +157,29 @@ def main() -> int:
         print(f"Path not found: {root}")
         return 2
 
-    files = list(iter_json_files(root, args.recursive))
+    if args.index is not None and args.uasset:
+        print("--index works on JSON exports; drop it to scan .uasset files.")
+        return 2
+    if args.index is not None:
+        return list_from_index(args.index, root, args.recursive, args.property)
+
+    files = list(iter_json_files(root, args.recursive, UASSET_PATTERN if args.uasset else FILE_PATTERN))
     if not files:
         print("No files matched.")
         return 0
 
+    if args.uasset:
+        try:
+            resolver = make_resolver(root, args.content_root, args.usmap)
+        except PackageReadError as exc:
+            print(exc)
+            return 2
+        return list_from_uassets(files, args.property, resolver)
+
     matches = 0
     for file_path in sorted(files):
         try:
-            if file_has_property(file_path, args.property):
+            if file_has_property(file_path, args.property, prefilter=not args.no_prefilter):
                 print(file_path)
                 matches += 1
         except Exception as exc:
@@ -0,0 +1,100 @@
+import json
+import mmap
+from pathlib import Path
+
+from common.name_triage import read_name_map
+
+ABSENT = "absent"
+PRESENT = "present"
+MISSING_DEFAULT = "missing-default"
+NEEDS_PARSE = "needs-parse"
+
+# Byte layout written by UAssetGUI and json.dump(indent=2): top-level keys sit
+# at two spaces, export objects at four and their members at six. Strings
+# cannot contain raw newlines, so these markers only match real structure.
+TOP_LEVEL_KEY = b'\n  "'
+EXPORT_START = b"\n    {"
+EXPORT_END = b"\n    }"
+DEFAULT_OBJECT_NAME = b'\n      "ObjectName": "Default__'
+
+
+def top_level_span(mm: mmap.mmap, key: str) -> tuple[int, int] | None:
+    """Byte range of a top-level member's value in a pretty-printed document."""
+    marker = TOP_LEVEL_KEY + json.dumps(key).encode("ascii")[1:] + b": "
+    start = mm.find(marker)
+    if start == -1:
+        return None
+    start += len(marker)
+    end = mm.find(TOP_LEVEL_KEY, start)
+    return start, len(mm) if end == -1 else end
+
+
+def default_export_span(mm: mmap.mmap, exports: tuple[int, int]) -> tuple[int, int] | None:
+    """Byte range of the first export whose ObjectName starts with Default__."""
+    name_pos = mm.find(DEFAULT_OBJECT_NAME, exports[0], exports[1])
+    if name_pos == -1:
+        return None
+    start = mm.rfind(EXPORT_START, exports[0], name_pos)
+    end = mm.find(EXPORT_END, name_pos, exports[1])
+    if start == -1 or end == -1:
+        return None
+    return start + 1, end + len(EXPORT_END)
+
+
+def scan_default_property(path: Path, prop_name: str) -> dict:
+    """Decide whether Default__* has prop_name without parsing the whole file.
+
+    Returns {"status", "object_name", "in_name_map"} where status is one of:
+    ABSENT           the property is not set on the Default__ export
+    PRESENT          it is (confirmed by parsing only that export)
+    MISSING_DEFAULT  there is no Default__ export
+    NEEDS_PARSE      the layout was not recognised; use a full json.load
+
+    in_name_map says whether the NameMap lists the name. It is informational:
+    cooked assets use unversioned properties, whose names are not in the
+    NameMap, so it cannot rule the property out. It can rule out the Default__
+    export: a file whose NameMap has no Default__ name is answered before its
+    Exports are scanned.
+    """
+    token = json.dumps(prop_name).encode("utf-8")
+    result = {"status": NEEDS_PARSE, "object_name": None, "in_name_map": False}
+
+    name_map = read_name_map(path)
+    if name_map is not None:
+        result["in_name_map"] = prop_name in name_map
+        if not any(name.startswith("Default__") for name in name_map):
+            result["status"] = MISSING_DEFAULT
+            return result
+
+    try:
+        with Path(path).open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            exports = top_level_span(mm, "Exports")
+            if exports is None:
+                return result
+            span = default_export_span(mm, exports)
+            if span is None:
+                result["status"] = MISSING_DEFAULT
+                return result
+
+            name_start = mm.find(DEFAULT_OBJECT_NAME, *span) + len(DEFAULT_OBJECT_NAME) - len(b"Default__")
+            name_end = mm.find(b'"', name_start)
+            result["object_name"] = mm[name_start:name_end].decode("utf-8")
+
+            if mm.find(token, *span) == -1:
+                result["status"] = ABSENT
+                return result
+            export_text = mm[span[0]:span[1]].decode("utf-8")
+    except (OSError, ValueError):
+        # Empty or unreadable files: let the full parse report the error.
+        return result
+
+    try:
+        export = json.loads(export_text)
+    except ValueError:
+        return result
+    if not isinstance(export, dict) or export.get("ObjectName") != result["object_name"]:
+        return result
+
+    has_prop = any(item.get("Name") == prop_name for item in export.get("Data") or [] if isinstance(item, dict))
+    result["status"] = PRESENT if has_prop else ABSENT
+    return result
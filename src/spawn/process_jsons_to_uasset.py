@@ -1,5 +1,7 @@
 import argparse
+import os
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from check_respawns_on_rest import process_json_report
@@ -34,6 +36,25 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Recurse into subdirectories.",
     )
+    parser.add_argument(
+        "--fix-jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes adding RespawnsOnRest to JSONs (default: CPU count).",
+    )
+    parser.add_argument(
+        "--convert-jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="UAssetGUI fromjson conversions to run at once (default: min(4, CPU count)).",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="Files allowed in flight between fixing and conversion "
+        "(default: twice the total number of workers).",
+    )
     return parser.parse_args()
 
 
@@ -48,6 +69,62 @@ def build_uasset_output(json_root: Path, out_root: Path, json_path: Path) -> Pat
     return out_root / relative.with_suffix(".uasset")
 
 
+def fix_outcome(json_path: Path, result: dict) -> tuple[Path | None, str]:
+    """Processed JSON to convert (or None) and the line to print for it."""
+    if result["status"] == "error":
+        return None, f"{json_path}: skipped (error: {result['error']})"
+    if result["status"] == "missing-default":
+        return None, f"{json_path}: skipped (Default__ export not found)"
+    if not result["added"]:
+        return None, f"{json_path}: skipped (property already present)"
+
+    processed_path = result["output_path"]
+    if processed_path is None:
+        return None, f"{json_path}: skipped (no output JSON written)"
+    if not Path(processed_path).exists():
+        return None, f"{json_path}: skipped (processed JSON not found: {processed_path})"
+    return Path(processed_path), ""
+
+
+def run_pipeline(files: list[Path], fix_jobs: int, convert_jobs: int, max_pending: int, convert) -> None:
+    """Fix JSONs in worker processes and convert them on threads as they finish.
+
+    At most max_pending files are between "submitted for fixing" and
+    "conversion done", so a slow converter holds the fixers back instead of
+    letting finished work pile up.
+    """
+    pending: dict[Future, tuple[str, Path]] = {}
+    remaining = iter(files)
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=fix_jobs) as fixers, ThreadPoolExecutor(max_workers=convert_jobs) as converters:
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                json_path = next(remaining, None)
+                if json_path is None:
+                    exhausted = True
+                    break
+                pending[fixers.submit(process_json_report, json_path, True)] = ("fix", json_path)
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, json_path = pending.pop(future)
+                if future.exception() is not None:
+                    print(f"{json_path}: {stage} failed ({future.exception()})")
+                    continue
+                if stage == "convert":
+                    print(future.result())
+                    continue
+
+                processed_path, message = fix_outcome(json_path, future.result())
+                if processed_path is None:
+                    print(message)
+                    continue
+                pending[converters.submit(convert, json_path, processed_path)] = ("convert", json_path)
+
+
 def main() -> int:
     args = parse_args()
     json_root = Path(args.json_root)
@@ -66,26 +143,7 @@ def main() -> int:
         print("No JSON files found.")
         return 0
 
-    for json_path in files:
-        result = process_json_report(json_path)
-        if result["status"] == "error":
-            print(f"{json_path}: skipped (error: {result['error']})")
-            continue
-        if result["status"] == "missing-default":
-            print(f"{json_path}: skipped (Default__ export not found)")
-            continue
-        if not result["added"]:
-            print(f"{json_path}: skipped (property already present)")
-            continue
-
-        processed_path = result["output_path"]
-        if processed_path is None:
-            print(f"{json_path}: skipped (no output JSON written)")
-            continue
-        if not Path(processed_path).exists():
-            print(f"{json_path}: skipped (processed JSON not found: {processed_path})")
-            continue
-
+    def convert(json_path: Path, processed_path: Path) -> str:
         out_asset_path = build_uasset_output(json_root, out_root, json_path)
         out_asset_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -96,15 +154,18 @@ def main() -> int:
         try:
             subprocess.run(cmd, check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as exc:
-            print(f"{json_path}: fromjson failed ({exc.returncode})")
+            lines = [f"{json_path}: fromjson failed ({exc.returncode})"]
             if exc.stdout:
-                print(f"stdout: {exc.stdout.strip()}")
+                lines.append(f"stdout: {exc.stdout.strip()}")
             if exc.stderr:
-                print(f"stderr: {exc.stderr.strip()}")
-            continue
-
-        print(f"{json_path} -> {processed_path} -> {out_asset_path}")
-
+                lines.append(f"stderr: {exc.stderr.strip()}")
+            return "\n".join(lines)
+        return f"{json_path} -> {processed_path} -> {out_asset_path}"
+
+    fix_jobs = max(1, args.fix_jobs)
+    convert_jobs = max(1, args.convert_jobs)
+    max_pending = max(1, args.max_pending or 2 * (fix_jobs + convert_jobs))
+    run_pipeline(files, fix_jobs, convert_jobs, max_pending, convert)
     return 0
 
 
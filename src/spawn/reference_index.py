@@ -0,0 +1,355 @@
+import argparse
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.uasset_json import load_json
+
+FILE_PATTERN = "*.json"
+DEFAULT_INDEX_PATH = Path("reference/reference_index.sqlite")
+DEFAULT_ROOTS = [Path("reference/respawn"), Path("reference/JSONs")]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    class_path TEXT,
+    super_path TEXT,
+    default_export TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS objects (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    export_index INTEGER NOT NULL,
+    object_name TEXT NOT NULL,
+    export_type TEXT
+);
+CREATE TABLE IF NOT EXISTS default_props (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS imports (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    object_path TEXT NOT NULL,
+    class_package TEXT,
+    class_name TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_files_class ON files(class_path);
+CREATE INDEX IF NOT EXISTS idx_objects_file ON objects(file_id);
+CREATE INDEX IF NOT EXISTS idx_default_props_name ON default_props(name, file_id);
+CREATE INDEX IF NOT EXISTS idx_default_props_file ON default_props(file_id);
+CREATE INDEX IF NOT EXISTS idx_imports_file ON imports(file_id);
+CREATE INDEX IF NOT EXISTS idx_imports_class ON imports(class_name);
+"""
+
+# Every class a file's blueprint derives from, following super_path through
+# the other indexed files (a chain stops at the first class not in the index).
+ANCESTRY_SQL = """
+WITH RECURSIVE ancestry(file_id, ancestor) AS (
+    SELECT id, super_path FROM files WHERE super_path IS NOT NULL
+    UNION
+    SELECT ancestry.file_id, files.super_path
+    FROM ancestry JOIN files ON files.class_path = ancestry.ancestor
+    WHERE files.super_path IS NOT NULL
+)
+SELECT DISTINCT files.path
+FROM ancestry JOIN files ON files.id = ancestry.file_id
+WHERE class_matches(ancestry.ancestor, ?)
+ORDER BY files.path
+"""
+
+
+def connect(index_path: Path) -> sqlite3.Connection:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    conn.create_function("class_matches", 2, class_matches, deterministic=True)
+    return conn
+
+
+def class_matches(object_path: str | None, name: str) -> bool:
+    """Match a /Game/.../Asset.Asset_C path by full path, asset or class name."""
+    if not object_path:
+        return False
+    package, _, object_name = object_path.rpartition(".")
+    asset = package.rsplit("/", 1)[-1]
+    return name in (object_path, package, asset, object_name) or f"{name}_C" == object_name
+
+
+def resolve_path(payload: dict, index: int) -> str | None:
+    """Package.Object path of a package index (negative: import, positive: export)."""
+    tables = {True: payload.get("Imports") or [], False: payload.get("Exports") or []}
+    names = []
+    is_export = False
+    while index:
+        table = tables[index < 0]
+        pos = -index - 1 if index < 0 else index - 1
+        if pos >= len(table):
+            return None
+        names.append(table[pos].get("ObjectName", ""))
+        is_export = index > 0
+        index = table[pos].get("OuterIndex", 0)
+
+    if not names:
+        return None
+    # Top-level exports live directly in this file's package.
+    if is_export:
+        names.append(payload.get("FolderName") or "")
+    names.reverse()
+    return ".".join(names)
+
+
+def describe_file(payload: dict) -> dict:
+    exports = payload.get("Exports") or []
+    folder = payload.get("FolderName") or ""
+
+    class_path = None
+    super_path = None
+    default_export = None
+    default_props: list[str] = []
+    objects = []
+    for idx, export in enumerate(exports, start=1):
+        name = export.get("ObjectName", "")
+        export_type = (export.get("$type") or "").split(",")[0].rsplit(".", 1)[-1]
+        objects.append((idx, name, export_type))
+
+        if class_path is None and export_type == "ClassExport":
+            class_path = f"{folder}.{name}"
+            super_path = resolve_path(payload, export.get("SuperStruct") or 0)
+        if default_export is None and name.startswith("Default__"):
+            default_export = name
+            default_props = [item.get("Name") for item in export.get("Data") or [] if item.get("Name")]
+
+    imports = [
+        (resolve_path(payload, -idx), entry.get("ClassPackage"), entry.get("ClassName"))
+        for idx, entry in enumerate(payload.get("Imports") or [], start=1)
+    ]
+    return {
+        "class_path": class_path,
+        "super_path": super_path,
+        "default_export": default_export,
+        "default_props": default_props,
+        "objects": objects,
+        "imports": imports,
+    }
+
+
+def store_file(conn: sqlite3.Connection, path: str, stat: os.stat_result) -> None:
+    conn.execute("DELETE FROM files WHERE path = ?", (path,))
+    try:
+        info = describe_file(load_json(Path(path), compact=True))
+    except Exception as exc:
+        conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, error) VALUES (?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, str(exc)),
+        )
+        return
+
+    file_id = conn.execute(
+        "INSERT INTO files (path, mtime_ns, size, class_path, super_path, default_export) VALUES (?, ?, ?, ?, ?, ?)",
+        (path, stat.st_mtime_ns, stat.st_size, info["class_path"], info["super_path"], info["default_export"]),
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO objects (file_id, export_index, object_name, export_type) VALUES (?, ?, ?, ?)",
+        [(file_id, *row) for row in info["objects"]],
+    )
+    conn.executemany(
+        "INSERT INTO default_props (file_id, name) VALUES (?, ?)",
+        [(file_id, name) for name in info["default_props"]],
+    )
+    conn.executemany(
+        "INSERT INTO imports (file_id, object_path, class_package, class_name) VALUES (?, ?, ?, ?)",
+        [(file_id, *row) for row in info["imports"] if row[0]],
+    )
+
+
+def under_root(root: str) -> tuple[str, tuple[str, str, str]]:
+    """SQL condition and parameters selecting root itself or any path below it."""
+    # "/" sorts directly before "0", so this range is exactly root + "/...".
+    return "(path = ? OR (path >= ? AND path < ?))", (root, root + "/", root + "0")
+
+
+def update_index(conn: sqlite3.Connection, roots: Iterable[Path], recursive: bool = True) -> tuple[int, int, int]:
+    """Re-index files under roots whose mtime or size changed.
+
+    With recursive=False only the files directly in each root are scanned,
+    and indexed files in its subdirectories are left alone.
+    Returns (updated, removed, unchanged) counts.
+    """
+    updated = removed = unchanged = 0
+    with conn:
+        for root in roots:
+            root_key = root.resolve().as_posix()
+            conn.execute("INSERT OR IGNORE INTO roots (path) VALUES (?)", (root_key,))
+
+            condition, params = under_root(root_key)
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute(
+                    f"SELECT path, mtime_ns, size FROM files WHERE {condition}", params
+                )
+                if recursive or path == root_key or Path(path).parent.as_posix() == root_key
+            }
+
+            if root.is_file():
+                files = [root]
+            elif root.exists():
+                files = root.rglob(FILE_PATTERN) if recursive else root.glob(FILE_PATTERN)
+            else:
+                files = []
+            for file_path in files:
+                path = file_path.resolve().as_posix()
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    # Deleted during the scan; dropped with the other vanished files below.
+                    continue
+                if known.pop(path, None) == (stat.st_mtime_ns, stat.st_size):
+                    unchanged += 1
+                    continue
+                store_file(conn, path, stat)
+                updated += 1
+
+            for path in known:
+                conn.execute("DELETE FROM files WHERE path = ?", (path,))
+                removed += 1
+    return updated, removed, unchanged
+
+
+def indexed_roots(conn: sqlite3.Connection) -> list[Path]:
+    return [Path(row[0]) for row in conn.execute("SELECT path FROM roots ORDER BY path")]
+
+
+def open_index(index_path: Path, roots: Iterable[Path], recursive: bool = True) -> sqlite3.Connection:
+    """Open the index and bring the given roots up to date."""
+    conn = connect(index_path)
+    update_index(conn, roots, recursive)
+    return conn
+
+
+def default_property_status(conn: sqlite3.Connection, root: Path, recursive: bool, prop_name: str) -> list[tuple]:
+    """(path, default_export, has_property, error) for indexed files under root."""
+    root_key = root.resolve().as_posix()
+    condition, params = under_root(root_key)
+    rows = conn.execute(
+        f"""
+        SELECT path, default_export,
+               EXISTS (SELECT 1 FROM default_props WHERE file_id = files.id AND name = ?),
+               error
+        FROM files WHERE {condition}
+        """,
+        (prop_name, *params),
+    ).fetchall()
+    # Same order as sorting the Path objects from a directory scan.
+    rows.sort(key=lambda row: Path(row[0]))
+    if recursive or Path(root_key).is_file():
+        return rows
+    return [row for row in rows if Path(row[0]).parent.as_posix() == root_key]
+
+
+def query_default_property(conn: sqlite3.Connection, prop_name: str, present: bool) -> list[str]:
+    rows = conn.execute(
+        f"""
+        SELECT path FROM files
+        WHERE default_export IS NOT NULL AND {"" if present else "NOT"} EXISTS (
+            SELECT 1 FROM default_props WHERE file_id = files.id AND name = ?
+        )
+        ORDER BY path
+        """,
+        (prop_name,),
+    )
+    return [row[0] for row in rows]
+
+
+def query_inherits(conn: sqlite3.Connection, class_name: str) -> list[str]:
+    return [row[0] for row in conn.execute(ANCESTRY_SQL, (class_name,))]
+
+
+def query_property_names(conn: sqlite3.Connection) -> list[tuple[str, int]]:
+    return conn.execute(
+        "SELECT name, COUNT(DISTINCT file_id) FROM default_props GROUP BY name ORDER BY name"
+    ).fetchall()
+
+
+def query_imports(conn: sqlite3.Connection, class_name: str) -> list[str]:
+    rows = conn.execute(
+        """
+        SELECT DISTINCT files.path FROM imports JOIN files ON files.id = imports.file_id
+        WHERE imports.class_name = ? OR class_matches(imports.object_path, ?)
+        ORDER BY files.path
+        """,
+        (class_name, class_name),
+    )
+    return [row[0] for row in rows]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Index blueprint JSON dumps (ObjectNames, Default__ properties, imports, "
+            "parent classes) in SQLite and answer questions about them."
+        )
+    )
+    parser.add_argument(
+        "roots",
+        nargs="*",
+        type=Path,
+        help="Directories or files to index (default: roots already in the index, "
+        "or reference/respawn and reference/JSONs for a new index).",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=DEFAULT_INDEX_PATH,
+        help=f"SQLite index path (default: {DEFAULT_INDEX_PATH}).",
+    )
+    parser.add_argument("--no-update", action="store_true", help="Query the index as-is without re-scanning.")
+    parser.add_argument("--missing", metavar="PROPERTY", help="List files whose Default__ lacks PROPERTY.")
+    parser.add_argument("--has", metavar="PROPERTY", help="List files whose Default__ sets PROPERTY.")
+    parser.add_argument("--inherits", metavar="CLASS", help="List blueprints deriving from CLASS.")
+    parser.add_argument("--imports", metavar="CLASS", help="List files importing CLASS (class or object name).")
+    parser.add_argument(
+        "--property-names",
+        action="store_true",
+        help="List every Default__ property name with the number of files setting it.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    conn = connect(args.index)
+
+    if not args.no_update:
+        roots = args.roots or indexed_roots(conn) or DEFAULT_ROOTS
+        updated, removed, unchanged = update_index(conn, roots)
+        print(f"Index {args.index}: {updated} updated, {removed} removed, {unchanged} unchanged.")
+
+    for path in query_default_property(conn, args.missing, present=False) if args.missing else []:
+        print(path)
+    for path in query_default_property(conn, args.has, present=True) if args.has else []:
+        print(path)
+    for path in query_inherits(conn, args.inherits) if args.inherits else []:
+        print(path)
+    for path in query_imports(conn, args.imports) if args.imports else []:
+        print(path)
+    if args.property_names:
+        for name, count in query_property_names(conn):
+            print(f"{name}: {count}")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,1185 @@
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prefilter import ABSENT, MISSING_DEFAULT, PRESENT
+
+UNRESOLVED = "unresolved"
+
+PACKAGE_FILE_TAG = 0x9E2A83C1
+PACKAGE_FILE_TAG_SWAPPED = 0xC1832A9E
+
+# Cooked game packages are saved unversioned; read them as UAssetGUI does
+# with VER_UE5_4.
+UNVERSIONED_UE4_VERSION = 522  # VER_UE4_CORRECT_LICENSEE_FLAG
+UNVERSIONED_UE5_VERSION = 1012  # PROPERTY_TAG_COMPLETE_TYPE_NAME
+
+# EUnrealEngineObjectUE4Version
+VER_UE4_WORLD_LEVEL_INFO = 224
+VER_UE4_ADDED_CHUNKID_TO_ASSETDATA_AND_UPACKAGE = 278
+VER_UE4_CHANGED_CHUNKID_TO_BE_AN_ARRAY_OF_CHUNKIDS = 326
+VER_UE4_ENGINE_VERSION_OBJECT = 336
+VER_UE4_LOAD_FOR_EDITOR_GAME = 365
+VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP = 384
+VER_UE4_STRUCT_GUID_IN_PROPERTY_TAG = 441
+VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION = 444
+VER_UE4_SERIALIZE_TEXT_IN_PACKAGES = 459
+VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT = 485
+VER_UE4_ARRAY_PROPERTY_INNER_TAGS = 500
+VER_UE4_PROPERTY_GUID_IN_PROPERTY_TAG = 503
+VER_UE4_NAME_HASHES_SERIALIZED = 504
+VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS = 507
+VER_UE4_TEMPLATEINDEX_IN_COOKED_EXPORTS = 508
+VER_UE4_PROPERTY_TAG_SET_MAP_SUPPORT = 509
+VER_UE4_ADDED_SEARCHABLE_NAMES = 510
+VER_UE4_64BIT_EXPORTMAP_SERIALSIZES = 511
+VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID = 516
+VER_UE4_ADDED_PACKAGE_OWNER = 518
+VER_UE4_NON_OUTER_PACKAGE_IMPORT = 520
+
+# EUnrealEngineObjectUE5Version
+VER_UE5_NAMES_REFERENCED_FROM_EXPORT_DATA = 1001
+VER_UE5_PAYLOAD_TOC = 1002
+VER_UE5_OPTIONAL_RESOURCES = 1003
+VER_UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID = 1005
+VER_UE5_TRACK_OBJECT_EXPORT_IS_INHERITED = 1006
+VER_UE5_FSOFTOBJECTPATH_REMOVE_ASSET_PATH_FNAMES = 1007
+VER_UE5_ADD_SOFTOBJECTPATH_LIST = 1008
+VER_UE5_DATA_RESOURCES = 1009
+VER_UE5_SCRIPT_SERIALIZATION_OFFSET = 1010
+VER_UE5_PROPERTY_TAG_EXTENSION_AND_OVERRIDABLE_SERIALIZATION = 1011
+VER_UE5_PROPERTY_TAG_COMPLETE_TYPE_NAME = 1012
+# 1013 only touches the asset registry; 1014+ (UE 5.5) change the summary.
+MAX_UE5_VERSION = 1013
+
+PKG_UNVERSIONED_PROPERTIES = 0x00002000
+PKG_FILTER_EDITOR_ONLY = 0x80000000
+RF_CLASS_DEFAULT_OBJECT = 0x00000010
+
+# Real type names nest a few levels (Map(Name,Struct(...))); deeper means corrupt data.
+MAX_TYPE_NAME_DEPTH = 32
+
+# FPropertyTag flags (UE 5.4) and extensions
+TAG_HAS_ARRAY_INDEX = 0x01
+TAG_HAS_PROPERTY_GUID = 0x02
+TAG_HAS_PROPERTY_EXTENSIONS = 0x04
+EXTENSION_OVERRIDABLE_INFORMATION = 0x02
+
+# Mappings (.usmap)
+USMAP_MAGIC = 0x30C4
+USMAP_VERSION_PACKAGE_VERSIONING = 1
+USMAP_VERSION_LONG_FNAME = 2
+USMAP_VERSION_LARGE_ENUMS = 3
+USMAP_VERSION_EXPLICIT_ENUM_VALUES = 4
+USMAP_PROPERTY_TYPES = [
+    "ByteProperty", "BoolProperty", "IntProperty", "FloatProperty", "ObjectProperty", "NameProperty",
+    "DelegateProperty", "DoubleProperty", "ArrayProperty", "StructProperty", "StrProperty", "TextProperty",
+    "InterfaceProperty", "MulticastDelegateProperty", "WeakObjectProperty", "LazyObjectProperty",
+    "AssetObjectProperty", "SoftObjectProperty", "UInt64Property", "UInt32Property", "UInt16Property",
+    "Int64Property", "Int16Property", "Int8Property", "MapProperty", "SetProperty", "EnumProperty",
+    "FieldPathProperty", "OptionalProperty", "Utf8StrProperty", "AnsiStrProperty",
+]
+
+# Fixed-size values in unversioned property data.
+FIXED_VALUE_SIZES = {
+    "BoolProperty": 1, "ByteProperty": 1, "Int8Property": 1,
+    "Int16Property": 2, "UInt16Property": 2,
+    "IntProperty": 4, "UInt32Property": 4, "FloatProperty": 4,
+    "Int64Property": 8, "UInt64Property": 8, "DoubleProperty": 8,
+    "NameProperty": 8,
+    "ObjectProperty": 4, "ClassProperty": 4, "WeakObjectProperty": 4, "InterfaceProperty": 4,
+    "LazyObjectProperty": 16,
+    "DelegateProperty": 12,
+}
+# Structs with native (binary) serialization, as sized in UE5 (double precision math types).
+NATIVE_STRUCT_SIZES = {
+    "Vector": 24, "Vector2D": 16, "Vector4": 32, "Rotator": 24, "Quat": 32, "Plane": 32,
+    "Vector3f": 12, "Vector2f": 8, "Vector4f": 16, "Rotator3f": 12, "Quat4f": 16,
+    "LinearColor": 16, "Color": 4, "IntPoint": 8, "IntVector": 12, "IntVector4": 16,
+    "Guid": 16, "DateTime": 8, "Timespan": 8, "FrameNumber": 4,
+    "Box": 49, "Box2D": 33, "Box2f": 17, "Matrix": 128, "Sphere": 32, "TwoVectors": 48,
+}
+
+_INT8 = struct.Struct("<b")
+_UINT8 = struct.Struct("<B")
+_UINT16 = struct.Struct("<H")
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+_INT64 = struct.Struct("<q")
+_UINT64 = struct.Struct("<Q")
+
+
+class PackageReadError(ValueError):
+    pass
+
+
+class ByteReader:
+    """Little-endian cursor over bytes; FNames resolve against an optional name list."""
+
+    def __init__(self, data, pos: int = 0, names: list[str] | None = None) -> None:
+        self.data = data
+        self.pos = pos
+        self.names = names or []
+
+    def _unpack(self, fmt: struct.Struct):
+        try:
+            (value,) = fmt.unpack_from(self.data, self.pos)
+        except struct.error:
+            raise PackageReadError(f"Unexpected end of data at offset {self.pos}") from None
+        self.pos += fmt.size
+        return value
+
+    def int8(self) -> int:
+        return self._unpack(_INT8)
+
+    def uint8(self) -> int:
+        return self._unpack(_UINT8)
+
+    def uint16(self) -> int:
+        return self._unpack(_UINT16)
+
+    def int32(self) -> int:
+        return self._unpack(_INT32)
+
+    def uint32(self) -> int:
+        return self._unpack(_UINT32)
+
+    def int64(self) -> int:
+        return self._unpack(_INT64)
+
+    def uint64(self) -> int:
+        return self._unpack(_UINT64)
+
+    def bool32(self) -> bool:
+        return self.int32() != 0
+
+    def skip(self, size: int) -> None:
+        if size < 0 or self.pos + size > len(self.data):
+            raise PackageReadError(f"Cannot skip {size} bytes at offset {self.pos}")
+        self.pos += size
+
+    def bytes(self, size: int) -> bytes:
+        start = self.pos
+        self.skip(size)
+        return bytes(self.data[start:self.pos])
+
+    def count(self, element_size: int = 1) -> int:
+        """int32 element count, checked against the bytes left."""
+        value = self.int32()
+        if value < 0 or value * element_size > len(self.data) - self.pos:
+            raise PackageReadError(f"Invalid count {value} at offset {self.pos - 4}")
+        return value
+
+    def guid(self) -> str:
+        a, b, c, d = struct.unpack("<4I", self.bytes(16))
+        text = f"{a:08X}{b:08X}{c:08X}{d:08X}"
+        return f"{{{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}}}"
+
+    def fstring(self) -> str | None:
+        length = self.int32()
+        if length == 0:
+            return None
+        if length > 0:
+            return self.bytes(length)[:-1].decode("latin-1")
+        start = self.pos
+        try:
+            return self.bytes(-length * 2)[:-2].decode("utf-16-le")
+        except UnicodeDecodeError:
+            raise PackageReadError(f"Invalid UTF-16 string at offset {start}") from None
+
+    def fname(self) -> str:
+        index = self.int32()
+        number = self.int32()
+        if not 0 <= index < len(self.names):
+            raise PackageReadError(f"Name index {index} out of range at offset {self.pos - 8}")
+        name = self.names[index]
+        return f"{name}_{number - 1}" if number else name
+
+
+def read_engine_version(reader: ByteReader) -> dict:
+    return {
+        "Major": reader.uint16(),
+        "Minor": reader.uint16(),
+        "Patch": reader.uint16(),
+        "Changelist": reader.uint32(),
+        "Branch": reader.fstring(),
+    }
+
+
+def read_custom_versions(reader: ByteReader, legacy_version: int) -> list[tuple[str, int]]:
+    versions = []
+    for _ in range(reader.count(8)):
+        if legacy_version == -2:
+            key = str(reader.int32())
+            versions.append((key, reader.int32()))
+        else:
+            key = reader.guid()
+            versions.append((key, reader.int32()))
+            if legacy_version > -6:
+                reader.fstring()
+    return versions
+
+
+def read_summary(reader: ByteReader) -> dict:
+    """FPackageFileSummary, with keys named like UAssetAPI's JSON fields."""
+    tag = reader.uint32()
+    if tag == PACKAGE_FILE_TAG_SWAPPED:
+        raise PackageReadError("Big-endian packages are not supported")
+    if tag != PACKAGE_FILE_TAG:
+        raise PackageReadError(f"Not a package file (tag {tag:#010x})")
+
+    summary: dict = {}
+    legacy = reader.int32()
+    if not -8 <= legacy < 0:
+        raise PackageReadError(f"Unsupported legacy file version {legacy}")
+    summary["LegacyFileVersion"] = legacy
+    if legacy != -4:
+        reader.int32()  # LegacyUE3Version
+    ue4 = reader.int32()
+    ue5 = reader.int32() if legacy <= -8 else 0
+    licensee = reader.int32()
+    summary["CustomVersionContainer"] = read_custom_versions(reader, legacy) if legacy <= -2 else []
+
+    summary["IsUnversioned"] = not (ue4 or ue5 or licensee)
+    if summary["IsUnversioned"]:
+        ue4, ue5 = UNVERSIONED_UE4_VERSION, UNVERSIONED_UE5_VERSION
+    if ue5 > MAX_UE5_VERSION:
+        raise PackageReadError(f"UE5 object version {ue5} is newer than this reader supports")
+    summary["ObjectVersion"] = ue4
+    summary["ObjectVersionUE5"] = ue5
+    summary["FileVersionLicenseeUE"] = licensee
+
+    summary["TotalHeaderSize"] = reader.int32()
+    summary["FolderName"] = reader.fstring()
+    flags = reader.uint32()
+    summary["PackageFlags"] = flags
+    summary["HasUnversionedProperties"] = bool(flags & PKG_UNVERSIONED_PROPERTIES)
+    summary["IsFilterEditorOnly"] = editor_only = bool(flags & PKG_FILTER_EDITOR_ONLY)
+    summary["NameCount"] = reader.int32()
+    summary["NameOffset"] = reader.int32()
+    if ue5 >= VER_UE5_ADD_SOFTOBJECTPATH_LIST:
+        summary["SoftObjectPathsCount"] = reader.int32()
+        summary["SoftObjectPathsOffset"] = reader.int32()
+    if not editor_only and ue4 >= VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID:
+        summary["LocalizationId"] = reader.fstring()
+    if ue4 >= VER_UE4_SERIALIZE_TEXT_IN_PACKAGES:
+        summary["GatherableTextDataCount"] = reader.int32()
+        summary["GatherableTextDataOffset"] = reader.int32()
+    summary["ExportCount"] = reader.int32()
+    summary["ExportOffset"] = reader.int32()
+    summary["ImportCount"] = reader.int32()
+    summary["ImportOffset"] = reader.int32()
+    summary["DependsOffset"] = reader.int32()
+    if ue4 >= VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP:
+        summary["SoftPackageReferencesCount"] = reader.int32()
+        summary["SoftPackageReferencesOffset"] = reader.int32()
+    if ue4 >= VER_UE4_ADDED_SEARCHABLE_NAMES:
+        summary["SearchableNamesOffset"] = reader.int32()
+    summary["ThumbnailTableOffset"] = reader.int32()
+    summary["PackageGuid"] = reader.guid()
+    if not editor_only and ue4 >= VER_UE4_ADDED_PACKAGE_OWNER:
+        summary["PersistentGuid"] = reader.guid()
+        if ue4 < VER_UE4_NON_OUTER_PACKAGE_IMPORT:
+            reader.guid()  # OwnerPersistentGuid
+    summary["Generations"] = [
+        {"ExportCount": reader.int32(), "NameCount": reader.int32()} for _ in range(reader.count(8))
+    ]
+    if ue4 >= VER_UE4_ENGINE_VERSION_OBJECT:
+        summary["RecordedEngineVersion"] = read_engine_version(reader)
+    else:
+        reader.int32()  # EngineChangelist
+    if ue4 >= VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION:
+        summary["RecordedCompatibleWithEngineVersion"] = read_engine_version(reader)
+    summary["CompressionFlags"] = reader.uint32()
+    if reader.int32() != 0:
+        raise PackageReadError("Compressed packages are not supported")
+    summary["PackageSource"] = reader.uint32()
+    summary["AdditionalPackagesToCook"] = [reader.fstring() for _ in range(reader.count(4))]
+    if legacy > -7:
+        reader.int32()  # NumTextureAllocations
+    summary["AssetRegistryDataOffset"] = reader.int32()
+    summary["BulkDataStartOffset"] = reader.int64()
+    if ue4 >= VER_UE4_WORLD_LEVEL_INFO:
+        summary["WorldTileInfoDataOffset"] = reader.int32()
+    if ue4 >= VER_UE4_CHANGED_CHUNKID_TO_BE_AN_ARRAY_OF_CHUNKIDS:
+        summary["ChunkIDs"] = [reader.int32() for _ in range(reader.count(4))]
+    elif ue4 >= VER_UE4_ADDED_CHUNKID_TO_ASSETDATA_AND_UPACKAGE:
+        summary["ChunkIDs"] = [reader.int32()]
+    if ue4 >= VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+        summary["PreloadDependencyCount"] = reader.int32()
+        summary["PreloadDependencyOffset"] = reader.int32()
+    if ue5 >= VER_UE5_NAMES_REFERENCED_FROM_EXPORT_DATA:
+        summary["NamesReferencedFromExportDataCount"] = reader.int32()
+    if ue5 >= VER_UE5_PAYLOAD_TOC:
+        summary["PayloadTocOffset"] = reader.int64()
+    if ue5 >= VER_UE5_DATA_RESOURCES:
+        summary["DataResourceOffset"] = reader.int32()
+    return summary
+
+
+def read_name_map(reader: ByteReader, summary: dict) -> list[str]:
+    reader.pos = summary["NameOffset"]
+    names = []
+    for _ in range(summary["NameCount"]):
+        names.append(reader.fstring() or "")
+        if summary["ObjectVersion"] >= VER_UE4_NAME_HASHES_SERIALIZED:
+            reader.uint32()
+    return names
+
+
+def read_imports(reader: ByteReader, summary: dict) -> list[dict]:
+    reader.pos = summary["ImportOffset"]
+    imports = []
+    for _ in range(summary["ImportCount"]):
+        entry = {
+            "ClassPackage": reader.fname(),
+            "ClassName": reader.fname(),
+            "OuterIndex": reader.int32(),
+            "ObjectName": reader.fname(),
+        }
+        if summary["ObjectVersion"] >= VER_UE4_NON_OUTER_PACKAGE_IMPORT and not summary["IsFilterEditorOnly"]:
+            entry["PackageName"] = reader.fname()
+        if summary["ObjectVersionUE5"] >= VER_UE5_OPTIONAL_RESOURCES:
+            entry["bImportOptional"] = reader.bool32()
+        imports.append(entry)
+    return imports
+
+
+def read_exports(reader: ByteReader, summary: dict) -> list[dict]:
+    ue4 = summary["ObjectVersion"]
+    ue5 = summary["ObjectVersionUE5"]
+    reader.pos = summary["ExportOffset"]
+    exports = []
+    for _ in range(summary["ExportCount"]):
+        entry = {"ClassIndex": reader.int32(), "SuperIndex": reader.int32()}
+        entry["TemplateIndex"] = reader.int32() if ue4 >= VER_UE4_TEMPLATEINDEX_IN_COOKED_EXPORTS else 0
+        entry["OuterIndex"] = reader.int32()
+        entry["ObjectName"] = reader.fname()
+        entry["ObjectFlags"] = reader.uint32()
+        if ue4 >= VER_UE4_64BIT_EXPORTMAP_SERIALSIZES:
+            entry["SerialSize"] = reader.int64()
+            entry["SerialOffset"] = reader.int64()
+        else:
+            entry["SerialSize"] = reader.int32()
+            entry["SerialOffset"] = reader.int32()
+        entry["bForcedExport"] = reader.bool32()
+        entry["bNotForClient"] = reader.bool32()
+        entry["bNotForServer"] = reader.bool32()
+        if ue5 < VER_UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID:
+            reader.guid()
+        if ue5 >= VER_UE5_TRACK_OBJECT_EXPORT_IS_INHERITED:
+            entry["IsInheritedInstance"] = reader.bool32()
+        entry["PackageFlags"] = reader.uint32()
+        if ue4 >= VER_UE4_LOAD_FOR_EDITOR_GAME:
+            entry["bNotAlwaysLoadedForEditorGame"] = reader.bool32()
+        if ue4 >= VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT:
+            entry["bIsAsset"] = reader.bool32()
+        if ue5 >= VER_UE5_OPTIONAL_RESOURCES:
+            entry["GeneratePublicHash"] = reader.bool32()
+        if ue4 >= VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+            entry["FirstExportDependency"] = reader.int32()
+            entry["DependencyCounts"] = [reader.int32() for _ in range(4)]
+        # Only editor packages record where the script properties start and end.
+        if ue5 >= VER_UE5_SCRIPT_SERIALIZATION_OFFSET and not summary["IsFilterEditorOnly"]:
+            entry["ScriptSerializationStartOffset"] = reader.int64()
+            entry["ScriptSerializationEndOffset"] = reader.int64()
+        exports.append(entry)
+    return exports
+
+
+class Package:
+    """Header tables of a cooked .uasset, with export data read from the .uexp on demand."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.header = self.path.read_bytes()
+        reader = ByteReader(self.header)
+        self.summary = read_summary(reader)
+        self.names = read_name_map(reader, self.summary)
+        reader.names = self.names
+        self.imports = read_imports(reader, self.summary)
+        self.exports = read_exports(reader, self.summary)
+
+    @property
+    def unversioned(self) -> bool:
+        return self.summary["HasUnversionedProperties"]
+
+    def export_data(self, export: dict) -> bytes:
+        """Serialized bytes of one export (offsets span the .uasset followed by the .uexp)."""
+        offset = export["SerialOffset"]
+        size = export["SerialSize"]
+        if offset + size <= len(self.header):
+            return self.header[offset:offset + size]
+
+        uexp_path = self.path.with_suffix(".uexp")
+        try:
+            with uexp_path.open("rb") as f:
+                f.seek(offset - len(self.header))
+                data = f.read(size)
+        except OSError as exc:
+            raise PackageReadError(f"Cannot read export data from {uexp_path} ({exc})") from exc
+        if len(data) != size:
+            raise PackageReadError(f"{uexp_path} is truncated")
+        return data
+
+    def entry(self, index: int) -> dict | None:
+        """Import (negative index) or export (positive index) entry."""
+        if index < 0 and -index <= len(self.imports):
+            return self.imports[-index - 1]
+        if 0 < index <= len(self.exports):
+            return self.exports[index - 1]
+        return None
+
+    def object_path(self, index: int) -> str | None:
+        """Package.Object path of an import or export, like /Game/Foo/BP_Foo.BP_Foo_C."""
+        names = []
+        is_export = False
+        while index:
+            entry = self.entry(index)
+            if entry is None:
+                return None
+            names.append(entry["ObjectName"])
+            is_export = index > 0
+            index = entry["OuterIndex"]
+        if not names:
+            return None
+        if is_export:
+            names.append(self.summary["FolderName"] or "")
+        names.reverse()
+        return ".".join(names)
+
+    def default_export(self) -> dict | None:
+        for export in self.exports:
+            if export["ObjectName"].startswith("Default__"):
+                return export
+        return None
+
+    def find_export(self, name: str) -> tuple[int, dict] | None:
+        for idx, export in enumerate(self.exports, start=1):
+            if export["ObjectName"] == name:
+                return idx, export
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Mappings
+
+
+def read_usmap_name(reader: ByteReader, names: list[str]) -> str | None:
+    index = reader.int32()
+    if index == -1:
+        return None
+    if not 0 <= index < len(names):
+        raise PackageReadError(f"Mappings name index {index} out of range")
+    return names[index]
+
+
+def read_usmap_type(reader: ByteReader, names: list[str]) -> dict:
+    type_id = reader.uint8()
+    if type_id >= len(USMAP_PROPERTY_TYPES):
+        raise PackageReadError(f"Unknown mappings property type {type_id}")
+    prop = {"type": USMAP_PROPERTY_TYPES[type_id]}
+    if prop["type"] == "EnumProperty":
+        prop["inner"] = read_usmap_type(reader, names)
+        prop["enum"] = read_usmap_name(reader, names)
+    elif prop["type"] == "StructProperty":
+        prop["struct"] = read_usmap_name(reader, names)
+    elif prop["type"] in ("ArrayProperty", "SetProperty", "OptionalProperty"):
+        prop["inner"] = read_usmap_type(reader, names)
+    elif prop["type"] == "MapProperty":
+        prop["inner"] = read_usmap_type(reader, names)
+        prop["value"] = read_usmap_type(reader, names)
+    return prop
+
+
+class Usmap:
+    """Struct schemas from a .usmap mappings file (what UAssetGUI's mappings argument points at)."""
+
+    def __init__(self, path: Path) -> None:
+        reader = ByteReader(Path(path).read_bytes())
+        if reader.uint16() != USMAP_MAGIC:
+            raise PackageReadError(f"{path} is not a .usmap file")
+        version = reader.uint8()
+        if version > USMAP_VERSION_EXPLICIT_ENUM_VALUES:
+            raise PackageReadError(f"Unsupported .usmap version {version}")
+        if version >= USMAP_VERSION_PACKAGE_VERSIONING and reader.bool32():
+            reader.int32()
+            reader.int32()
+            read_custom_versions(reader, -8)
+            reader.uint32()
+
+        method = reader.uint8()
+        compressed_size = reader.uint32()
+        size = reader.uint32()
+        payload = reader.bytes(compressed_size)
+        reader = ByteReader(self._decompress(method, payload, size))
+
+        names = []
+        for _ in range(reader.uint32()):
+            length = reader.uint16() if version >= USMAP_VERSION_LONG_FNAME else reader.uint8()
+            try:
+                names.append(reader.bytes(length).decode("utf-8"))
+            except UnicodeDecodeError:
+                raise PackageReadError(f"Invalid UTF-8 name in mappings at offset {reader.pos - length}") from None
+
+        for _ in range(reader.uint32()):
+            read_usmap_name(reader, names)
+            count = reader.uint16() if version >= USMAP_VERSION_LARGE_ENUMS else reader.uint8()
+            for _ in range(count):
+                if version >= USMAP_VERSION_EXPLICIT_ENUM_VALUES:
+                    reader.int64()
+                read_usmap_name(reader, names)
+
+        # struct name -> (super name, schema slot count, {slot: (property name, type)})
+        self.structs: dict[str, tuple[str | None, int, dict[int, tuple[str, dict]]]] = {}
+        for _ in range(reader.uint32()):
+            name = read_usmap_name(reader, names)
+            super_name = read_usmap_name(reader, names)
+            slot_count = reader.uint16()
+            props = {}
+            for _ in range(reader.uint16()):
+                slot = reader.uint16()
+                array_dim = reader.uint8()
+                prop_name = read_usmap_name(reader, names)
+                prop_type = read_usmap_type(reader, names)
+                for offset in range(array_dim):
+                    props[slot + offset] = (prop_name, prop_type)
+            self.structs[name] = (super_name, slot_count, props)
+
+    @staticmethod
+    def _decompress(method: int, payload: bytes, size: int) -> bytes:
+        if method == 0:
+            return payload
+        if method == 3:
+            try:
+                import zstandard
+            except ImportError:
+                raise PackageReadError("Zstandard-compressed mappings need the 'zstandard' package") from None
+            return zstandard.ZstdDecompressor().decompress(payload, max_output_size=size)
+        if method == 2:
+            try:
+                import brotli
+            except ImportError:
+                raise PackageReadError("Brotli-compressed mappings need the 'brotli' package") from None
+            return brotli.decompress(payload)
+        raise PackageReadError("Oodle-compressed mappings are not supported; re-export them uncompressed")
+
+    def schema(self, struct_name: str) -> list[tuple[str, dict]] | None:
+        """Every schema slot of a struct, own properties first, then each super's."""
+        slots: list[tuple[str, dict]] = []
+        while struct_name is not None:
+            entry = self.structs.get(struct_name)
+            if entry is None:
+                return None
+            super_name, slot_count, props = entry
+            slots.extend(props.get(slot, ("", {"type": "Unknown"})) for slot in range(slot_count))
+            struct_name = super_name
+        return slots
+
+
+# ---------------------------------------------------------------------------
+# Property data
+
+
+def read_unversioned_header(reader: ByteReader) -> list[tuple[int, bool]]:
+    """FUnversionedHeader: (schema index, is_zero) for every serialized property."""
+    fragments = []
+    while True:
+        packed = reader.uint16()
+        fragments.append((packed & 0x7F, bool(packed & 0x80), packed >> 9))
+        if packed & 0x100:
+            break
+
+    zero_bits = sum(value_num for _, has_zeroes, value_num in fragments if has_zeroes)
+    mask = 0
+    if zero_bits:
+        if zero_bits <= 8:
+            mask = reader.uint8()
+        elif zero_bits <= 16:
+            mask = reader.uint16()
+        else:
+            for word in range((zero_bits + 31) // 32):
+                mask |= reader.uint32() << (32 * word)
+
+    entries = []
+    index = 0
+    zero_bit = 0
+    for skip, has_zeroes, value_num in fragments:
+        index += skip
+        for _ in range(value_num):
+            is_zero = False
+            if has_zeroes:
+                is_zero = bool(mask >> zero_bit & 1)
+                zero_bit += 1
+            entries.append((index, is_zero))
+            index += 1
+    return entries
+
+
+def read_type_name(reader: ByteReader, depth: int = 0) -> str:
+    """FPropertyTypeName (UE 5.4): a pre-order list of (name, inner count) nodes."""
+    if depth > MAX_TYPE_NAME_DEPTH:
+        raise PackageReadError(f"Property type name nested too deeply at offset {reader.pos}")
+    name = reader.fname()
+    params = [read_type_name(reader, depth + 1) for _ in range(reader.int32())]
+    return f"{name}({','.join(params)})" if params else name
+
+
+def read_tagged_property_names(reader: ByteReader, ue4: int, ue5: int) -> list[str]:
+    """Names of tagged (versioned) properties up to the terminating None tag."""
+    if ue5 >= VER_UE5_PROPERTY_TAG_EXTENSION_AND_OVERRIDABLE_SERIALIZATION:
+        if reader.uint8() & EXTENSION_OVERRIDABLE_INFORMATION:
+            reader.uint8()
+
+    names = []
+    while True:
+        name = reader.fname()
+        if name == "None":
+            return names
+        names.append(name)
+
+        if ue5 >= VER_UE5_PROPERTY_TAG_COMPLETE_TYPE_NAME:
+            read_type_name(reader)
+            size = reader.int32()
+            flags = reader.uint8()
+            if flags & TAG_HAS_ARRAY_INDEX:
+                reader.int32()
+            if flags & TAG_HAS_PROPERTY_GUID:
+                reader.skip(16)
+            if flags & TAG_HAS_PROPERTY_EXTENSIONS and reader.uint8() & EXTENSION_OVERRIDABLE_INFORMATION:
+                reader.skip(2)
+        else:
+            type_name = reader.fname()
+            size = reader.int32()
+            reader.int32()  # ArrayIndex
+            if type_name == "StructProperty":
+                reader.fname()
+                if ue4 >= VER_UE4_STRUCT_GUID_IN_PROPERTY_TAG:
+                    reader.skip(16)
+            elif type_name == "BoolProperty":
+                reader.uint8()
+            elif type_name in ("ByteProperty", "EnumProperty"):
+                reader.fname()
+            elif type_name == "ArrayProperty" and ue4 >= VER_UE4_ARRAY_PROPERTY_INNER_TAGS:
+                reader.fname()
+            elif type_name in ("SetProperty", "OptionalProperty") and ue4 >= VER_UE4_PROPERTY_TAG_SET_MAP_SUPPORT:
+                reader.fname()
+            elif type_name == "MapProperty" and ue4 >= VER_UE4_PROPERTY_TAG_SET_MAP_SUPPORT:
+                reader.fname()
+                reader.fname()
+            if ue4 >= VER_UE4_PROPERTY_GUID_IN_PROPERTY_TAG and reader.uint8():
+                reader.skip(16)
+            if ue5 >= VER_UE5_PROPERTY_TAG_EXTENSION_AND_OVERRIDABLE_SERIALIZATION:
+                if reader.uint8() & EXTENSION_OVERRIDABLE_INFORMATION:
+                    reader.skip(2)
+        reader.skip(size)
+
+
+def skip_text(reader: ByteReader) -> None:
+    reader.uint32()  # flags
+    history = reader.int8()
+    if history == -1:
+        if reader.bool32():
+            reader.fstring()
+    elif history == 0:
+        reader.fstring()
+        reader.fstring()
+        reader.fstring()
+    elif history == 11:
+        reader.fname()
+        reader.fstring()
+    else:
+        raise PackageReadError(f"Unsupported FText history type {history}")
+
+
+class ValueSkipper:
+    """Skips unversioned property values using .usmap type information."""
+
+    def __init__(self, usmap: Usmap, package: Package) -> None:
+        self.usmap = usmap
+        self.soft_path_list = package.summary.get("SoftObjectPathsCount", 0) > 0
+        self.ue5 = package.summary["ObjectVersionUE5"]
+
+    def skip_struct_properties(self, reader: ByteReader, struct_name: str) -> None:
+        schema = self.usmap.schema(struct_name)
+        if schema is None:
+            raise PackageReadError(f"Struct {struct_name} is not in the mappings")
+        for index, is_zero in read_unversioned_header(reader):
+            if index >= len(schema):
+                raise PackageReadError(f"Schema index {index} out of range for {struct_name}")
+            if not is_zero:
+                self.skip_value(reader, schema[index][1])
+
+    def skip_value(self, reader: ByteReader, prop: dict) -> None:
+        kind = prop["type"]
+        size = FIXED_VALUE_SIZES.get(kind)
+        if size is not None:
+            reader.skip(size)
+        elif kind == "EnumProperty":
+            self.skip_value(reader, prop["inner"])
+        elif kind in ("StrProperty", "Utf8StrProperty", "AnsiStrProperty"):
+            reader.fstring()
+        elif kind == "TextProperty":
+            skip_text(reader)
+        elif kind in ("SoftObjectProperty", "AssetObjectProperty"):
+            self.skip_soft_object_path(reader)
+        elif kind == "MulticastDelegateProperty":
+            reader.skip(reader.count(12) * 12)
+        elif kind == "FieldPathProperty":
+            reader.skip(reader.count(8) * 8)
+            reader.int32()
+        elif kind == "ArrayProperty":
+            for _ in range(reader.count()):
+                self.skip_value(reader, prop["inner"])
+        elif kind == "SetProperty":
+            for _ in range(reader.count()):
+                self.skip_value(reader, prop["inner"])
+            for _ in range(reader.count()):
+                self.skip_value(reader, prop["inner"])
+        elif kind == "MapProperty":
+            for _ in range(reader.count()):
+                self.skip_value(reader, prop["inner"])
+            for _ in range(reader.count()):
+                self.skip_value(reader, prop["inner"])
+                self.skip_value(reader, prop["value"])
+        elif kind == "OptionalProperty":
+            if reader.bool32():
+                self.skip_value(reader, prop["inner"])
+        elif kind == "StructProperty":
+            self.skip_struct(reader, prop["struct"])
+        else:
+            raise PackageReadError(f"Cannot skip a {kind} value")
+
+    def skip_soft_object_path(self, reader: ByteReader) -> None:
+        if self.soft_path_list:
+            reader.int32()
+            return
+        reader.fname()
+        if self.ue5 >= VER_UE5_FSOFTOBJECTPATH_REMOVE_ASSET_PATH_FNAMES:
+            reader.fname()
+        reader.fstring()
+
+    def skip_struct(self, reader: ByteReader, struct_name: str) -> None:
+        size = NATIVE_STRUCT_SIZES.get(struct_name)
+        if size is not None:
+            reader.skip(size)
+        elif struct_name in ("SoftObjectPath", "SoftClassPath"):
+            self.skip_soft_object_path(reader)
+        elif struct_name == "GameplayTagContainer":
+            reader.skip(reader.count(8) * 8)
+        else:
+            self.skip_struct_properties(reader, struct_name)
+
+
+# FProperty subclasses and the extra fields each one serializes after FProperty.
+_PROPERTY_OBJECT_REFS = {
+    "ByteProperty": 1, "ObjectProperty": 1, "WeakObjectProperty": 1, "LazyObjectProperty": 1,
+    "SoftObjectProperty": 1, "ObjectPtrProperty": 1, "InterfaceProperty": 1, "StructProperty": 1,
+    "DelegateProperty": 1, "MulticastDelegateProperty": 1, "MulticastInlineDelegateProperty": 1,
+    "MulticastSparseDelegateProperty": 1, "ClassProperty": 2, "ClassPtrProperty": 2, "SoftClassProperty": 2,
+}
+
+
+def read_fproperty(reader: ByteReader, type_name: str | None = None) -> dict | None:
+    """One serialized FProperty (UE 4.25+ ChildProperties entry)."""
+    if type_name is None:
+        type_name = reader.fname()
+        if type_name == "None":
+            return None
+    prop = {"type": type_name, "name": reader.fname()}
+    reader.uint32()  # object flags
+    prop["array_dim"] = reader.int32()
+    reader.int32()  # element size
+    reader.uint64()  # property flags
+    reader.uint16()  # rep index
+    reader.fname()  # rep notify func
+    reader.uint8()  # blueprint replication condition
+
+    if type_name == "BoolProperty":
+        reader.skip(6)
+    elif type_name == "EnumProperty":
+        reader.int32()
+        prop["inner"] = read_fproperty(reader)
+    elif type_name in ("ArrayProperty", "SetProperty", "OptionalProperty"):
+        prop["inner"] = read_fproperty(reader)
+    elif type_name == "MapProperty":
+        prop["inner"] = read_fproperty(reader)
+        prop["value"] = read_fproperty(reader)
+    elif type_name == "FieldPathProperty":
+        reader.fname()
+    else:
+        for _ in range(_PROPERTY_OBJECT_REFS.get(type_name, 0)):
+            reader.int32()
+    return prop
+
+
+def read_struct_tail(reader: ByteReader, export_count: int) -> tuple[int, list[dict]]:
+    """UStruct fields after the object part: SuperStruct, Children, ChildProperties, script sizes."""
+    super_index = reader.int32()
+    children = [reader.int32() for _ in range(reader.count(4))]
+    if any(child == 0 or child > export_count for child in children):
+        raise PackageReadError("Invalid UStruct children list")
+    properties = [read_fproperty(reader) for _ in range(reader.count(8))]
+    if reader.int32() < 0 or not 0 <= reader.int32() <= len(reader.data) - reader.pos:
+        raise PackageReadError("Invalid script bytecode size")
+    return super_index, properties
+
+
+# ---------------------------------------------------------------------------
+# Class schemas
+
+
+class ClassSchema:
+    """Property names occupying each unversioned schema slot of one class (not its supers)."""
+
+    def __init__(self, path: str, slots: list[str], super_path: str | None, native: bool = False) -> None:
+        self.path = path
+        self.slots = slots
+        self.super_path = super_path
+        self.native = native
+
+
+class SchemaResolver:
+    """Finds the class chain of an object and the property names of each class.
+
+    Blueprint classes are read from their own packages (/Game/... resolved
+    under content_root); native /Script/ classes, and blueprint packages that
+    cannot be found, come from the .usmap mappings when one is given.
+    """
+
+    def __init__(self, content_root: Path | None = None, usmap: Usmap | None = None) -> None:
+        self.content_root = Path(content_root) if content_root else None
+        self.usmap = usmap
+        self._packages: dict[Path, Package | None] = {}
+        self._classes: dict[str, ClassSchema | None] = {}
+
+    def package_file(self, package_path: str) -> Path | None:
+        if self.content_root is None or not package_path.startswith("/Game/"):
+            return None
+        return self.content_root / (package_path[len("/Game/"):] + ".uasset")
+
+    def load_package(self, path: Path) -> Package | None:
+        if path not in self._packages:
+            try:
+                self._packages[path] = Package(path) if path.is_file() else None
+            except (OSError, PackageReadError):
+                self._packages[path] = None
+        return self._packages[path]
+
+    def class_schema(self, class_path: str) -> ClassSchema | None:
+        if class_path not in self._classes:
+            self._classes[class_path] = self._load_class_schema(class_path)
+        return self._classes[class_path]
+
+    def _load_class_schema(self, class_path: str) -> ClassSchema | None:
+        package_path, _, class_name = class_path.rpartition(".")
+        if not package_path.startswith("/Script/"):
+            package_file = self.package_file(package_path)
+            package = self.load_package(package_file) if package_file else None
+            found = package.find_export(class_name) if package else None
+            if found is not None:
+                try:
+                    return blueprint_class_schema(package, found[1], self.usmap)
+                except PackageReadError:
+                    pass
+        return self._usmap_class_schema(class_path)
+
+    def _usmap_class_schema(self, class_path: str) -> ClassSchema | None:
+        if self.usmap is None:
+            return None
+        class_name = class_path.rpartition(".")[2]
+        entry = self.usmap.structs.get(class_name)
+        if entry is None:
+            return None
+        super_name, slot_count, props = entry
+        slots = [props.get(slot, ("",))[0] for slot in range(slot_count)]
+        # Mappings only carry the super's name; keep resolving through them.
+        return ClassSchema(class_path, slots, f"/Script/.{super_name}" if super_name else None, native=True)
+
+    def class_chain(self, package: Package, class_index: int) -> tuple[list[ClassSchema], bool]:
+        """Schemas from the object's class up through its supers, and whether the chain is complete."""
+        chain: list[ClassSchema] = []
+        if class_index > 0:
+            class_export = package.entry(class_index)
+            try:
+                schema = blueprint_class_schema(package, class_export, self.usmap)
+            except PackageReadError:
+                return chain, False
+        else:
+            class_path = package.object_path(class_index)
+            schema = self.class_schema(class_path) if class_path else None
+
+        while schema is not None:
+            chain.append(schema)
+            if schema.super_path is None:
+                return chain, True
+            schema = self.class_schema(schema.super_path)
+        return chain, False
+
+
+def locate_struct_tail(data: bytes, package: Package, export: dict) -> tuple[int, list[dict]]:
+    """Find and read the UStruct fields of a class export without a schema for its own properties.
+
+    The object part (unversioned properties of the UClass object, then the
+    object-GUID flag) is variable-sized, but it is followed by SuperStruct,
+    which the export map already records as SuperIndex. Candidate offsets are
+    accepted only if the rest of the UStruct layout parses cleanly.
+    """
+    super_bytes = _INT32.pack(0) + _INT32.pack(export["SuperIndex"])
+    start = 2
+    while True:
+        pos = data.find(super_bytes, start)
+        if pos == -1:
+            raise PackageReadError(f"Could not locate the UStruct data of {export['ObjectName']}")
+        reader = ByteReader(data, pos + 4, package.names)
+        try:
+            return read_struct_tail(reader, len(package.exports))
+        except PackageReadError:
+            start = pos + 1
+
+
+def blueprint_class_schema(package: Package, export: dict, usmap: Usmap | None) -> ClassSchema:
+    data = package.export_data(export)
+    tail = None
+    if package.unversioned and usmap is not None:
+        # Exact path: skip the UClass object's own properties using the mappings.
+        class_entry = package.entry(export["ClassIndex"])
+        try:
+            reader = ByteReader(data, 0, package.names)
+            ValueSkipper(usmap, package).skip_struct_properties(reader, class_entry["ObjectName"])
+            if reader.bool32():
+                reader.skip(16)
+            tail = read_struct_tail(reader, len(package.exports))
+        except (PackageReadError, TypeError):
+            tail = None
+    elif not package.unversioned:
+        reader = ByteReader(data, 0, package.names)
+        summary = package.summary
+        read_tagged_property_names(reader, summary["ObjectVersion"], summary["ObjectVersionUE5"])
+        if reader.bool32():
+            reader.skip(16)
+        tail = read_struct_tail(reader, len(package.exports))
+    if tail is None:
+        tail = locate_struct_tail(data, package, export)
+
+    super_index, properties = tail
+    slots = []
+    for prop in properties:
+        slots.extend([prop["name"]] * max(1, prop["array_dim"]))
+    class_path = f"{package.summary['FolderName']}.{export['ObjectName']}"
+    return ClassSchema(class_path, slots, package.object_path(super_index) if super_index else None)
+
+
+# ---------------------------------------------------------------------------
+# Default__ export
+
+
+def default_property_names(package: Package, resolver: SchemaResolver) -> tuple[dict, list[str | None], bool]:
+    """(Default__ export, its property names, whether every name was resolved).
+
+    Zero-valued properties of unversioned packages are included, as in
+    UAssetAPI's JSON (where they appear with IsZero set).
+    """
+    export = package.default_export()
+    if export is None:
+        return None, [], True
+
+    data = package.export_data(export)
+    reader = ByteReader(data, 0, package.names)
+    if not package.unversioned:
+        summary = package.summary
+        return export, read_tagged_property_names(reader, summary["ObjectVersion"], summary["ObjectVersionUE5"]), True
+
+    header = read_unversioned_header(reader)
+    chain, complete = resolver.class_chain(package, export["ClassIndex"])
+    names: list[str | None] = []
+    for index, _ in header:
+        names.append(resolve_slot(chain, index))
+    return export, names, complete and None not in names
+
+
+def resolve_slot(chain: list[ClassSchema], index: int) -> str | None:
+    for schema in chain:
+        if index < len(schema.slots):
+            return schema.slots[index]
+        index -= len(schema.slots)
+    return None
+
+
+def slot_of(chain: list[ClassSchema], prop_name: str) -> int | None:
+    """First schema slot holding prop_name in the resolved part of a class chain."""
+    base = 0
+    for schema in chain:
+        if prop_name in schema.slots:
+            return base + schema.slots.index(prop_name)
+        base += len(schema.slots)
+    return None
+
+
+def audit_default_property(path: Path, prop_name: str, resolver: SchemaResolver) -> dict:
+    """Whether the Default__ export of a .uasset sets prop_name.
+
+    Returns {"status", "object_name", "error"}; status is PRESENT, ABSENT,
+    MISSING_DEFAULT or UNRESOLVED (the class chain could not be resolved far
+    enough, e.g. a missing parent blueprint or no mappings for a native
+    property).
+    """
+    result = {"status": UNRESOLVED, "object_name": None, "error": None}
+    try:
+        package = Package(path)
+        export = package.default_export()
+        if export is None:
+            result["status"] = MISSING_DEFAULT
+            return result
+        result["object_name"] = export["ObjectName"]
+
+        if not package.unversioned:
+            _, names, _ = default_property_names(package, resolver)
+            result["status"] = PRESENT if prop_name in names else ABSENT
+            return result
+
+        header = read_unversioned_header(ByteReader(package.export_data(export)))
+        chain, complete = resolver.class_chain(package, export["ClassIndex"])
+    except (OSError, PackageReadError) as exc:
+        result["error"] = str(exc)
+        return result
+
+    slot = slot_of(chain, prop_name)
+    if slot is not None:
+        result["status"] = PRESENT if any(index == slot for index, _ in header) else ABSENT
+    elif complete:
+        result["status"] = ABSENT
+    else:
+        result["error"] = f"{prop_name} is not declared in the resolved classes ({', '.join(s.path for s in chain) or 'none'})"
+    return result
+
+
+def find_content_root(path: Path) -> Path | None:
+    """The Content directory a cooked asset lives under (/Game/ maps to it)."""
+    path = Path(path).resolve()
+    for parent in (path, *path.parents):
+        if parent.name == "Content":
+            return parent
+    return None
+
+
+def make_resolver(root: Path, content_root: Path | None = None, usmap_path: Path | None = None) -> SchemaResolver:
+    """Resolver for assets under root; raises PackageReadError for an unreadable .usmap."""
+    try:
+        usmap = Usmap(usmap_path) if usmap_path else None
+    except OSError as exc:
+        raise PackageReadError(f"Cannot read {usmap_path} ({exc})") from exc
+    return SchemaResolver(content_root or find_content_root(root), usmap)
+
+
+# ---------------------------------------------------------------------------
+# Cross-check against a UAssetGUI JSON dump
+
+
+def verify_against_json(package: Package, resolver: SchemaResolver, json_path: Path) -> list[str]:
+    """Differences between what this reader parsed and UAssetGUI's JSON of the same asset."""
+    with json_path.open("r", encoding="utf-8") as f:
+        dump = json.load(f)
+
+    problems = []
+    summary = package.summary
+    for key in (
+        "LegacyFileVersion", "FileVersionLicenseeUE", "IsUnversioned", "FolderName", "HasUnversionedProperties",
+        "IsFilterEditorOnly", "SoftObjectPathsCount", "SoftObjectPathsOffset", "SearchableNamesOffset",
+        "ThumbnailTableOffset", "CompressionFlags", "PackageSource", "ChunkIDs", "NamesReferencedFromExportDataCount",
+        "PayloadTocOffset", "DataResourceOffset", "AdditionalPackagesToCook",
+    ):
+        if key in dump and key in summary and dump[key] != summary[key]:
+            problems.append(f"summary {key}: reader {summary[key]!r}, JSON {dump[key]!r}")
+
+    if dump.get("NameMap") != package.names:
+        problems.append(f"name map differs ({len(package.names)} names read, {len(dump.get('NameMap') or [])} in JSON)")
+
+    for kind, ours, theirs, keys in (
+        ("import", package.imports, dump.get("Imports") or [], ("ObjectName", "ClassName", "ClassPackage", "OuterIndex")),
+        (
+            "export",
+            package.exports,
+            dump.get("Exports") or [],
+            ("ObjectName", "ClassIndex", "SuperIndex", "TemplateIndex", "OuterIndex", "SerialSize", "SerialOffset"),
+        ),
+    ):
+        if len(ours) != len(theirs):
+            problems.append(f"{kind} count: reader {len(ours)}, JSON {len(theirs)}")
+        for idx, (a, b) in enumerate(zip(ours, theirs), start=1):
+            for key in keys:
+                if a.get(key) != b.get(key):
+                    problems.append(f"{kind} {idx} {key}: reader {a.get(key)!r}, JSON {b.get(key)!r}")
+
+    export, names, complete = default_property_names(package, resolver)
+    json_default = next((e for e in dump.get("Exports") or [] if e.get("ObjectName", "").startswith("Default__")), None)
+    if export is not None and json_default is not None:
+        expected = [item.get("Name") for item in json_default.get("Data") or []]
+        if names != expected:
+            note = "" if complete else " (class chain not fully resolved)"
+            problems.append(f"Default__ properties{note}: reader {names}, JSON {expected}")
+    return problems
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Read the summary, name map and Default__ properties of a cooked UE 5.4 .uasset."
+    )
+    parser.add_argument("path", type=Path, help=".uasset file (its .uexp is read from the same folder)")
+    parser.add_argument(
+        "--content-root",
+        type=Path,
+        default=None,
+        help="Folder that /Game/ maps to, for parent blueprints (default: the asset's Content ancestor).",
+    )
+    parser.add_argument("--usmap", type=Path, default=None, help="Mappings file for native classes (e.g. ClairObscur5.usmap).")
+    parser.add_argument("--property", default=None, help="Report whether Default__ sets this property.")
+    parser.add_argument("--verify-json", type=Path, default=None, help="UAssetGUI JSON of the same asset to cross-check.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        package = Package(args.path)
+        resolver = make_resolver(args.path, args.content_root, args.usmap)
+    except (OSError, PackageReadError) as exc:
+        print(f"{args.path}: {exc}")
+        return 2
+
+    summary = package.summary
+    print(f"{summary['FolderName']}: UE4 {summary['ObjectVersion']}, UE5 {summary['ObjectVersionUE5']}, "
+          f"{'unversioned' if package.unversioned else 'tagged'} properties")
+    print(f"{len(package.names)} names, {len(package.imports)} imports, {len(package.exports)} exports")
+
+    try:
+        export, names, complete = default_property_names(package, resolver)
+    except PackageReadError as exc:
+        print(f"Default__ export: {exc}")
+        return 1
+    if export is None:
+        print("Default__ export not found")
+    else:
+        print(f"{export['ObjectName']}: {', '.join(name or '?' for name in names) or '(no properties)'}")
+        if not complete:
+            print("Some properties could not be named; pass --usmap and/or --content-root.")
+
+    if args.property:
+        result = audit_default_property(args.path, args.property, resolver)
+        print(f"{args.property}: {result['status']}" + (f" ({result['error']})" if result["error"] else ""))
+
+    if args.verify_json:
+        problems = verify_against_json(package, resolver, args.verify_json)
+        for problem in problems:
+            print(f"MISMATCH {problem}")
+        print("JSON cross-check: " + ("OK" if not problems else f"{len(problems)} difference(s)"))
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,11 @@
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import write_json
+
 INFILE = Path("input/ST_Enemies_Skills.uasset.json")
 OUTFILE = Path("output/Modded-ST_Enemies_Skills.uasset.json")
 
@@ -230,6 +235,4 @@ print("Unchanged strings:")
 for s in unchanged:
     print(s)
 
-OUTFILE.parent.mkdir(parents=True, exist_ok=True)
-with OUTFILE.open("w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
+write_json(OUTFILE, data, indent=2, ensure_ascii=False)
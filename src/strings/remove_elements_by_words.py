@@ -3,6 +3,10 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import write_json
+
 
 # Editable list of words to match (case-insensitive).
 # If either string in a [str, str] element contains any word below,
@@ -164,8 +168,7 @@ def main() -> int:
     updated_data, removed = remove_matching_elements(data, patterns)
 
     output_path = input_path.with_name(f"Adj-{input_path.name}")
-    with output_path.open("w", encoding="utf-8") as outfile:
-        json.dump(updated_data, outfile, indent=2, ensure_ascii=False)
+    write_json(output_path, updated_data, indent=2, ensure_ascii=False)
 
     print(f"Removed {removed} elements.")
     print(f"Saved: {output_path}")
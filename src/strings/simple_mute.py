@@ -1,6 +1,13 @@
-import json
+import argparse
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.asset_daemon import run_in_daemon
+from common.atomic_write import write_json
+from common.uasset_json import load_json
+
 INFILE = Path("input/ST_Enemies_Skills.uasset.json")
 OUTFILE = Path("../../output/strings/Modded-ST_Enemies_Skills.uasset.json")
 
@@ -129,9 +136,21 @@ def find_value_lists(obj):
             yield from find_value_lists(item)
 
 
-def main() -> None:
-    with INFILE.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mute attack strings in an enemy skills string table.")
+    parser.add_argument("--input", type=Path, default=INFILE, help=f"Input JSON file (default: {INFILE})")
+    parser.add_argument("--output", type=Path, default=OUTFILE, help=f"Output JSON file (default: {OUTFILE})")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    remote_exit = run_in_daemon("simple_mute", argv)
+    if remote_exit is not None:
+        return remote_exit
+
+    data = load_json(args.input)
 
     value_lists = list(find_value_lists(data))
     if not value_lists and isinstance(data, dict) and isinstance(data.get("Value"), list):
@@ -152,10 +171,9 @@ def main() -> None:
     for item in unchanged:
         print(item)
 
-    OUTFILE.parent.mkdir(parents=True, exist_ok=True)
-    with OUTFILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json(args.output, data, indent=2, ensure_ascii=False)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
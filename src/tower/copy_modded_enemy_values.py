@@ -1,16 +1,18 @@
 import argparse
 import copy
-import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.atomic_write import write_document
+from common.row_models import EnemyRow, NameResolver, decode_rows, report_names
+from common.uasset_json import load_document
+
 TARGET_DEFAULT = Path("input/Tower-DT_jRPG_Enemies.json")
 SOURCE_DEFAULT = Path("../../output/enemies/Modded-DT_jRPG_Enemies.uasset.json")
 OUTPUT_DEFAULT = Path("../../output/tower/Patched-Tower-DT_jRPG_Enemies.json")
 
-STRUCT_TYPE = "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI"
-ENEMY_STRUCT = "S_jRPG_Enemy"
-SCALING_STRUCT = "S_EnemyScalingMultipliers"
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -20,7 +22,12 @@ def parse_args() -> argparse.Namespace:
         )
     )
     parser.add_argument("--target", type=Path, default=TARGET_DEFAULT, help=f"Target JSON file (default: {TARGET_DEFAULT})")
-    parser.add_argument("--source", type=Path, default=SOURCE_DEFAULT, help=f"Source JSON file (default: {SOURCE_DEFAULT})")
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=SOURCE_DEFAULT,
+        help=f"Source JSON or intermediate (.eoim) file (default: {SOURCE_DEFAULT})",
+    )
     parser.add_argument("--out", type=Path, default=OUTPUT_DEFAULT, help=f"Output JSON file (default: {OUTPUT_DEFAULT})")
     parser.add_argument(
         "--in-place",
@@ -31,58 +38,28 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # Only the enemy rows are needed; other sections are written back verbatim.
+    return load_document(path, sections=("Exports", "Data"))
 
 
-def iter_enemy_rows(data: dict):
+def iter_enemy_rows(data: dict, resolver: NameResolver | None = None):
     exports = data.get("Exports", [])
     for export in exports:
         table = export.get("Table")
         if not isinstance(table, dict):
             continue
-        rows = table.get("Data", [])
-        if not isinstance(rows, list):
-            continue
-        for row in rows:
-            if (
-                isinstance(row, dict)
-                and row.get("$type") == STRUCT_TYPE
-                and row.get("StructType") == ENEMY_STRUCT
-            ):
-                yield row
+        yield from decode_rows(EnemyRow, table.get("Data", []), resolver)
 
     # Fallback for simpler extracts with root-level Data.
-    rows = data.get("Data", [])
-    if isinstance(rows, list):
-        for row in rows:
-            if (
-                isinstance(row, dict)
-                and row.get("$type") == STRUCT_TYPE
-                and row.get("StructType") == ENEMY_STRUCT
-            ):
-                yield row
-
-
-def find_scaling_struct(enemy_row: dict) -> dict | None:
-    for item in enemy_row.get("Value", []):
-        if (
-            isinstance(item, dict)
-            and item.get("$type") == STRUCT_TYPE
-            and item.get("StructType") == SCALING_STRUCT
-            and isinstance(item.get("Value"), list)
-        ):
-            return item
-    return None
-
-
-def build_source_scaling_map(source_data: dict) -> dict[str, list]:
+    yield from decode_rows(EnemyRow, data.get("Data", []), resolver)
+
+
+def build_source_scaling_map(source_data: dict, resolver: NameResolver | None = None) -> dict[str, list]:
     value_map: dict[str, list] = {}
-    for row in iter_enemy_rows(source_data):
-        name = row.get("Name")
-        scaling = find_scaling_struct(row)
-        if isinstance(name, str) and scaling is not None:
-            value_map[name] = scaling["Value"]
+    for enemy in iter_enemy_rows(source_data, resolver):
+        name = enemy.row.get("Name")
+        if isinstance(name, str) and enemy.scaling is not None:
+            value_map[name] = enemy.scaling.row["Value"]
     return value_map
 
 
@@ -99,7 +76,9 @@ def main() -> int:
     target_data = load_json(args.target)
     source_data = load_json(args.source)
 
-    source_values = build_source_scaling_map(source_data)
+    source_resolver = NameResolver()
+    source_values = build_source_scaling_map(source_data, source_resolver)
+    report_names(source_resolver, args.source)
     if not source_values:
         print("ERROR: No source enemy scaling rows found.")
         return 1
@@ -114,10 +93,11 @@ def main() -> int:
     missing: list[str] = []
     missing_scaling_target: list[str] = []
 
-    for row in iter_enemy_rows(target_data):
+    target_resolver = NameResolver()
+    for enemy in iter_enemy_rows(target_data, target_resolver):
         stats["target_rows"] += 1
 
-        target_name = row.get("Name")
+        target_name = enemy.row.get("Name")
         if not isinstance(target_name, str):
             stats["target_without_name"] += 1
             continue
@@ -127,20 +107,19 @@ def main() -> int:
             missing.append(target_name)
             continue
 
-        target_scaling = find_scaling_struct(row)
+        target_scaling = enemy.scaling
         if target_scaling is None:
             stats["missing_scaling_in_target"] += 1
             missing_scaling_target.append(target_name)
             continue
 
         # Copy only the nested scaling payload modified by scale_enemies.py.
-        target_scaling["Value"] = copy.deepcopy(source_values[target_name])
+        target_scaling.row["Value"] = copy.deepcopy(source_values[target_name])
         stats["replaced_exact"] += 1
+    report_names(target_resolver, args.target)
 
     output_path = args.target if args.in_place else args.out
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(target_data, f, indent=2)
+    write_document(output_path, target_data)
 
     print("Done.")
     print(f"Target rows scanned: {stats['target_rows']}")
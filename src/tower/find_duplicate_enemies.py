@@ -1,14 +1,19 @@
 import argparse
-import json
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.asset_daemon import run_in_daemon
+from common.uasset_json import load_json
+
 DEFAULT_INPUT = Path("input/Tower-DT_jRPG_Enemies.json")
 ENEMY_STRUCT = "S_jRPG_Enemy"
 SUFFIX_RE = re.compile(r"^(.*?)(\d+)$")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
             "Find duplicate enemy names represented as numeric-suffix variants "
@@ -29,12 +34,7 @@ def parse_args() -> argparse.Namespace:
             "(for example: Name2 + Name3 without Name)."
         ),
     )
-    return parser.parse_args()
-
-
-def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return parser.parse_args(argv)
 
 
 def extract_enemy_names(data: dict) -> list[str]:
@@ -113,14 +113,18 @@ def natural_sort_key(text: str) -> list[object]:
     return [int(token) if token.isdigit() else token.lower() for token in re.split(r"(\d+)", text)]
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    remote_exit = run_in_daemon("find_duplicate_enemies", argv)
+    if remote_exit is not None:
+        return remote_exit
 
     if not args.file.exists():
         print(f"ERROR: File not found: {args.file}")
         return 1
 
-    data = load_json(args.file)
+    data = load_json(args.file, shared=True)
     enemy_names = extract_enemy_names(data)
 
     if not enemy_names:
@@ -0,0 +1,42 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from common.uasset_json import CompactRecord, encode_intermediate, json_default, load_json
+
+REFERENCE = Path(__file__).resolve().parents[2] / "src" / "spawn" / "reference"
+
+
+def records(value):
+    if isinstance(value, CompactRecord):
+        yield value
+    values = value.values() if isinstance(value, (dict, CompactRecord)) else value if isinstance(value, list) else []
+    for item in values:
+        yield from records(item)
+
+
+@pytest.mark.parametrize("options", [{"intern": True}, {"compact": True}])
+def test_intermediate_load_honours_intern_and_compact(tmp_path: Path, options: dict):
+    source = sorted(REFERENCE.rglob("*.json"))[0]
+    intermediate = tmp_path / "document.eoim"
+    intermediate.write_bytes(encode_intermediate(load_json(source)))
+
+    expected = load_json(source, **options)
+    loaded = load_json(intermediate, **options)
+
+    assert json.dumps(loaded, default=json_default) == json.dumps(expected, default=json_default)
+    assert len(list(records(loaded))) == len(list(records(expected)))
+    name = loaded["Exports"][0]["ObjectName"]
+    assert name is sys.intern(name)
+
+
+def test_intermediate_from_another_python_is_rejected(tmp_path: Path):
+    intermediate = tmp_path / "document.eoim"
+    content = bytearray(encode_intermediate({"Exports": []}))
+    content[9] ^= 0xFF  # interpreter minor version
+    intermediate.write_bytes(content)
+
+    with pytest.raises(ValueError, match="regenerate it"):
+        load_json(intermediate)
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# The scripts import their siblings directly (from prefilter import ...) and
+# shared code as common.*, so both folders go on the path.
+sys.path.insert(0, str(SRC))
+sys.path.insert(0, str(SRC / "spawn"))
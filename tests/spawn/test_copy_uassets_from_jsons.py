@@ -0,0 +1,34 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import copy_uassets_from_jsons
+
+
+def test_scan_dirs_does_not_follow_symlink_loops(tmp_path: Path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    os.symlink(tmp_path / "a", tmp_path / "a" / "b" / "loop", target_is_directory=True)
+
+    dirs, changed = copy_uassets_from_jsons.scan_dirs(tmp_path, {})
+    assert sorted(dirs) == ["", "a", "a/b"] and changed
+    assert copy_uassets_from_jsons.scan_dirs(tmp_path, dirs) == (dirs, False)
+
+
+def test_plain_copy_over_an_earlier_hard_link_is_skipped(tmp_path: Path):
+    source = tmp_path / "source" / "BP_Test.uasset"
+    source.parent.mkdir()
+    source.write_bytes(b"package")
+    dest = tmp_path / "staging" / "BP_Test.uasset"
+
+    assert copy_uassets_from_jsons.stage_file(source, dest, sync=False, use_hash=False, link=True) == "linked"
+    assert copy_uassets_from_jsons.stage_file(source, dest, sync=False, use_hash=False, link=False) == "skipped"
+    assert os.path.samefile(source, dest)
+
+
+def test_hash_without_sync_is_rejected(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["copy_uassets_from_jsons.py", "Enemies", "--hash"])
+    with pytest.raises(SystemExit) as exc:
+        copy_uassets_from_jsons.main()
+    assert exc.value.code == 2
+    assert "--hash requires --sync" in capsys.readouterr().err
@@ -0,0 +1,43 @@
+import shutil
+from pathlib import Path
+
+import reference_index
+
+REFERENCE = Path(__file__).resolve().parents[2] / "src" / "spawn" / "reference"
+
+
+def make_tree(tmp_path: Path) -> Path:
+    dumps = sorted(REFERENCE.rglob("*.json"))[:2]
+    root = tmp_path / "dumps"
+    (root / "nested").mkdir(parents=True)
+    shutil.copy(dumps[0], root / "top.json")
+    shutil.copy(dumps[1], root / "nested" / "inner.json")
+    return root
+
+
+def indexed_paths(conn) -> list[str]:
+    return [Path(row[0]).name for row in conn.execute("SELECT path FROM files ORDER BY path")]
+
+
+def test_non_recursive_update_skips_and_keeps_subdirectories(tmp_path: Path):
+    root = make_tree(tmp_path)
+    conn = reference_index.connect(tmp_path / "index.sqlite")
+
+    assert reference_index.update_index(conn, [root], recursive=False) == (1, 0, 0)
+    assert indexed_paths(conn) == ["top.json"]
+
+    assert reference_index.update_index(conn, [root]) == (1, 0, 1)
+    assert reference_index.update_index(conn, [root], recursive=False) == (0, 0, 1)
+    assert indexed_paths(conn) == ["inner.json", "top.json"]
+    conn.close()
+
+
+def test_file_deleted_during_scan_is_skipped(tmp_path: Path, monkeypatch):
+    root = make_tree(tmp_path)
+    conn = reference_index.connect(tmp_path / "index.sqlite")
+    real_rglob = Path.rglob
+    monkeypatch.setattr(Path, "rglob", lambda self, pattern: [*real_rglob(self, pattern), self / "gone.json"])
+
+    assert reference_index.update_index(conn, [root]) == (2, 0, 0)
+    assert indexed_paths(conn) == ["inner.json", "top.json"]
+    conn.close()
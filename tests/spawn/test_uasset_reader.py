@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import check_respawns_on_rest
+import list_no_fix
+import uasset_builder
+import uasset_reader as ur
+from prefilter import ABSENT, PRESENT
+
+REFERENCE = Path(__file__).resolve().parents[2] / "src" / "spawn" / "reference"
+DUMPS = sorted(REFERENCE.rglob("*.json"))
+
+
+def build(dump: dict, tmp_path: Path) -> tuple[Path, ur.SchemaResolver]:
+    uasset = tmp_path / "Content" / "BP_Test.uasset"
+    usmap = tmp_path / "mappings.usmap"
+    uasset_builder.build_from_dump(dump, uasset, usmap)
+    return uasset, ur.SchemaResolver(None, ur.Usmap(usmap))
+
+
+def test_reference_dumps_found():
+    assert DUMPS
+
+
+@pytest.mark.parametrize("dump_path", DUMPS, ids=lambda path: path.relative_to(REFERENCE).as_posix())
+def test_reader_matches_uassetgui_dump(dump_path: Path, tmp_path: Path):
+    dump = json.loads(dump_path.read_text(encoding="utf-8"))
+    uasset, resolver = build(dump, tmp_path)
+
+    assert ur.verify_against_json(ur.Package(uasset), resolver, dump_path) == []
+
+    default = next(e for e in dump["Exports"] if e["ObjectName"].startswith("Default__"))
+    expected = PRESENT if any(item["Name"] == "RespawnsOnRest" for item in default["Data"]) else ABSENT
+    audit = ur.audit_default_property(uasset, "RespawnsOnRest", resolver)
+    assert (audit["status"], audit["object_name"]) == (expected, default["ObjectName"])
+
+
+@pytest.fixture
+def sample_dump() -> dict:
+    return json.loads(DUMPS[0].read_text(encoding="utf-8"))
+
+
+def test_unversioned_header_fragments_and_zero_mask():
+    flags = [index % 3 == 0 for index in range(300)]
+    entries = ur.read_unversioned_header(ur.ByteReader(uasset_builder.unversioned_header(flags)))
+    assert entries == list(enumerate(flags))
+    assert ur.read_unversioned_header(ur.ByteReader(uasset_builder.unversioned_header([]))) == []
+
+
+def test_bad_utf16_string_is_a_read_error(sample_dump: dict, tmp_path: Path):
+    sample_dump["FolderName"] = "/Game/\ud800Broken"
+    uasset, resolver = build(sample_dump, tmp_path)
+
+    with pytest.raises(ur.PackageReadError, match="UTF-16"):
+        ur.Package(uasset)
+    audit = ur.audit_default_property(uasset, "RespawnsOnRest", resolver)
+    assert audit["status"] == ur.UNRESOLVED and "UTF-16" in audit["error"]
+
+
+def test_deeply_nested_type_name_is_a_read_error():
+    w = uasset_builder.ByteWriter(["ArrayProperty"])
+    for _ in range(ur.MAX_TYPE_NAME_DEPTH + 2):
+        w.fname("ArrayProperty")
+        w.int32(1)
+    with pytest.raises(ur.PackageReadError, match="nested"):
+        ur.read_type_name(ur.ByteReader(bytes(w.data), names=w.names))
+
+
+def test_uasset_audits_continue_past_unexpected_errors(sample_dump: dict, tmp_path: Path, monkeypatch, capsys):
+    good, resolver = build(sample_dump, tmp_path)
+    bad = tmp_path / "Content" / "BP_Bad.uasset"
+    bad.write_bytes(good.read_bytes())
+    real_audit = ur.audit_default_property
+
+    def audit(path, prop_name, resolver):
+        if Path(path) == bad:
+            raise RuntimeError("boom")
+        return real_audit(path, prop_name, resolver)
+
+    monkeypatch.setattr(list_no_fix, "audit_default_property", audit)
+    monkeypatch.setattr(check_respawns_on_rest, "audit_default_property", audit)
+
+    assert list_no_fix.list_from_uassets([bad, good], "RespawnsOnRest", resolver) == 0
+    assert f"{bad}: cannot read package (boom)" in capsys.readouterr().out
+
+    report = check_respawns_on_rest.process_uasset_report(bad, resolver)
+    assert report["status"] == "error" and "boom" in report["error"]
@@ -0,0 +1,275 @@
+import struct
+from pathlib import Path
+
+import uasset_reader as ur
+
+# Only what the reference dumps use: cooked, unversioned, editor-only UE 5.4
+# packages (LegacyFileVersion -8).
+PACKAGE_FLAGS = {
+    "PKG_None": 0,
+    "PKG_Cooked": 0x00000200,
+    "PKG_RequiresLocalizationGather": 0x00040000,
+    "PKG_UnversionedProperties": ur.PKG_UNVERSIONED_PROPERTIES,
+    "PKG_FilterEditorOnly": ur.PKG_FILTER_EDITOR_ONLY,
+}
+LEGACY_UE3_VERSION = 864
+
+# FUnversionedHeader fragments hold at most 127 values.
+MAX_FRAGMENT_VALUES = 0x7F
+
+
+class ByteWriter:
+    """Little-endian writer mirroring uasset_reader.ByteReader."""
+
+    def __init__(self, names: list[str] | None = None) -> None:
+        self.data = bytearray()
+        self.names = names or []
+
+    def pack(self, fmt: str, *values) -> None:
+        self.data += struct.pack("<" + fmt, *values)
+
+    def int32(self, value: int) -> None:
+        self.pack("i", value)
+
+    def uint32(self, value: int) -> None:
+        self.pack("I", value)
+
+    def int64(self, value: int) -> None:
+        self.pack("q", value)
+
+    def bool32(self, value: bool) -> None:
+        self.int32(1 if value else 0)
+
+    def guid(self, text: str | None) -> None:
+        digits = (text or "").strip("{}").replace("-", "") or "0" * 32
+        self.pack("4I", *(int(digits[8 * k:8 * k + 8], 16) for k in range(4)))
+
+    def fstring(self, text: str | None) -> None:
+        if text is None:
+            self.int32(0)
+        elif text.isascii():
+            raw = text.encode("ascii") + b"\0"
+            self.int32(len(raw))
+            self.data += raw
+        else:
+            raw = text.encode("utf-16-le", "surrogatepass") + b"\0\0"
+            self.int32(-(len(raw) // 2))
+            self.data += raw
+
+    def fname(self, name: str) -> None:
+        """Name map index and number; Foo_2 is written as Foo with number 3 unless Foo_2 is itself a name."""
+        number = 0
+        if name not in self.names:
+            base, _, suffix = name.rpartition("_")
+            if not (suffix.isdigit() and base in self.names):
+                raise ValueError(f"{name} is not in the name map")
+            name, number = base, int(suffix) + 1
+        self.int32(self.names.index(name))
+        self.int32(number)
+
+
+def package_flags(text: str) -> int:
+    return sum(PACKAGE_FLAGS[flag.strip()] for flag in text.split(","))
+
+
+def write_engine_version(w: ByteWriter, version: dict) -> None:
+    w.pack("HHHI", version["Major"], version["Minor"], version["Patch"], version["Changelist"])
+    w.fstring(version["Branch"])
+
+
+def write_summary(w: ByteWriter, dump: dict, offsets: dict) -> None:
+    """FPackageFileSummary in the order uasset_reader.read_summary reads it."""
+    w.uint32(ur.PACKAGE_FILE_TAG)
+    w.int32(dump["LegacyFileVersion"])
+    w.int32(LEGACY_UE3_VERSION)
+    w.pack("iii", 0, 0, dump["FileVersionLicenseeUE"])
+    w.int32(len(dump["CustomVersionContainer"]))
+    for version in dump["CustomVersionContainer"]:
+        w.guid(version["Key"])
+        w.int32(version["Version"])
+    w.int32(offsets["TotalHeaderSize"])
+    w.fstring(dump["FolderName"])
+    w.uint32(package_flags(dump["PackageFlags"]))
+    w.pack("ii", len(dump["NameMap"]), offsets["NameOffset"])
+    w.pack("ii", dump["SoftObjectPathsCount"], dump["SoftObjectPathsOffset"])
+    w.pack("ii", 0, 0)  # gatherable text data
+    w.pack("ii", len(dump["Exports"]), offsets["ExportOffset"])
+    w.pack("ii", len(dump["Imports"]), offsets["ImportOffset"])
+    w.int32(offsets["DependsOffset"])
+    w.pack("ii", 0, 0)  # soft package references
+    w.int32(dump["SearchableNamesOffset"])
+    w.int32(dump["ThumbnailTableOffset"])
+    w.guid(dump["PackageGuid"])
+    w.int32(len(dump["Generations"]))
+    for generation in dump["Generations"]:
+        w.pack("ii", generation["ExportCount"], generation["NameCount"])
+    write_engine_version(w, dump["RecordedEngineVersion"])
+    write_engine_version(w, dump["RecordedCompatibleWithEngineVersion"])
+    w.uint32(dump["CompressionFlags"])
+    w.int32(0)  # compressed chunks
+    w.uint32(dump["PackageSource"])
+    w.int32(len(dump["AdditionalPackagesToCook"]))
+    for package in dump["AdditionalPackagesToCook"]:
+        w.fstring(package)
+    w.int32(0)  # asset registry data offset
+    w.int64(0)  # bulk data start offset
+    w.int32(0)  # world tile info data offset
+    w.int32(len(dump["ChunkIDs"]))
+    for chunk in dump["ChunkIDs"]:
+        w.int32(chunk)
+    w.pack("ii", 0, 0)  # preload dependencies
+    w.int32(dump["NamesReferencedFromExportDataCount"])
+    w.int64(dump["PayloadTocOffset"])
+    w.int32(dump["DataResourceOffset"])
+
+
+def write_import(w: ByteWriter, entry: dict) -> None:
+    w.fname(entry["ClassPackage"])
+    w.fname(entry["ClassName"])
+    w.int32(entry["OuterIndex"])
+    w.fname(entry["ObjectName"])
+    w.bool32(entry["bImportOptional"])
+
+
+def write_export(w: ByteWriter, entry: dict) -> None:
+    w.pack("iiii", entry["ClassIndex"], entry["SuperIndex"], entry["TemplateIndex"], entry["OuterIndex"])
+    w.fname(entry["ObjectName"])
+    w.uint32(0)  # object flags
+    w.pack("qq", entry["SerialSize"], entry["SerialOffset"])
+    for key in ("bForcedExport", "bNotForClient", "bNotForServer", "IsInheritedInstance"):
+        w.bool32(entry[key])
+    w.uint32(0)  # package flags
+    for key in ("bNotAlwaysLoadedForEditorGame", "bIsAsset", "GeneratePublicHash"):
+        w.bool32(entry[key])
+    w.int32(-1)  # first export dependency
+    w.pack("4i", 0, 0, 0, 0)
+
+
+def unversioned_header(entries: list[bool]) -> bytes:
+    """FUnversionedHeader for schema slots 0..len(entries)-1; entries are the is_zero flags."""
+    w = ByteWriter()
+    runs = [entries[i:i + MAX_FRAGMENT_VALUES] for i in range(0, len(entries), MAX_FRAGMENT_VALUES)] or [[]]
+    zero_bits = []
+    for index, run in enumerate(runs):
+        has_zeroes = any(run)
+        last = index == len(runs) - 1
+        w.pack("H", (0x80 if has_zeroes else 0) | (0x100 if last else 0) | len(run) << 9)
+        if has_zeroes:
+            zero_bits.extend(run)
+    mask = sum(1 << bit for bit, is_zero in enumerate(zero_bits) if is_zero)
+    if 0 < len(zero_bits) <= 8:
+        w.pack("B", mask)
+    elif 8 < len(zero_bits) <= 16:
+        w.pack("H", mask)
+    elif zero_bits:
+        for word in range((len(zero_bits) + 31) // 32):
+            w.uint32(mask >> (32 * word) & 0xFFFFFFFF)
+    return bytes(w.data)
+
+
+def class_export_data(super_index: int) -> bytes:
+    """A blueprint class export with no object properties and no properties of its own."""
+    w = ByteWriter()
+    w.data += unversioned_header([])
+    w.bool32(False)  # object GUID
+    w.int32(super_index)
+    w.int32(0)  # children
+    w.int32(0)  # child properties
+    w.pack("ii", 0, 0)  # script bytecode sizes
+    return bytes(w.data)
+
+
+def usmap_bytes(structs: list[tuple[str, str | None, list[str]]]) -> bytes:
+    """Uncompressed version 0 mappings; every property is typed BoolProperty (only names and slots matter)."""
+    names: list[str] = []
+
+    def name_index(name: str) -> int:
+        if name not in names:
+            names.append(name)
+        return names.index(name)
+
+    body = ByteWriter()
+    body.uint32(len(structs))
+    for name, super_name, props in structs:
+        body.pack("ii", name_index(name), name_index(super_name) if super_name else -1)
+        body.pack("HH", len(props), len(props))
+        for slot, prop in enumerate(props):
+            body.pack("HBiB", slot, 1, name_index(prop), ur.USMAP_PROPERTY_TYPES.index("BoolProperty"))
+
+    payload = ByteWriter()
+    payload.uint32(len(names))
+    for name in names:
+        raw = name.encode("utf-8")
+        payload.pack("B", len(raw))
+        payload.data += raw
+    payload.uint32(0)  # enums
+    payload.data += body.data
+
+    w = ByteWriter()
+    w.pack("HBBII", ur.USMAP_MAGIC, 0, 0, len(payload.data), len(payload.data))
+    return bytes(w.data + payload.data)
+
+
+def entry_of(dump: dict, index: int) -> dict:
+    return dump["Imports"][-index - 1] if index < 0 else dump["Exports"][index - 1]
+
+
+def build_from_dump(dump: dict, uasset_path: Path, usmap_path: Path) -> None:
+    """Write a .uasset/.uexp pair with the header tables of a UAssetGUI dump, plus mappings for it.
+
+    Exports keep their SerialOffset and SerialSize and are zero-filled, except
+    the Default__ export, whose unversioned header lists one schema slot per
+    property in its Data, and its blueprint class. The mappings give the
+    class's parent one slot per Default__ property, so the reader resolves
+    the same property names the dump has.
+    """
+    names = dump["NameMap"]
+    imports = ByteWriter(names)
+    for entry in dump["Imports"]:
+        write_import(imports, entry)
+    exports = ByteWriter(names)
+    for entry in dump["Exports"]:
+        write_export(exports, entry)
+
+    header_size = min(entry["SerialOffset"] for entry in dump["Exports"])
+    offsets = dict.fromkeys(("TotalHeaderSize", "NameOffset", "ImportOffset", "ExportOffset", "DependsOffset"), 0)
+    summary = ByteWriter(names)
+    write_summary(summary, dump, offsets)
+    name_map = ByteWriter(names)
+    for name in names:
+        name_map.fstring(name)
+        name_map.uint32(0)  # hash
+    offsets["TotalHeaderSize"] = header_size
+    offsets["NameOffset"] = len(summary.data)
+    offsets["ImportOffset"] = offsets["NameOffset"] + len(name_map.data)
+    offsets["ExportOffset"] = offsets["ImportOffset"] + len(imports.data)
+    offsets["DependsOffset"] = offsets["ExportOffset"] + len(exports.data)
+    summary = ByteWriter(names)
+    write_summary(summary, dump, offsets)
+    header = summary.data + name_map.data + imports.data + exports.data
+    if len(header) > header_size:
+        raise ValueError(f"Generated header ({len(header)} bytes) overlaps the first export at {header_size}")
+    header += bytes(header_size - len(header))
+
+    body = bytearray(max(entry["SerialOffset"] + entry["SerialSize"] for entry in dump["Exports"]) - header_size)
+    structs = []
+    default = next((entry for entry in dump["Exports"] if entry["ObjectName"].startswith("Default__")), None)
+    if default is not None:
+        class_export = entry_of(dump, default["ClassIndex"])
+        class_class = entry_of(dump, class_export["ClassIndex"])["ObjectName"]
+        parent = entry_of(dump, class_export["SuperIndex"])["ObjectName"]
+        data = default.get("Data") or []
+        structs = [(class_class, None, []), (parent, None, [item["Name"] for item in data])]
+        for entry, payload in (
+            (class_export, class_export_data(class_export["SuperIndex"])),
+            (default, unversioned_header([bool(item.get("IsZero")) for item in data])),
+        ):
+            if len(payload) > entry["SerialSize"]:
+                raise ValueError(f"{entry['ObjectName']} data does not fit its SerialSize")
+            start = entry["SerialOffset"] - header_size
+            body[start:start + len(payload)] = payload
+
+    uasset_path.parent.mkdir(parents=True, exist_ok=True)
+    uasset_path.write_bytes(bytes(header))
+    uasset_path.with_suffix(".uexp").write_bytes(bytes(body) + struct.pack("<I", ur.PACKAGE_FILE_TAG))
+    usmap_path.write_bytes(usmap_bytes(structs))